@@ -0,0 +1,98 @@
+"""Benchmark project config load time: YAML vs the JSON sidecar.
+
+Builds a synthetic project config with many members and types (custom
+field schemas included), saves it with project_config.save_config and
+times a cold parse of the project's YAML against loading its sidecar.
+
+Usage (from skills/openproject):
+    python benchmarks/bench_config_load.py [--rounds 20] [--members 1000]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "openproject-core"))
+
+from openproject_core import codec, project_config  # noqa: E402
+
+
+def make_config(members: int, types: int) -> dict:
+    """Config shaped like init_config() output."""
+    return {
+        "generated_at": "2026-01-01T00:00:00",
+        "updated_at": "2026-01-01T00:00:00",
+        "instance": {"url": "https://openproject.example.com", "user_id": 5, "user_name": "Admin"},
+        "project": {"id": 13, "identifier": "demo", "name": "Demo", "description": "", "active": True},
+        "members": [
+            {
+                "membership_id": 1000 + i,
+                "user_id": i,
+                "principal_href": f"/api/v3/users/{i}",
+                "principal_name": f"Nguyễn Văn Thành {i}",
+                "roles": [{"href": "/api/v3/roles/3", "title": "Member"}],
+            }
+            for i in range(1, members + 1)
+        ],
+        "types": [
+            {"id": t, "name": f"Type {t}", "color": "#1A67A3", "is_milestone": False}
+            for t in range(1, types + 1)
+        ],
+        "statuses": [{"id": s, "name": f"Status {s}", "is_closed": s > 10, "position": s} for s in range(1, 15)],
+        "priorities": [{"id": p, "name": f"Priority {p}", "position": p} for p in range(1, 5)],
+        "versions": [{"id": v, "name": f"Sprint {v}", "status": "open"} for v in range(1, 30)],
+        "categories": [{"id": c, "name": f"Category {c}"} for c in range(1, 10)],
+        "custom_fields": {
+            str(t): {
+                f"customField{c}": {"name": f"Field {c}", "type": "String", "required": False, "writable": True}
+                for c in range(1, 25)
+            }
+            for t in range(1, types + 1)
+        },
+    }
+
+
+def best_of(func, rounds: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--members", type=int, default=1000)
+    parser.add_argument("--types", type=int, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        project_config._skill_dir = lambda: Path(tmp)
+        project_config.save_config(make_config(args.members, args.types))
+        path = project_config.get_config_path()
+        yaml_size = path.stat().st_size
+        sidecar_size = project_config.get_config_cache_path(path).stat().st_size
+        print(
+            f"{args.members} members, {args.types} types: YAML {yaml_size / 1024:.0f} KiB, "
+            f"sidecar {sidecar_size / 1024:.0f} KiB, best/median of {args.rounds}"
+        )
+        print(f"{'loader':<28}{'ms':>10}{'median':>10}")
+
+        loaders = [("yaml.safe_load", lambda: yaml.safe_load(path.read_bytes()))]
+        if hasattr(yaml, "CSafeLoader"):
+            loaders.append(("yaml CSafeLoader", lambda: yaml.load(path.read_bytes(), Loader=yaml.CSafeLoader)))
+        loaders.append((f"sidecar ({codec.CODEC})", lambda: project_config.read_config_file(path)))
+        for name, load in loaders:
+            best, median = best_of(load, args.rounds)
+            print(f"{name:<28}{best * 1000:>10.2f}{median * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark JSON decode/encode time per 1,000 work packages for each codec.
+
+Builds a synthetic /work_packages collection page shaped like OpenProject's
+HAL output (links, embedded formattable text, custom fields) and times every
+installed backend of openproject_core.codec.
+
+Usage (from skills/openproject):
+    python benchmarks/bench_json_codec.py [--rounds 20] [--count 1000]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "openproject-core"))
+
+from openproject_core import codec  # noqa: E402
+
+
+def work_package(i: int) -> dict:
+    """One work package in API v3 HAL shape."""
+    def link(resource, rid, title):
+        return {"href": f"/api/v3/{resource}/{rid}", "title": title}
+
+    return {
+        "_type": "WorkPackage",
+        "id": i,
+        "lockVersion": i % 7,
+        "subject": f"Cập nhật tài liệu hướng dẫn #{i}",
+        "description": {
+            "format": "markdown",
+            "raw": "Mô tả chi tiết công việc. " * 8,
+            "html": "<p>Mô tả chi tiết công việc.</p>" * 8,
+        },
+        "scheduleManually": False,
+        "startDate": "2026-01-05",
+        "dueDate": "2026-02-13",
+        "estimatedTime": "PT12H",
+        "spentTime": "PT3H30M",
+        "percentageDone": (i * 10) % 100,
+        "createdAt": "2026-01-02T08:15:00.000Z",
+        "updatedAt": "2026-03-04T10:20:30.000Z",
+        "customField3": i % 5,
+        "customField8": {"format": "markdown", "raw": "note", "html": "<p>note</p>"},
+        "_links": {
+            "self": link("work_packages", i, f"Task {i}"),
+            "project": link("projects", 3, "Demo project"),
+            "type": link("types", 1 + i % 4, "Task"),
+            "status": link("statuses", 1 + i % 6, "In progress"),
+            "priority": link("priorities", 8, "Normal"),
+            "author": link("users", 5, "Nguyễn Văn A"),
+            "assignee": link("users", 6 + i % 9, "Trần Thị B"),
+            "responsible": {"href": None},
+            "version": link("versions", 2, "Sprint 4"),
+            "parent": link("work_packages", max(1, i // 10), "Epic"),
+            "customField5": [link("custom_options", 12, "Backend")],
+            "attachments": {"href": f"/api/v3/work_packages/{i}/attachments"},
+            "activities": {"href": f"/api/v3/work_packages/{i}/activities"},
+            "relations": {"href": f"/api/v3/work_packages/{i}/relations"},
+            "watchers": {"href": f"/api/v3/work_packages/{i}/watchers"},
+        },
+    }
+
+
+def collection(count: int) -> dict:
+    return {
+        "_type": "WorkPackageCollection",
+        "total": count,
+        "count": count,
+        "pageSize": count,
+        "offset": 1,
+        "_embedded": {"elements": [work_package(i) for i in range(1, count + 1)]},
+        "_links": {"self": {"href": "/api/v3/work_packages"}},
+    }
+
+
+def best_of(func, rounds: int) -> tuple[float, float]:
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--count", type=int, default=1000, help="Work packages per page")
+    args = parser.parse_args()
+
+    page = collection(args.count)
+    body = codec.dumps_bytes(page)
+    scale = 1000 / args.count
+    print(f"{args.count} work packages, {len(body) / 1024:.0f} KiB body, best/median of {args.rounds}")
+    print(f"{'codec':<10}{'decode ms/1k WP':>18}{'median':>10}{'encode ms/1k WP':>18}{'median':>10}")
+
+    original = codec.CODEC
+    try:
+        for name in codec.available_codecs():
+            codec.set_codec(name)
+            dec_best, dec_med = best_of(lambda: codec.loads(body), args.rounds)
+            enc_best, enc_med = best_of(lambda: codec.dumps_bytes(page), args.rounds)
+            print(
+                f"{name:<10}{dec_best * 1000 * scale:>18.2f}{dec_med * 1000 * scale:>10.2f}"
+                f"{enc_best * 1000 * scale:>18.2f}{enc_med * 1000 * scale:>10.2f}"
+            )
+    finally:
+        codec.set_codec(original)
+
+
+if __name__ == "__main__":
+    main()
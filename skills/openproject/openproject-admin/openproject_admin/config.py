@@ -1,11 +1,11 @@
 """OpenProject Configuration API operations."""
 
-from openproject_core import OpenProjectClient
+from openproject_core import OpenProjectClient, get_shared_client
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
 
 
 def get_configuration() -> dict:
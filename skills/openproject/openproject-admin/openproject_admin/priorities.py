@@ -2,18 +2,18 @@
 
 from typing import Iterator
 
-from openproject_core import OpenProjectClient, paginate
+from openproject_core import OpenProjectClient, cached_collection, get_shared_client
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
 
 
 def list_priorities(page_size: int = 100) -> Iterator[dict]:
     """List all priorities."""
     with get_client() as client:
-        yield from paginate(client, "/priorities", page_size=page_size)
+        yield from cached_collection(client, "priorities", "/priorities", page_size=page_size)
 
 
 def get_priority(priority_id: int) -> dict:
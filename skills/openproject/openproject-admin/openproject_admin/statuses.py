@@ -2,18 +2,18 @@
 
 from typing import Iterator
 
-from openproject_core import OpenProjectClient, paginate
+from openproject_core import OpenProjectClient, cached_collection, get_shared_client
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
 
 
 def list_statuses(page_size: int = 100) -> Iterator[dict]:
     """List all statuses (New, In Progress, Closed, etc.)."""
     with get_client() as client:
-        yield from paginate(client, "/statuses", page_size=page_size)
+        yield from cached_collection(client, "statuses", "/statuses", page_size=page_size)
 
 
 def get_status(status_id: int) -> dict:
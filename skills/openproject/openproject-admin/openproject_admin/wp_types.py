@@ -2,18 +2,18 @@
 
 from typing import Iterator
 
-from openproject_core import OpenProjectClient, paginate
+from openproject_core import OpenProjectClient, cached_collection, get_shared_client, paginate
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
 
 
 def list_types(page_size: int = 100) -> Iterator[dict]:
     """List work package types (Task, Bug, Feature, etc.)."""
     with get_client() as client:
-        yield from paginate(client, "/types", page_size=page_size)
+        yield from cached_collection(client, "types", "/types", page_size=page_size)
 
 
 def get_type(type_id: int) -> dict:
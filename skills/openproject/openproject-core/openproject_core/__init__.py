@@ -1,8 +1,58 @@
 """OpenProject Core - API utilities for OpenProject integration."""
 
 from .client import OpenProjectClient, ConnectionStatus, check_connection
+from .async_client import AsyncOpenProjectClient, gather_limited, aget_many
+from .pool import (
+    get_shared_client,
+    get_shared_async_client,
+    configure_pool,
+    close_shared_clients,
+    aclose_shared_clients,
+    run_async,
+)
+from .retry import RetryPolicy, RetryStats, NO_RETRY
+from .rate_limit import (
+    TokenBucket,
+    RateLimiter,
+    configure_rate_limit,
+    disable_rate_limit,
+    get_rate_limiter,
+)
+from .http_cache import ResponseCache, CachedResponse
+from .reference_cache import (
+    ReferenceCache,
+    OfflineCacheMiss,
+    configure_reference_cache,
+    disable_reference_cache,
+    get_reference_cache,
+    cached_reference,
+    acached_reference,
+    cached_collection,
+)
+from .instrumentation import (
+    Instrumentation,
+    RequestInfo,
+    enable_instrumentation,
+    disable_instrumentation,
+    get_instrumentation,
+    endpoint_template,
+)
 from .exceptions import OpenProjectError, AuthenticationError, OpenProjectAPIError
-from .helpers import build_filters, build_sort, parse_hal_response, paginate, extract_id_from_href
+from .helpers import (
+    build_filters,
+    build_sort,
+    build_select,
+    parse_hal_response,
+    paginate,
+    apaginate,
+    fetch_many,
+    FetchManyResult,
+    extract_id_from_href,
+)
+from .streaming import iter_collection
+from .name_index import NameIndex, NameMatch, normalize as normalize_name
+from .codec import available_codecs, set_codec
+from .records import WorkPackageRecord, TimeEntryRecord, UserRecord, to_records, link_id
 from .hal_types import HALLink, HALResponse, CollectionResponse, ErrorResponse
 from .project_config import (
     init_config,
@@ -12,6 +62,10 @@ from .project_config import (
     require_config,
     is_config_initialized,
     get_config_path,
+    get_store_path,
+    get_active_project,
+    set_active_project,
+    list_stored_projects,
     get_project_id,
     get_type_id,
     get_status_id,
@@ -19,24 +73,74 @@ from .project_config import (
     get_version_id,
     get_member_id,
     get_member_name,
+    search_names,
+    resolve_names,
     get_custom_field_id,
     get_custom_field_name,
     print_config_summary,
+    get_config_index,
+    clear_config_cache,
     ProjectConfig,
+    ProjectConfigIndex,
 )
 
 __all__ = [
     "OpenProjectClient",
     "ConnectionStatus",
     "check_connection",
+    "AsyncOpenProjectClient",
+    "gather_limited",
+    "aget_many",
+    "get_shared_client",
+    "get_shared_async_client",
+    "configure_pool",
+    "close_shared_clients",
+    "aclose_shared_clients",
+    "run_async",
+    "RetryPolicy",
+    "RetryStats",
+    "NO_RETRY",
+    "TokenBucket",
+    "RateLimiter",
+    "configure_rate_limit",
+    "disable_rate_limit",
+    "get_rate_limiter",
+    "ResponseCache",
+    "CachedResponse",
+    "ReferenceCache",
+    "OfflineCacheMiss",
+    "configure_reference_cache",
+    "disable_reference_cache",
+    "get_reference_cache",
+    "cached_reference",
+    "acached_reference",
+    "cached_collection",
+    "Instrumentation",
+    "RequestInfo",
+    "enable_instrumentation",
+    "disable_instrumentation",
+    "get_instrumentation",
+    "endpoint_template",
     "OpenProjectError",
     "AuthenticationError",
     "OpenProjectAPIError",
     "build_filters",
     "build_sort",
+    "build_select",
     "parse_hal_response",
     "paginate",
+    "apaginate",
+    "fetch_many",
+    "FetchManyResult",
     "extract_id_from_href",
+    "iter_collection",
+    "available_codecs",
+    "set_codec",
+    "WorkPackageRecord",
+    "TimeEntryRecord",
+    "UserRecord",
+    "to_records",
+    "link_id",
     "HALLink",
     "HALResponse",
     "CollectionResponse",
@@ -48,6 +152,10 @@ __all__ = [
     "require_config",
     "is_config_initialized",
     "get_config_path",
+    "get_store_path",
+    "get_active_project",
+    "set_active_project",
+    "list_stored_projects",
     "get_project_id",
     "get_type_id",
     "get_status_id",
@@ -55,8 +163,16 @@ __all__ = [
     "get_version_id",
     "get_member_id",
     "get_member_name",
+    "search_names",
+    "resolve_names",
     "get_custom_field_id",
     "get_custom_field_name",
     "print_config_summary",
+    "get_config_index",
+    "clear_config_cache",
     "ProjectConfig",
+    "ProjectConfigIndex",
+    "NameIndex",
+    "NameMatch",
+    "normalize_name",
 ]
@@ -0,0 +1,238 @@
+"""Asyncio OpenProject API v3 client (httpx.AsyncClient)."""
+
+import asyncio
+from typing import Any, Awaitable, Iterable, Optional, TypeVar
+
+import httpx
+
+from .client import _ClientBase
+from .http_cache import ResponseCache
+from .instrumentation import get_instrumentation
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
+
+T = TypeVar("T")
+
+DEFAULT_CONCURRENCY = 10
+
+
+class AsyncOpenProjectClient(_ClientBase):
+    """Async HTTP client for OpenProject API v3.
+
+    Same semantics as OpenProjectClient (auth, errors, JSON parsing) but every
+    request method is a coroutine, so many requests can be in flight at once.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: float = 30.0,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None
+    ):
+        """Initialize async OpenProject client.
+
+        Args:
+            base_url: OpenProject instance URL (or OPENPROJECT_URL env var)
+            api_key: API key for authentication (or OPENPROJECT_API_KEY env var)
+            timeout: Request timeout in seconds (default 30.0)
+            limits: Connection pool limits (httpx defaults if omitted)
+            http2: Negotiate HTTP/2 when the server offers it (needs `h2`)
+            retry_policy: Retry/backoff rules (default RetryPolicy(); NO_RETRY disables)
+            rate_limiter: Token-bucket limiter (default: process-wide limiter, if configured)
+            cache: Conditional GET cache (disabled if omitted)
+
+        Raises:
+            ValueError: If base_url is not provided
+            AuthenticationError: If api_key is not provided
+        """
+        super().__init__(base_url, api_key, retry_policy, rate_limiter, cache)
+        self.client = httpx.AsyncClient(**self._client_options(timeout, limits, http2))
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        idempotent: bool = False,
+        headers: Optional[dict] = None,
+        retry_timeouts: bool = True
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures per retry_policy.
+
+        retry_timeouts=False raises timeouts at once (callers that shrink
+        the request instead, like adaptive pagination).
+        """
+        policy = self.retry_policy
+        retryable = policy.allows(method, idempotent)
+        limiter = self.limiter
+        instrumentation = get_instrumentation()
+        started = instrumentation.before_request(method, path, params) if instrumentation else 0.0
+        attempt = 0
+        waited = 0.0
+
+        while True:
+            if limiter is not None:
+                await limiter.acquire_async(method, path)
+            try:
+                response = await self.client.request(
+                    method, path, params=params, content=self._encode(data), headers=headers
+                )
+            except httpx.TransportError as e:
+                retry = retryable and (retry_timeouts or not isinstance(e, httpx.TimeoutException))
+                delay = policy.next_delay(attempt, waited) if retry else None
+                if delay is None:
+                    self.retry_stats.record_request(attempt, waited, exhausted=retryable)
+                    if instrumentation is not None:
+                        instrumentation.after_request(method, path, started, error=e, retries=attempt)
+                    raise
+            else:
+                if limiter is not None:
+                    limiter.record_status(method, path, response.status_code)
+                transient = retryable and policy.should_retry_response(response)
+                delay = policy.next_delay(attempt, waited, response) if transient else None
+                if delay is None:
+                    self.retry_stats.record_request(attempt, waited, exhausted=transient)
+                    if instrumentation is not None:
+                        instrumentation.after_request(method, path, started, response, retries=attempt)
+                    return response
+
+            await asyncio.sleep(delay)
+            waited += delay
+            attempt += 1
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        idempotent: bool = False,
+        retry_timeouts: bool = True
+    ) -> dict:
+        """Send a request and parse the response."""
+        if method == "GET" and self.cache is not None:
+            key, entry = self._cache_lookup(path, params)
+            headers = entry.conditional_headers() if entry else None
+            response = await self._send(method, path, params=params, headers=headers, retry_timeouts=retry_timeouts)
+            return self._handle_cached_response(key, entry, response)
+
+        try:
+            response = await self._send(method, path, params, data, idempotent, retry_timeouts=retry_timeouts)
+            return self._handle_response(response)
+        finally:
+            if method != "GET" and self.cache is not None:
+                self.cache.invalidate(self.base_url, path)
+
+    async def get(self, path: str, params: Optional[dict] = None, retry_timeouts: bool = True) -> dict:
+        """GET request.
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            retry_timeouts: Retry timeouts per retry_policy (False: raise at once)
+
+        Returns:
+            Parsed JSON response
+        """
+        return await self._request("GET", path, params=params, retry_timeouts=retry_timeouts)
+
+    async def post(self, path: str, data: Optional[dict] = None, idempotent: bool = False) -> dict:
+        """POST request.
+
+        Args:
+            path: API endpoint path
+            data: Request body data
+            idempotent: Allow retries (only for POSTs safe to repeat)
+
+        Returns:
+            Parsed JSON response
+        """
+        return await self._request("POST", path, data=data, idempotent=idempotent)
+
+    async def patch(self, path: str, data: Optional[dict] = None, idempotent: bool = False) -> dict:
+        """PATCH request.
+
+        Args:
+            path: API endpoint path
+            data: Request body data
+            idempotent: Allow retries (e.g. PATCH guarded by lockVersion)
+
+        Returns:
+            Parsed JSON response
+        """
+        return await self._request("PATCH", path, data=data, idempotent=idempotent)
+
+    async def delete(self, path: str) -> dict:
+        """DELETE request.
+
+        Args:
+            path: API endpoint path
+
+        Returns:
+            Parsed JSON response (usually empty)
+        """
+        return await self._request("DELETE", path)
+
+    async def close(self):
+        """Close client connection."""
+        await self.client.aclose()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying HTTP connection pool has been closed."""
+        return self.client.is_closed
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Async context manager exit (shared clients stay open for reuse)."""
+        if not self.shared:
+            await self.close()
+
+
+async def gather_limited(
+    aws: Iterable[Awaitable[T]],
+    limit: int = DEFAULT_CONCURRENCY
+) -> list[T]:
+    """Run awaitables concurrently with at most `limit` in flight.
+
+    Args:
+        aws: Coroutines or other awaitables
+        limit: Maximum number running at the same time (default 10)
+
+    Returns:
+        Results in the same order as `aws`; the first exception propagates
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws))
+
+
+async def aget_many(
+    client: AsyncOpenProjectClient,
+    paths: Iterable[str],
+    limit: int = DEFAULT_CONCURRENCY
+) -> list[Any]:
+    """GET several paths concurrently.
+
+    Args:
+        client: AsyncOpenProjectClient instance
+        paths: API endpoint paths
+        limit: Maximum concurrent requests (default 10)
+
+    Returns:
+        Parsed JSON responses in the same order as `paths`
+    """
+    return await gather_limited((client.get(path) for path in paths), limit)
@@ -0,0 +1,61 @@
+"""Command line access to the reference data cache.
+
+    python -m openproject_core.cache_cli list
+    python -m openproject_core.cache_cli --offline show statuses
+    python -m openproject_core.cache_cli invalidate types
+"""
+
+import argparse
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from . import codec
+from .exceptions import OpenProjectError
+from .pool import get_shared_client
+from .reference_cache import (
+    REFERENCE_PATHS,
+    cached_collection,
+    cached_reference,
+    configure_reference_cache,
+)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Inspect or clear the reference cache from the command line."""
+    parser = argparse.ArgumentParser(description="OpenProject reference data cache")
+    parser.add_argument("--path", help="Cache file (default: skill directory)")
+    parser.add_argument("--offline", action="store_true", help="Read cached data only, never fetch")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="Show cached entries")
+    show = sub.add_parser("show", help="Print a reference resource as JSON")
+    show.add_argument("resource", choices=sorted(REFERENCE_PATHS))
+    clear = sub.add_parser("invalidate", help="Drop cached entries")
+    clear.add_argument("resource", nargs="?")
+    args = parser.parse_args(argv)
+
+    cache = configure_reference_cache(args.path, offline=args.offline)
+    if args.command == "list":
+        for entry in cache.entries():
+            state = "fresh" if entry["fresh"] else "stale"
+            print(f"{entry['instance']} {entry['endpoint']} [{entry['resource']}] "
+                  f"{entry['age']}s {state} {entry['bytes']} B")
+    elif args.command == "show":
+        load_dotenv()
+        resource = args.resource
+        try:
+            if resource == "activities":
+                value = cached_reference(get_shared_client(), resource, REFERENCE_PATHS[resource])
+            else:
+                value = list(cached_collection(get_shared_client(), resource, REFERENCE_PATHS[resource]))
+        except (ValueError, OpenProjectError) as e:
+            print(e)
+            return 1
+        print(codec.dumps(value))
+    else:
+        print(f"Removed {cache.invalidate(args.resource)} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,14 +1,36 @@
 """OpenProject API v3 client with Basic Auth (API Key)."""
 
+import hashlib
 import os
-from typing import Optional, TypedDict
+import threading
+import time
+from typing import Iterator, Optional, TypedDict
 
 import httpx
 
 try:
+    from . import codec
     from .exceptions import OpenProjectAPIError, AuthenticationError
+    from .http_cache import CachedResponse, ResponseCache
+    from .instrumentation import get_instrumentation
+    from .rate_limit import RateLimiter, get_rate_limiter
+    from .retry import RetryPolicy, RetryStats
+    from .streaming import iter_collection
 except ImportError:
+    import codec
     from exceptions import OpenProjectAPIError, AuthenticationError
+    from http_cache import CachedResponse, ResponseCache
+    from instrumentation import get_instrumentation
+    from rate_limit import RateLimiter, get_rate_limiter
+    from retry import RetryPolicy, RetryStats
+    from streaming import iter_collection
+
+# Fallback when /configuration does not expose the API page size limit
+# (OpenProject's default `apiv3_max_page_size` setting).
+DEFAULT_MAX_PAGE_SIZE = 1000
+
+# get_if_changed() validator for responses without an ETag header
+CONTENT_HASH_PREFIX = "sha256:"
 
 
 class ConnectionStatus(TypedDict):
@@ -22,26 +44,17 @@ class ConnectionStatus(TypedDict):
     error: Optional[str]
 
 
-class OpenProjectClient:
-    """HTTP client for OpenProject API v3."""
+class _ClientBase:
+    """Configuration and response handling shared by sync and async clients."""
 
     def __init__(
         self,
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
-        timeout: float = 30.0
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None
     ):
-        """Initialize OpenProject client.
-
-        Args:
-            base_url: OpenProject instance URL (or OPENPROJECT_URL env var)
-            api_key: API key for authentication (or OPENPROJECT_API_KEY env var)
-            timeout: Request timeout in seconds (default 30.0)
-
-        Raises:
-            ValueError: If base_url is not provided
-            AuthenticationError: If api_key is not provided
-        """
         self.base_url = (base_url or os.getenv("OPENPROJECT_URL", "")).rstrip("/")
         self.api_key = api_key or os.getenv("OPENPROJECT_API_KEY", "")
 
@@ -50,15 +63,74 @@ class OpenProjectClient:
         if not self.api_key:
             raise AuthenticationError("OPENPROJECT_API_KEY required")
 
-        self.client = httpx.Client(
-            base_url=f"{self.base_url}/api/v3",
-            auth=("apikey", self.api_key),
-            headers={
+        # Shared (pooled) clients are owned by the registry in pool.py and
+        # survive `with` blocks; only close_shared_clients() closes them.
+        self.shared = False
+        # Server page size limit, discovered lazily by get_max_page_size()
+        self.max_page_size: Optional[int] = None
+        self._local = threading.local()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        self.retry_stats = RetryStats()
+        # None defers to the process-wide limiter (configure_rate_limit())
+        self.rate_limiter = rate_limiter
+        # Opt-in conditional GET cache (ETag / Last-Modified revalidation)
+        self.cache = cache
+
+    @property
+    def limiter(self) -> Optional[RateLimiter]:
+        """Rate limiter applied to this client's requests, if any."""
+        return self.rate_limiter or get_rate_limiter()
+
+    @property
+    def last_response_size(self) -> int:
+        """Body size in bytes of the last response received on this thread."""
+        return getattr(self._local, "last_response_size", 0)
+
+    def _client_options(self, timeout: float, limits: Optional[httpx.Limits], http2: bool) -> dict:
+        """Keyword arguments for the underlying httpx client."""
+        return {
+            "base_url": f"{self.base_url}/api/v3",
+            "auth": ("apikey", self.api_key),
+            "headers": {
                 "Content-Type": "application/json",
                 "Accept": "application/hal+json"
             },
-            timeout=timeout
-        )
+            "timeout": timeout,
+            "limits": limits or httpx.Limits(),
+            "http2": http2,
+        }
+
+    @staticmethod
+    def _encode(data: Optional[dict]) -> Optional[bytes]:
+        """Encode a request body with the active JSON codec."""
+        return codec.dumps_bytes(data) if data is not None else None
+
+    def _cache_lookup(self, path: str, params: Optional[dict]) -> tuple[str, Optional[CachedResponse]]:
+        """Cache key and stored entry (if any) for a GET."""
+        key = ResponseCache.make_key(self.base_url, self.api_key, path, params)
+        entry = self.cache.get(key)
+        if entry is None:
+            self.cache.stats.incr("misses")
+        return key, entry
+
+    def _handle_cached_response(
+        self,
+        key: str,
+        entry: Optional[CachedResponse],
+        response: httpx.Response
+    ) -> dict:
+        """Serve a 304 from the cache, or store a fresh 200 with validators."""
+        if response.status_code == 304 and entry is not None:
+            self.cache.stats.incr("hits")
+            self._local.last_response_size = 0
+            return codec.loads(entry.body) if entry.body else {}
+        result = self._handle_response(response)
+        fresh = CachedResponse.from_response(response)
+        if fresh is not None:
+            if entry is not None:
+                self.cache.stats.incr("refreshed")
+            self.cache.put(key, fresh)
+        return result
 
     def _handle_response(self, response: httpx.Response) -> dict:
         """Handle API response, raise on errors.
@@ -73,11 +145,12 @@ class OpenProjectClient:
             AuthenticationError: If 401 response
             OpenProjectAPIError: If 4xx/5xx response
         """
+        self._local.last_response_size = len(response.content)
         if response.status_code == 401:
             raise AuthenticationError("Invalid API key")
         if response.status_code >= 400:
             try:
-                error_data = response.json() if response.content else {}
+                error_data = codec.loads(response.content) if response.content else {}
             except ValueError:
                 error_data = {}
             raise OpenProjectAPIError(
@@ -86,48 +159,232 @@ class OpenProjectClient:
                 error_id=error_data.get("errorIdentifier")
             )
         try:
-            return response.json() if response.content else {}
+            return codec.loads(response.content) if response.content else {}
         except ValueError:
             return {}
 
-    def get(self, path: str, params: Optional[dict] = None) -> dict:
+
+class OpenProjectClient(_ClientBase):
+    """HTTP client for OpenProject API v3."""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: float = 30.0,
+        limits: Optional[httpx.Limits] = None,
+        http2: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None
+    ):
+        """Initialize OpenProject client.
+
+        Args:
+            base_url: OpenProject instance URL (or OPENPROJECT_URL env var)
+            api_key: API key for authentication (or OPENPROJECT_API_KEY env var)
+            timeout: Request timeout in seconds (default 30.0)
+            limits: Connection pool limits (httpx defaults if omitted)
+            http2: Negotiate HTTP/2 when the server offers it (needs `h2`)
+            retry_policy: Retry/backoff rules (default RetryPolicy(); NO_RETRY disables)
+            rate_limiter: Token-bucket limiter (default: process-wide limiter, if configured)
+            cache: Conditional GET cache (disabled if omitted)
+
+        Raises:
+            ValueError: If base_url is not provided
+            AuthenticationError: If api_key is not provided
+        """
+        super().__init__(base_url, api_key, retry_policy, rate_limiter, cache)
+        self.client = httpx.Client(**self._client_options(timeout, limits, http2))
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        idempotent: bool = False,
+        headers: Optional[dict] = None,
+        stream: bool = False,
+        retry_timeouts: bool = True
+    ) -> httpx.Response:
+        """Send a request, retrying transient failures per retry_policy.
+
+        With stream=True the body is left unread; the caller must close it.
+        retry_timeouts=False raises timeouts at once (callers that shrink
+        the request instead, like adaptive pagination).
+
+        Raises:
+            httpx.TransportError: If the connection keeps failing
+        """
+        policy = self.retry_policy
+        retryable = policy.allows(method, idempotent)
+        limiter = self.limiter
+        instrumentation = get_instrumentation()
+        started = instrumentation.before_request(method, path, params) if instrumentation else 0.0
+        attempt = 0
+        waited = 0.0
+
+        while True:
+            if limiter is not None:
+                limiter.acquire(method, path)
+            try:
+                request = self.client.build_request(
+                    method, path, params=params, content=self._encode(data), headers=headers
+                )
+                response = self.client.send(request, stream=stream)
+            except httpx.TransportError as e:
+                retry = retryable and (retry_timeouts or not isinstance(e, httpx.TimeoutException))
+                delay = policy.next_delay(attempt, waited) if retry else None
+                if delay is None:
+                    self.retry_stats.record_request(attempt, waited, exhausted=retryable)
+                    if instrumentation is not None:
+                        instrumentation.after_request(method, path, started, error=e, retries=attempt)
+                    raise
+            else:
+                if limiter is not None:
+                    limiter.record_status(method, path, response.status_code)
+                transient = retryable and policy.should_retry_response(response)
+                delay = policy.next_delay(attempt, waited, response) if transient else None
+                if delay is None:
+                    self.retry_stats.record_request(attempt, waited, exhausted=transient)
+                    if instrumentation is not None:
+                        instrumentation.after_request(method, path, started, response, retries=attempt)
+                    return response
+                response.close()
+
+            time.sleep(delay)
+            waited += delay
+            attempt += 1
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        idempotent: bool = False,
+        retry_timeouts: bool = True
+    ) -> dict:
+        """Send a request and parse the response."""
+        if method == "GET" and self.cache is not None:
+            key, entry = self._cache_lookup(path, params)
+            headers = entry.conditional_headers() if entry else None
+            response = self._send(method, path, params=params, headers=headers, retry_timeouts=retry_timeouts)
+            return self._handle_cached_response(key, entry, response)
+
+        try:
+            response = self._send(method, path, params, data, idempotent, retry_timeouts=retry_timeouts)
+            return self._handle_response(response)
+        finally:
+            if method != "GET" and self.cache is not None:
+                self.cache.invalidate(self.base_url, path)
+
+    def get(self, path: str, params: Optional[dict] = None, retry_timeouts: bool = True) -> dict:
         """GET request.
 
         Args:
             path: API endpoint path
             params: Query parameters
+            retry_timeouts: Retry timeouts per retry_policy (False: raise at once)
 
         Returns:
             Parsed JSON response
         """
-        response = self.client.get(path, params=params)
-        return self._handle_response(response)
+        return self._request("GET", path, params=params, retry_timeouts=retry_timeouts)
+
+    def get_if_changed(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        etag: Optional[str] = None
+    ) -> tuple[Optional[dict], Optional[str]]:
+        """Conditional GET: skip the body if the resource still matches etag.
+
+        Sends If-None-Match; a 304 means unchanged. Servers that send no ETag
+        get a content hash as validator, so unchanged bodies are still
+        detected (after downloading them).
+
+        Args:
+            path: API endpoint path
+            params: Query parameters
+            etag: Validator returned by an earlier call
+
+        Returns:
+            (None, etag) if unchanged, else (parsed body, new validator)
+        """
+        headers = {"If-None-Match": etag} if etag and not etag.startswith(CONTENT_HASH_PREFIX) else None
+        response = self._send("GET", path, params=params, headers=headers)
+        if response.status_code == 304:
+            self._local.last_response_size = 0
+            return None, etag
+        body = self._handle_response(response)
+        validator = response.headers.get("ETag") or (
+            CONTENT_HASH_PREFIX + hashlib.sha256(response.content).hexdigest()[:32]
+        )
+        if validator == etag:
+            return None, etag
+        return body, validator
+
+    def stream_elements(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        meta: Optional[dict] = None
+    ) -> Iterator[dict]:
+        """GET a collection and yield its elements while the body downloads.
 
-    def post(self, path: str, data: Optional[dict] = None) -> dict:
+        Lower peak memory and time-to-first-item than get() for large pages.
+        Bypasses the response cache.
+
+        Args:
+            path: Collection endpoint path
+            params: Query parameters
+            meta: Optional dict filled with the non-element fields
+                (total, count, pageSize, offset, _links)
+
+        Yields:
+            Collection elements in order
+
+        Raises:
+            AuthenticationError: If 401 response
+            OpenProjectAPIError: If 4xx/5xx response
+        """
+        response = self._send("GET", path, params=params, stream=True)
+        try:
+            if response.status_code >= 400:
+                response.read()
+                self._handle_response(response)
+            yield from iter_collection(response.iter_bytes(), meta)
+            self._local.last_response_size = response.num_bytes_downloaded
+        finally:
+            response.close()
+
+    def post(self, path: str, data: Optional[dict] = None, idempotent: bool = False) -> dict:
         """POST request.
 
         Args:
             path: API endpoint path
             data: Request body data
+            idempotent: Allow retries (only for POSTs safe to repeat)
 
         Returns:
             Parsed JSON response
         """
-        response = self.client.post(path, json=data)
-        return self._handle_response(response)
+        return self._request("POST", path, data=data, idempotent=idempotent)
 
-    def patch(self, path: str, data: Optional[dict] = None) -> dict:
+    def patch(self, path: str, data: Optional[dict] = None, idempotent: bool = False) -> dict:
         """PATCH request.
 
         Args:
             path: API endpoint path
             data: Request body data
+            idempotent: Allow retries (e.g. PATCH guarded by lockVersion)
 
         Returns:
             Parsed JSON response
         """
-        response = self.client.patch(path, json=data)
-        return self._handle_response(response)
+        return self._request("PATCH", path, data=data, idempotent=idempotent)
 
     def delete(self, path: str) -> dict:
         """DELETE request.
@@ -138,13 +395,32 @@ class OpenProjectClient:
         Returns:
             Parsed JSON response (usually empty)
         """
-        response = self.client.delete(path)
-        return self._handle_response(response)
+        return self._request("DELETE", path)
+
+    def get_max_page_size(self) -> int:
+        """Get the server's maximum API page size (cached per client).
+
+        Read from `/configuration` (`maximumAPIV3PageSize`); falls back to
+        DEFAULT_MAX_PAGE_SIZE when the instance does not expose it.
+        """
+        if self.max_page_size is None:
+            try:
+                config = self.get("/configuration")
+            except OpenProjectAPIError:
+                config = {}
+            value = config.get("maximumAPIV3PageSize")
+            self.max_page_size = value if isinstance(value, int) and value > 0 else DEFAULT_MAX_PAGE_SIZE
+        return self.max_page_size
 
     def close(self):
         """Close client connection."""
         self.client.close()
 
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying HTTP connection pool has been closed."""
+        return self.client.is_closed
+
     def check_connection(self) -> ConnectionStatus:
         """Check connection to OpenProject API.
 
@@ -178,8 +454,9 @@ class OpenProjectClient:
         return self
 
     def __exit__(self, *args):
-        """Context manager exit."""
-        self.close()
+        """Context manager exit (shared clients stay open for reuse)."""
+        if not self.shared:
+            self.close()
 
 
 def check_connection(
@@ -0,0 +1,116 @@
+"""JSON codec selection: orjson > msgspec > stdlib json.
+
+Request bodies, response bodies and filter/sort query params go through this
+module. The fastest installed backend is picked at import time; set
+OPENPROJECT_JSON_CODEC=json (or orjson/msgspec) to force one, or call
+set_codec() at runtime.
+"""
+
+import json
+import os
+import warnings
+from typing import Any, Callable, Union
+
+CODECS = ("orjson", "msgspec", "json")
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # Compact and UTF-8 like the fast codecs, so output is identical
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def _load(name: str) -> tuple[Callable[[Any], bytes], Callable[[Union[bytes, str]], Any]]:
+    """Encoder/decoder pair for a backend (ImportError if not installed)."""
+    if name == "orjson":
+        import orjson
+        return orjson.dumps, orjson.loads
+    if name == "msgspec":
+        import msgspec
+
+        encoder = msgspec.json.Encoder()
+        decoder = msgspec.json.Decoder()
+
+        def loads(data: Union[bytes, str]) -> Any:
+            try:
+                return decoder.decode(data)
+            except msgspec.DecodeError as e:
+                # Same contract as json/orjson: invalid input raises ValueError
+                raise ValueError(str(e)) from e
+
+        return encoder.encode, loads
+    if name == "json":
+        return _stdlib_dumps, json.loads
+    raise ValueError(f"Unknown JSON codec: {name} (expected one of {', '.join(CODECS)})")
+
+
+def available_codecs() -> list[str]:
+    """Installed backends, fastest first."""
+    names = []
+    for name in CODECS:
+        try:
+            _load(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def set_codec(name: str) -> str:
+    """Switch the active backend.
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the backend is not installed
+    """
+    global CODEC, _dumps, _loads
+    _dumps, _loads = _load(name)
+    CODEC = name
+    return name
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode to compact UTF-8 JSON bytes (request bodies)."""
+    return _dumps(obj)
+
+
+def dumps(obj: Any) -> str:
+    """Encode to a compact JSON string (query params such as filters)."""
+    return _dumps(obj).decode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode JSON bytes or text.
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    return _loads(data)
+
+
+def _select_default() -> None:
+    """Pick the forced backend, else the fastest installed one.
+
+    Runs at import time, so a bad OPENPROJECT_JSON_CODEC only warns.
+    """
+    forced = os.getenv("OPENPROJECT_JSON_CODEC")
+    if forced:
+        try:
+            set_codec(forced)
+            return
+        except (ImportError, ValueError) as e:
+            warnings.warn(
+                f"Ignoring OPENPROJECT_JSON_CODEC={forced!r} ({e}); using the fastest installed codec",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+    for name in CODECS:
+        try:
+            set_codec(name)
+            return
+        except ImportError:
+            continue
+
+
+CODEC = "json"
+_dumps, _loads = _load("json")
+_select_default()
@@ -2,13 +2,42 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any, Generator, Optional, TYPE_CHECKING
+import math
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    AsyncGenerator,
+    Generator,
+    Iterable,
+    Optional,
+    TYPE_CHECKING,
+    TypedDict,
+    Union,
+)
+
+import httpx
+
+from . import codec
 
 if TYPE_CHECKING:
+    from .async_client import AsyncOpenProjectClient
     from .client import OpenProjectClient
 
 
+# Adaptive pagination tuning: keep each page well inside the 30s client
+# timeout while using as few round trips as possible.
+ADAPTIVE_MIN_PAGE_SIZE = 10
+ADAPTIVE_TARGET_SECONDS = 3.0
+ADAPTIVE_MAX_PAGE_BYTES = 8 * 1024 * 1024
+
+# IDs per `id =` filter in fetch_many(); keeps request URLs well under 8 KB
+FETCH_MANY_CHUNK_SIZE = 100
+
+# Always part of build_select(): paging metadata and element IDs
+_COLLECTION_SELECT = ("total", "count", "pageSize", "offset", "elements/id")
+
+
 def build_filters(filters: list[dict]) -> str:
     """Build filter JSON string for API queries.
 
@@ -19,7 +48,7 @@ def build_filters(filters: list[dict]) -> str:
     Returns:
         JSON string for 'filters' query param
     """
-    return json.dumps(filters)
+    return codec.dumps(filters)
 
 
 def build_sort(sort_by: list[tuple[str, str]]) -> str:
@@ -32,7 +61,29 @@ def build_sort(sort_by: list[tuple[str, str]]) -> str:
     Returns:
         JSON string for 'sortBy' query param
     """
-    return json.dumps([[field, direction] for field, direction in sort_by])
+    return codec.dumps([[field, direction] for field, direction in sort_by])
+
+
+def build_select(fields: list[str]) -> str:
+    """Build the `select` param that trims collection responses to given fields.
+
+    Element ID and the collection's total/count/pageSize/offset are always
+    selected (paginate reads them, e.g. pageSize to detect a clamped page).
+    Entries already containing "/" are passed through.
+
+    Args:
+        fields: Element properties or links, e.g. ["subject", "status"]
+
+    Returns:
+        Comma-separated select string, e.g.
+        "total,count,pageSize,offset,elements/id,elements/subject"
+    """
+    selected = list(_COLLECTION_SELECT)
+    for field in fields:
+        entry = field if "/" in field or field in _COLLECTION_SELECT else f"elements/{field}"
+        if entry not in selected:
+            selected.append(entry)
+    return ",".join(selected)
 
 
 def parse_hal_response(response: dict) -> dict:
@@ -56,26 +107,238 @@ def paginate(
     client: "OpenProjectClient",
     path: str,
     params: Optional[dict] = None,
-    page_size: int = 100
+    page_size: int = 100,
+    workers: int = 1,
+    adaptive: bool = False,
+    stream: bool = False,
+    fields: Optional[list[str]] = None
 ) -> Generator[dict, None, None]:
     """Auto-paginate through collection results.
 
+    With workers > 1 the first page is fetched alone to read `total`, then the
+    remaining offsets are fetched concurrently at the page size the server
+    actually served (it may clamp pageSize). At most `workers` pages are
+    held in memory and items are still yielded in collection order.
+
+    With adaptive=True, page_size is only the starting size: pages grow
+    toward the server maximum (client.get_max_page_size()) while responses
+    are fast and small, and shrink on slow/huge pages or timeouts. Combined
+    with workers > 1, the server maximum is used as a fixed page size.
+
+    With stream=True sequential pages are parsed incrementally
+    (client.stream_elements()): each item is yielded as soon as it is decoded
+    instead of after the whole page body has been loaded.
+
     Args:
         client: OpenProjectClient instance
         path: API endpoint path
         params: Additional query parameters
         page_size: Items per page (default 100)
+        workers: Concurrent page requests (default 1 = sequential)
+        adaptive: Tune page size from server limit and response time
+        stream: Parse sequential pages incrementally (large page sizes)
+        fields: Only download these element fields (`select` param, see build_select)
 
     Yields:
         Individual items from the collection
     """
+    if fields:
+        params = dict(params or {}, select=build_select(fields))
+
+    if adaptive and workers > 1:
+        page_size = client.get_max_page_size()
+    elif adaptive:
+        yield from _paginate_adaptive(client, path, params, page_size)
+        return
+
     params = dict(params) if params else {}
     params["pageSize"] = page_size
     offset = 1
 
-    while True:
+    if workers > 1:
         params["offset"] = offset
         response = client.get(path, params=params)
+        elements = response.get("_embedded", {}).get("elements", [])
+        yield from elements
+
+        total = response.get("total")
+        served_size = response.get("pageSize")
+        if not (isinstance(served_size, int) and 0 < served_size < page_size):
+            more = isinstance(total, int) and total > len(elements)
+            served_size = len(elements) if more and 0 < len(elements) < page_size else None
+        if served_size:
+            # Server clamped the page: compute the other offsets at its size
+            page_size = params["pageSize"] = served_size
+            if adaptive:
+                client.max_page_size = served_size
+        if len(elements) < page_size:
+            return
+
+        offset += 1
+        last_page = math.ceil(total / page_size) if isinstance(total, int) else 0
+        if last_page >= offset:
+            last_page_full = yield from _paginate_window(
+                client, path, params, page_size, workers, last_page
+            )
+            if not last_page_full:
+                return
+            # Collection grew during the scan: continue sequentially
+            offset = last_page + 1
+
+    while True:
+        params["offset"] = offset
+        if stream:
+            count = 0
+            for item in client.stream_elements(path, params=params):
+                count += 1
+                yield item
+        else:
+            response = client.get(path, params=params)
+            embedded = response.get("_embedded", {})
+            elements = embedded.get("elements", [])
+            count = len(elements)
+
+            for item in elements:
+                yield item
+
+        if count < page_size:
+            break
+        offset += 1
+
+
+def _paginate_window(
+    client: "OpenProjectClient",
+    path: str,
+    params: dict,
+    page_size: int,
+    workers: int,
+    last_page: int
+) -> Generator[dict, None, bool]:
+    """Fetch pages 2..last_page concurrently, yielding items in order.
+
+    Returns:
+        True if the last page was full (more items may follow)
+    """
+    def fetch(page: int) -> list:
+        page_params = dict(params, offset=page)
+        return client.get(path, params=page_params).get("_embedded", {}).get("elements", [])
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    pending: deque = deque()
+    next_page = 2
+    try:
+        while next_page <= last_page and len(pending) < workers:
+            pending.append(executor.submit(fetch, next_page))
+            next_page += 1
+
+        elements: list = []
+        while pending:
+            elements = pending.popleft().result()
+            if next_page <= last_page:
+                pending.append(executor.submit(fetch, next_page))
+                next_page += 1
+            yield from elements
+
+        return len(elements) == page_size
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _shrink_page_size(size: int) -> int:
+    """Largest divisor of size that is at most half of it.
+
+    Dividing the current size keeps already-consumed items on a page
+    boundary, so the next offset stays exact.
+    """
+    for candidate in range(size // 2, ADAPTIVE_MIN_PAGE_SIZE - 1, -1):
+        if size % candidate == 0:
+            return candidate
+    return size
+
+
+def _paginate_adaptive(
+    client: "OpenProjectClient",
+    path: str,
+    params: Optional[dict],
+    page_size: int
+) -> Generator[dict, None, None]:
+    """Sequential pagination with page size tuned per response.
+
+    OpenProject's `offset` is a page number, so a page size change is only
+    applied when the number of items consumed so far is a multiple of the
+    new size.
+    """
+    params = dict(params) if params else {}
+    max_size = client.get_max_page_size()
+    size = max(1, min(page_size, max_size))
+    consumed = 0
+
+    while True:
+        params["pageSize"] = size
+        params["offset"] = consumed // size + 1
+        started = time.monotonic()
+        try:
+            # A timed-out page is retried smaller here, not re-sent as is
+            response = client.get(path, params=params, retry_timeouts=False)
+        except httpx.TimeoutException:
+            smaller = _shrink_page_size(size)
+            if smaller == size:
+                raise
+            size = smaller
+            continue
+        elapsed = time.monotonic() - started
+
+        served_size = response.get("pageSize")
+        if isinstance(served_size, int) and 0 < served_size < size:
+            # Server clamped the page: remember its real limit on the client
+            client.max_page_size = max_size = served_size
+            if consumed:
+                # Page came from the wrong position: retry at an aligned size
+                while size > max_size:
+                    smaller = _shrink_page_size(size)
+                    size = smaller if smaller < size else math.gcd(consumed, max_size)
+                continue
+            size = served_size
+
+        elements = response.get("_embedded", {}).get("elements", [])
+        yield from elements
+        consumed += len(elements)
+        if len(elements) < size:
+            break
+
+        payload = client.last_response_size
+        if elapsed > ADAPTIVE_TARGET_SECONDS or payload > ADAPTIVE_MAX_PAGE_BYTES:
+            size = _shrink_page_size(size)
+        elif elapsed < ADAPTIVE_TARGET_SECONDS / 2 and payload < ADAPTIVE_MAX_PAGE_BYTES / 2:
+            larger = min(size * 2, max_size)
+            if consumed % larger == 0:
+                size = larger
+
+
+async def apaginate(
+    client: "AsyncOpenProjectClient",
+    path: str,
+    params: Optional[dict] = None,
+    page_size: int = 100
+) -> AsyncGenerator[dict, None]:
+    """Async twin of paginate().
+
+    Args:
+        client: AsyncOpenProjectClient instance
+        path: API endpoint path
+        params: Additional query parameters
+        page_size: Items per page (default 100)
+
+    Yields:
+        Individual items from the collection
+    """
+    params = dict(params) if params else {}
+    params["pageSize"] = page_size
+    offset = 1
+
+    while True:
+        params["offset"] = offset
+        response = await client.get(path, params=params)
         embedded = response.get("_embedded", {})
         elements = embedded.get("elements", [])
 
@@ -87,6 +350,66 @@ def paginate(
         offset += 1
 
 
+class FetchManyResult(TypedDict):
+    """fetch_many() result."""
+    items: dict[int, dict]
+    missing: list[int]
+
+
+def fetch_many(
+    client: "OpenProjectClient",
+    resource: str,
+    ids: Iterable[Union[int, str]],
+    chunk_size: int = FETCH_MANY_CHUNK_SIZE,
+    workers: int = 4,
+    fields: Optional[list[str]] = None
+) -> FetchManyResult:
+    """Fetch many entities by ID with `id =` filters instead of N single GETs.
+
+    IDs are de-duplicated and split into chunks (keeps URLs short); chunks
+    are fetched concurrently, one page each.
+
+    Args:
+        client: OpenProjectClient instance
+        resource: Collection path, e.g. "work_packages", "users", "projects"
+        ids: Entity IDs
+        chunk_size: IDs per request (default 100)
+        workers: Concurrent chunk requests (default 4)
+        fields: Only download these element fields (see build_select)
+
+    Returns:
+        {"items": {id: entity}, "missing": [ids not returned]}; missing IDs
+        are deleted or not visible to the API user
+    """
+    wanted = list(dict.fromkeys(int(i) for i in ids))
+    path = "/" + resource.strip("/")
+    chunks = [wanted[i:i + chunk_size] for i in range(0, len(wanted), chunk_size)]
+
+    def fetch(chunk: list[int]) -> list[dict]:
+        params = {"filters": build_filters([{"id": {"operator": "=", "values": [str(i) for i in chunk]}}])}
+        if fields:
+            params["select"] = build_select(fields)
+        response = client.get(path, params=dict(params, pageSize=len(chunk), offset=1))
+        elements = response.get("_embedded", {}).get("elements", [])
+        total = response.get("total")
+        if isinstance(total, int) and total > len(elements) and elements:
+            # Server clamped the page size below the chunk: page through it
+            return list(paginate(client, path, params, page_size=len(elements)))
+        return elements
+
+    items: dict[int, dict] = {}
+    if len(chunks) > 1 and workers > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            results = list(executor.map(fetch, chunks))
+    else:
+        results = [fetch(chunk) for chunk in chunks]
+    for elements in results:
+        for element in elements:
+            items[element["id"]] = element
+
+    return FetchManyResult(items=items, missing=[i for i in wanted if i not in items])
+
+
 def extract_id_from_href(href: str) -> Optional[int]:
     """Extract resource ID from HAL href.
 
@@ -0,0 +1,236 @@
+"""Conditional GET cache (ETag / Last-Modified) for OpenProject responses.
+
+Cached bodies are never served blindly: every GET is revalidated with
+If-None-Match / If-Modified-Since and only a 304 answer is served from the
+local store, so the cache saves bandwidth and JSON download time without
+ever returning stale data.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Union
+
+import httpx
+
+MB = 1024 * 1024
+
+
+@dataclass
+class CachedResponse:
+    """Stored response body and its validators."""
+    body: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def conditional_headers(self) -> dict:
+        """Headers that make the server answer 304 if unchanged."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> Optional["CachedResponse"]:
+        """Build an entry from a 200 response, or None without validators."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code != 200 or not (etag or last_modified):
+            return None
+        return cls(body=response.content, etag=etag, last_modified=last_modified)
+
+
+@dataclass
+class CacheStats:
+    """Thread-safe cache counters."""
+    hits: int = 0
+    misses: int = 0
+    refreshed: int = 0
+    stores: int = 0
+    invalidations: int = 0
+    evictions: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def snapshot(self) -> dict:
+        """Current counters as a plain dict."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshed": self.refreshed,
+                "stores": self.stores,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+            }
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier (memory LRU + optional disk) store for conditional GETs.
+
+    Keys are `<path id>-<variant id>`: the path id covers base URL + path so
+    writes can drop every cached variant (query params, API keys) of a path.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 64 * MB,
+        directory: Optional[Union[str, Path]] = None,
+        max_disk_bytes: int = 256 * MB
+    ):
+        """Initialize cache.
+
+        Args:
+            max_entries: Max responses held in memory (default 512)
+            max_bytes: Max total body bytes held in memory (default 64 MB)
+            directory: Enable the on-disk tier in this directory
+            max_disk_bytes: Max total bytes on disk (default 256 MB)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = Path(directory) if directory else None
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(f.stat().st_size for f in self.directory.glob("*.cache"))
+
+    @staticmethod
+    def path_id(base_url: str, path: str) -> str:
+        """Identifier shared by all cached variants of one path."""
+        return _digest(base_url, path)[:16]
+
+    @classmethod
+    def make_key(cls, base_url: str, api_key: str, path: str, params: Optional[dict] = None) -> str:
+        """Cache key for a GET (the API key is hashed, never stored)."""
+        query = json.dumps(sorted((params or {}).items()), default=str)
+        return f"{cls.path_id(base_url, path)}-{_digest(api_key, query)[:24]}"
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Look up an entry (memory first, then disk)."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Store an entry in memory and, if enabled, on disk."""
+        self._remember(key, entry)
+        self._write_disk(key, entry)
+        self.stats.incr("stores")
+
+    def invalidate(self, base_url: str, path: str) -> None:
+        """Drop every cached variant of a path (after a write to it)."""
+        prefix = self.path_id(base_url, path) + "-"
+        with self._lock:
+            for key in [k for k in self._memory if k.startswith(prefix)]:
+                self._memory_bytes -= len(self._memory.pop(key).body)
+                self.stats.incr("invalidations")
+            if self.directory is not None:
+                for file in self.directory.glob(prefix + "*.cache"):
+                    self._unlink(file)
+                    self.stats.incr("invalidations")
+
+    def clear(self) -> None:
+        """Remove all entries from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            if self.directory is not None:
+                for file in self.directory.glob("*.cache"):
+                    self._unlink(file)
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        size = len(entry.body)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= len(old.body)
+            self._memory[key] = entry
+            self._memory_bytes += size
+            while len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted.body)
+                self.stats.incr("evictions")
+
+    # Disk tier: one file per entry, a JSON header line followed by the raw body
+
+    def _file(self, key: str) -> Path:
+        return self.directory / f"{key}.cache"
+
+    def _read_disk(self, key: str) -> Optional[CachedResponse]:
+        if self.directory is None:
+            return None
+        try:
+            raw = self._file(key).read_bytes()
+            header, body = raw.split(b"\n", 1)
+            meta = json.loads(header)
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(body=body, etag=meta.get("etag"), last_modified=meta.get("last_modified"))
+
+    def _write_disk(self, key: str, entry: CachedResponse) -> None:
+        if self.directory is None:
+            return
+        header = json.dumps({"etag": entry.etag, "last_modified": entry.last_modified}).encode()
+        data = header + b"\n" + entry.body
+        if len(data) > self.max_disk_bytes:
+            return
+        target = self._file(key)
+        tmp = target.with_suffix(f".{threading.get_ident()}.tmp")
+        with self._lock:
+            try:
+                previous = target.stat().st_size if target.exists() else 0
+                tmp.write_bytes(data)
+                os.replace(tmp, target)
+            except OSError:
+                return
+            self._disk_bytes += len(data) - previous
+            if self._disk_bytes > self.max_disk_bytes:
+                self._trim_disk()
+
+    def _trim_disk(self) -> None:
+        """Evict least recently written files until under max_disk_bytes (lock held)."""
+        files = sorted(self.directory.glob("*.cache"), key=lambda f: f.stat().st_mtime_ns)
+        for file in files:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+            self._unlink(file)
+            self.stats.incr("evictions")
+
+    def _unlink(self, file: Path) -> None:
+        """Delete a disk entry and account for its size (lock held)."""
+        try:
+            size = file.stat().st_size
+            file.unlink()
+        except OSError:
+            return
+        self._disk_bytes -= size
@@ -0,0 +1,258 @@
+"""Request instrumentation: hooks, per-endpoint counters and latency histograms.
+
+Disabled by default. When off, the clients pay one global lookup per request;
+enable_instrumentation() installs a process-wide Instrumentation that every
+OpenProjectClient / AsyncOpenProjectClient reports to.
+"""
+
+import bisect
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import httpx
+
+# Upper bounds (seconds) of the latency histogram buckets; last bucket is +Inf
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Numeric IDs and schema IDs like "3-7" become "{id}"
+_ID_SEGMENT = re.compile(r"/\d+(?:-\d+)?(?=/|$)")
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse IDs in an API path, e.g. /work_packages/42 -> /work_packages/{id}."""
+    return _ID_SEGMENT.sub("/{id}", path.split("?", 1)[0])
+
+
+@dataclass
+class RequestInfo:
+    """Outcome of one logical request (including its retries)."""
+    method: str
+    path: str
+    endpoint: str
+    elapsed: float
+    status_code: Optional[int] = None
+    bytes_in: int = 0
+    bytes_out: int = 0
+    retries: int = 0
+    error: Optional[BaseException] = None
+
+    @property
+    def failed(self) -> bool:
+        """Connection error or 4xx/5xx response."""
+        return self.error is not None or (self.status_code or 0) >= 400
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (Prometheus-compatible)."""
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                if i == len(self.buckets):
+                    return lower
+                return lower + (self.buckets[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+
+@dataclass
+class EndpointStats:
+    """Counters for one (method, endpoint template)."""
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    statuses: dict = field(default_factory=dict)
+    latency: Histogram = field(default_factory=Histogram)
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+            "statuses": dict(self.statuses),
+            "latency": {
+                "count": self.latency.count,
+                "total": round(self.latency.sum, 6),
+                "p50": round(self.latency.quantile(0.50), 6),
+                "p95": round(self.latency.quantile(0.95), 6),
+                "p99": round(self.latency.quantile(0.99), 6),
+            },
+        }
+
+
+BeforeHook = Callable[[str, str, Optional[dict]], Any]
+AfterHook = Callable[[RequestInfo], Any]
+
+
+class Instrumentation:
+    """Collects per-endpoint metrics and runs request hooks."""
+
+    def __init__(self):
+        self.before_hooks: list[BeforeHook] = []
+        self.after_hooks: list[AfterHook] = []
+        self._stats: dict[tuple[str, str], EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def add_before_hook(self, hook: BeforeHook) -> None:
+        """Call hook(method, path, params) before each request."""
+        self.before_hooks.append(hook)
+
+    def add_after_hook(self, hook: AfterHook) -> None:
+        """Call hook(RequestInfo) after each request (success or failure)."""
+        self.after_hooks.append(hook)
+
+    def before_request(self, method: str, path: str, params: Optional[dict]) -> float:
+        """Run before hooks; returns the start timestamp for after_request()."""
+        for hook in self.before_hooks:
+            hook(method, path, params)
+        return time.perf_counter()
+
+    def after_request(
+        self,
+        method: str,
+        path: str,
+        started: float,
+        response: Optional[httpx.Response] = None,
+        error: Optional[BaseException] = None,
+        retries: int = 0
+    ) -> RequestInfo:
+        """Record a finished request and run after hooks."""
+        info = RequestInfo(
+            method=method,
+            path=path,
+            endpoint=endpoint_template(path),
+            elapsed=time.perf_counter() - started,
+            retries=retries,
+            error=error,
+        )
+        if response is not None:
+            info.status_code = response.status_code
+            try:
+                info.bytes_in = len(response.content)
+            except httpx.ResponseNotRead:
+                # Streamed body: recorded before it is downloaded
+                info.bytes_in = int(response.headers.get("Content-Length", 0))
+            try:
+                info.bytes_out = len(response.request.content)
+            except (RuntimeError, httpx.RequestNotRead):
+                pass
+        self.record(info)
+        for hook in self.after_hooks:
+            hook(info)
+        return info
+
+    def record(self, info: RequestInfo) -> None:
+        """Add a request outcome to the endpoint counters."""
+        with self._lock:
+            stats = self._stats.get((info.method, info.endpoint))
+            if stats is None:
+                stats = self._stats[(info.method, info.endpoint)] = EndpointStats()
+            stats.requests += 1
+            stats.retries += info.retries
+            stats.bytes_in += info.bytes_in
+            stats.bytes_out += info.bytes_out
+            stats.latency.observe(info.elapsed)
+            if info.failed:
+                stats.errors += 1
+            status = str(info.status_code) if info.status_code else type(info.error).__name__
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    def snapshot(self) -> dict:
+        """Metrics as a plain dict keyed by "METHOD /endpoint/{id}"."""
+        with self._lock:
+            return {
+                f"{method} {endpoint}": stats.snapshot()
+                for (method, endpoint), stats in sorted(self._stats.items())
+            }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Snapshot as JSON text."""
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "openproject") -> str:
+        """Metrics in the Prometheus text exposition format."""
+        lines = [
+            f"# TYPE {prefix}_requests_total counter",
+            f"# TYPE {prefix}_errors_total counter",
+            f"# TYPE {prefix}_retries_total counter",
+            f"# TYPE {prefix}_response_bytes_total counter",
+            f"# TYPE {prefix}_request_bytes_total counter",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            for (method, endpoint), stats in sorted(self._stats.items()):
+                labels = f'method="{method}",endpoint="{endpoint}"'
+                lines.append(f"{prefix}_requests_total{{{labels}}} {stats.requests}")
+                lines.append(f"{prefix}_errors_total{{{labels}}} {stats.errors}")
+                lines.append(f"{prefix}_retries_total{{{labels}}} {stats.retries}")
+                lines.append(f"{prefix}_response_bytes_total{{{labels}}} {stats.bytes_in}")
+                lines.append(f"{prefix}_request_bytes_total{{{labels}}} {stats.bytes_out}")
+                cumulative = 0
+                for bound, n in zip(stats.latency.buckets + ("+Inf",), stats.latency.counts):
+                    cumulative += n
+                    lines.append(
+                        f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {stats.latency.sum:.6f}")
+                lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {stats.latency.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Union[str, Path], prefix: str = "openproject") -> Path:
+        """Write metrics to a text file (e.g. for node_exporter's textfile collector)."""
+        path = Path(path)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(self.to_prometheus(prefix))
+        tmp.replace(path)
+        return path
+
+    def reset(self) -> None:
+        """Drop all collected metrics (hooks are kept)."""
+        with self._lock:
+            self._stats.clear()
+
+
+_instrumentation: Optional[Instrumentation] = None
+
+
+def enable_instrumentation(instrumentation: Optional[Instrumentation] = None) -> Instrumentation:
+    """Install the process-wide Instrumentation (a new one if omitted)."""
+    global _instrumentation
+    _instrumentation = instrumentation or Instrumentation()
+    return _instrumentation
+
+
+def disable_instrumentation() -> None:
+    """Stop instrumenting requests."""
+    global _instrumentation
+    _instrumentation = None
+
+
+def get_instrumentation() -> Optional[Instrumentation]:
+    """Get the active Instrumentation (None when disabled)."""
+    return _instrumentation
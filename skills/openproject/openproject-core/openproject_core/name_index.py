@@ -0,0 +1,184 @@
+"""Ranked name search over config entries (members, types, statuses, ...).
+
+Names are normalized (case-folded, Vietnamese diacritics stripped, "đ" -> "d",
+punctuation collapsed to spaces) and indexed once by token prefix and by
+trigram, so "hung", "Hùng", "nguyen hung" and "Ngyen Hung" all find
+"Nguyễn Văn Hùng" without scanning every entry (only 1-2 character
+fragments, which have no trigram, are matched by a scan).
+
+Match tiers (score):
+    1.0          normalized names are equal
+    0.70 - 0.99  every query token is a prefix of a name token (any order)
+    0.50 - 0.69  query is a substring of the name
+    < 0.50       trigram similarity only (typos); never used by resolve()
+"""
+
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Iterable, NamedTuple, Optional
+
+# Longest token prefix stored in the prefix index; longer query tokens are
+# looked up by this prefix and then verified
+PREFIX_MAX = 8
+
+# Lowest score resolve() accepts (substring tier and above)
+RESOLVE_MIN_SCORE = 0.5
+
+# Lowest score search() returns by default
+SEARCH_MIN_SCORE = 0.3
+
+_NON_WORD = re.compile(r"[\W_]+")
+_FOLD = str.maketrans({"đ": "d", "Đ": "D"})
+
+
+@lru_cache(maxsize=4096)
+def normalize(text: str) -> str:
+    """Lowercase, diacritic-free, single-spaced form of a name.
+
+    Example: "Nguyễn Văn Đức" -> "nguyen van duc"
+    """
+    decomposed = unicodedata.normalize("NFKD", (text or "").translate(_FOLD))
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(_NON_WORD.sub(" ", stripped.casefold()).split())
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class NameMatch(NamedTuple):
+    """A search() candidate."""
+    id: Any
+    name: str
+    score: float
+
+
+class NameIndex:
+    """Prefix and trigram index over (id, name) pairs.
+
+    Exact lookups (normalized) are dict hits; search() only scores entries
+    sharing a token prefix or a trigram with the query. Ties keep the input
+    order, so earlier entries win like the former linear scans.
+    """
+
+    def __init__(self, entries: Iterable[tuple[Any, Optional[str]]]):
+        """Build the index.
+
+        Args:
+            entries: (id, display name) pairs in priority order
+        """
+        self.entries: list[tuple[Any, str, str]] = []
+        self.exact: dict[str, Any] = {}
+        self._prefixes: dict[str, set[int]] = {}
+        self._trigram_postings: dict[str, list[int]] = {}
+        self._trigram_counts: list[int] = []
+
+        for pos, (entry_id, name) in enumerate(entries):
+            key = normalize(name or "")
+            self.entries.append((entry_id, name or "", key))
+            self.exact.setdefault(key, entry_id)
+            for token in key.split():
+                for end in range(1, min(len(token), PREFIX_MAX) + 1):
+                    self._prefixes.setdefault(token[:end], set()).add(pos)
+            grams = _trigrams(key)
+            self._trigram_counts.append(len(grams))
+            for gram in grams:
+                self._trigram_postings.setdefault(gram, []).append(pos)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _prefix_candidates(self, tokens: list[str]) -> set[int]:
+        """Positions where every query token starts some name token."""
+        matched: Optional[set[int]] = None
+        for token in tokens:
+            positions = self._prefixes.get(token[:PREFIX_MAX], set())
+            if len(token) > PREFIX_MAX:
+                positions = {
+                    pos for pos in positions
+                    if any(t.startswith(token) for t in self.entries[pos][2].split())
+                }
+            matched = positions if matched is None else matched & positions
+            if not matched:
+                return set()
+        return matched or set()
+
+    def _scores(self, query: str, enough: Optional[int] = None) -> dict[int, float]:
+        """Scores by position; with `enough` prefix matches the trigram tier is skipped."""
+        key = normalize(query)
+        if not key:
+            return {}
+        scores: dict[int, float] = {}
+
+        for pos in self._prefix_candidates(key.split()):
+            name_key = self.entries[pos][2]
+            # Repeated query words can outgrow the name: keep prefixes below exact
+            scores[pos] = 1.0 if name_key == key else min(0.7 + 0.29 * len(key) / len(name_key), 0.99)
+        if enough is not None and len(scores) >= enough:
+            return scores
+
+        if len(key) < 3:
+            # Too short to share a trigram with a mid-word match ("un" in "hung"): scan
+            for pos, (_, _, name_key) in enumerate(self.entries):
+                if pos not in scores and key in name_key:
+                    scores[pos] = 0.5 + 0.19 * len(key) / len(name_key)
+            return scores
+
+        grams = _trigrams(key)
+        shared = Counter(chain.from_iterable(self._trigram_postings.get(gram, ()) for gram in grams))
+        for pos, count in shared.items():
+            if pos in scores:
+                continue
+            name_key = self.entries[pos][2]
+            if key in name_key:
+                scores[pos] = 0.5 + 0.19 * len(key) / len(name_key)
+            else:
+                scores[pos] = 0.49 * 2 * count / (len(grams) + self._trigram_counts[pos])
+        return scores
+
+    def search(self, query: str, limit: int = 5, min_score: float = SEARCH_MIN_SCORE) -> list[NameMatch]:
+        """Best matching entries, highest score first.
+
+        Args:
+            query: Name as typed, e.g. "hung nb", "Hùng"
+            limit: Maximum candidates
+            min_score: Drop candidates scoring below this (see module docstring)
+
+        Returns:
+            NameMatch list; several close scores mean the query is ambiguous
+        """
+        ranked = sorted(
+            ((score, pos) for pos, score in self._scores(query, limit).items() if score >= min_score),
+            key=lambda item: (-item[0], item[1])
+        )
+        return [
+            NameMatch(self.entries[pos][0], self.entries[pos][1], round(score, 3))
+            for score, pos in ranked[:limit]
+        ]
+
+    def resolve(self, query: str, min_score: float = RESOLVE_MIN_SCORE) -> Optional[Any]:
+        """ID of the best match scoring at least min_score, else None."""
+        key = normalize(query)
+        if key in self.exact:
+            return self.exact[key]
+        matches = self.search(query, limit=1, min_score=min_score)
+        return matches[0].id if matches else None
+
+    def resolve_many(self, queries: Iterable[str], min_score: float = RESOLVE_MIN_SCORE) -> dict[str, Optional[Any]]:
+        """resolve() for many names; repeated names are scored once.
+
+        Returns:
+            {query: ID or None} in input order
+        """
+        resolved: dict[str, Optional[Any]] = {}
+        by_key: dict[str, Optional[Any]] = {}
+        for query in queries:
+            key = normalize(query)
+            if key not in by_key:
+                by_key[key] = self.resolve(query, min_score)
+            resolved[query] = by_key[key]
+        return resolved
@@ -0,0 +1,235 @@
+"""Process-wide registry of pooled OpenProjectClient instances.
+
+Every resource module used to build a fresh OpenProjectClient (and therefore
+a fresh httpx connection pool, TCP and TLS handshake) per call. The registry
+hands out one long-lived client per (base URL, API key) so keep-alive
+connections are reused across calls and threads.
+"""
+
+import asyncio
+import atexit
+import importlib.util
+import os
+import threading
+import weakref
+from typing import Any, Coroutine, Optional, TypeVar
+
+import httpx
+
+from .async_client import AsyncOpenProjectClient
+from .client import OpenProjectClient
+from .http_cache import ResponseCache
+from .retry import RetryPolicy
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_clients: dict[tuple[str, str], OpenProjectClient] = {}
+_settings: dict = {}
+# httpx.AsyncClient connections are bound to the event loop that opened them,
+# so async clients are pooled per running loop.
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _http2_available() -> bool:
+    """Check whether the optional `h2` package is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def configure_pool(
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    http2: Optional[bool] = None,
+    timeout: Optional[float] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    cache: Optional[ResponseCache] = None
+) -> None:
+    """Configure pool limits for shared clients.
+
+    Only affects clients created after the call; use close_shared_clients()
+    first to apply new limits to already pooled clients.
+
+    Args:
+        max_connections: Max open connections per client
+            (default OPENPROJECT_POOL_MAX_CONNECTIONS or 20)
+        max_keepalive_connections: Max idle keep-alive connections
+            (default OPENPROJECT_POOL_MAX_KEEPALIVE or 10)
+        keepalive_expiry: Seconds an idle connection is kept (default 30)
+        http2: Force HTTP/2 on/off (default: on when `h2` is installed)
+        timeout: Request timeout in seconds (default 30)
+        retry_policy: Retry/backoff rules for shared clients
+        cache: Conditional GET cache shared by all pooled clients
+    """
+    updates = {
+        "max_connections": max_connections,
+        "max_keepalive_connections": max_keepalive_connections,
+        "keepalive_expiry": keepalive_expiry,
+        "http2": http2,
+        "timeout": timeout,
+        "retry_policy": retry_policy,
+        "cache": cache,
+    }
+    with _lock:
+        _settings.update({k: v for k, v in updates.items() if v is not None})
+
+
+def _pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=_settings.get(
+            "max_connections",
+            _env_int("OPENPROJECT_POOL_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS)
+        ),
+        max_keepalive_connections=_settings.get(
+            "max_keepalive_connections",
+            _env_int("OPENPROJECT_POOL_MAX_KEEPALIVE", DEFAULT_MAX_KEEPALIVE)
+        ),
+        keepalive_expiry=_settings.get("keepalive_expiry", DEFAULT_KEEPALIVE_EXPIRY),
+    )
+
+
+def _use_http2() -> bool:
+    if "http2" in _settings:
+        return bool(_settings["http2"]) and _http2_available()
+    if os.getenv("OPENPROJECT_HTTP2", "").lower() in ("0", "false", "no"):
+        return False
+    return _http2_available()
+
+
+def _resolve_key(base_url: Optional[str], api_key: Optional[str]) -> tuple[str, str]:
+    url = (base_url or os.getenv("OPENPROJECT_URL", "")).rstrip("/")
+    key = api_key or os.getenv("OPENPROJECT_API_KEY", "")
+    return url, key
+
+
+def _client_settings() -> dict:
+    return {
+        "timeout": _settings.get("timeout", 30.0),
+        "limits": _pool_limits(),
+        "http2": _use_http2(),
+        "retry_policy": _settings.get("retry_policy"),
+        "cache": _settings.get("cache"),
+    }
+
+
+def get_shared_client(
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> OpenProjectClient:
+    """Get the pooled client for a base URL + API key, creating it on first use.
+
+    The returned client may be used in a `with` block; exiting the block does
+    not close it. Closed clients are transparently replaced.
+
+    Args:
+        base_url: OpenProject instance URL (or OPENPROJECT_URL env var)
+        api_key: API key for authentication (or OPENPROJECT_API_KEY env var)
+
+    Returns:
+        Shared OpenProjectClient
+
+    Raises:
+        ValueError: If base_url is not provided
+        AuthenticationError: If api_key is not provided
+    """
+    url, key = _resolve_key(base_url, api_key)
+
+    with _lock:
+        client = _clients.get((url, key))
+        if client is None or client.is_closed:
+            client = OpenProjectClient(base_url=url, api_key=key, **_client_settings())
+            client.shared = True
+            _clients[(url, key)] = client
+        return client
+
+
+def get_shared_async_client(
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None
+) -> AsyncOpenProjectClient:
+    """Get the pooled async client for the running event loop.
+
+    Must be called from inside a coroutine. Exiting an `async with` block does
+    not close the client; use aclose_shared_clients() before the loop ends
+    (run_async() does it), or asyncio.run() closes the loop with the
+    client's connections still open (ResourceWarning).
+
+    Args:
+        base_url: OpenProject instance URL (or OPENPROJECT_URL env var)
+        api_key: API key for authentication (or OPENPROJECT_API_KEY env var)
+
+    Returns:
+        Shared AsyncOpenProjectClient
+
+    Raises:
+        RuntimeError: If no event loop is running
+        ValueError: If base_url is not provided
+        AuthenticationError: If api_key is not provided
+    """
+    loop = asyncio.get_running_loop()
+    url, key = _resolve_key(base_url, api_key)
+
+    with _lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get((url, key))
+        if client is None or client.is_closed:
+            client = AsyncOpenProjectClient(base_url=url, api_key=key, **_client_settings())
+            client.shared = True
+            clients[(url, key)] = client
+        return client
+
+
+async def aclose_shared_clients() -> None:
+    """Close every pooled async client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = list(_async_clients.pop(loop, {}).values())
+    for client in clients:
+        await client.close()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """asyncio.run() that closes the loop's pooled async clients before the loop ends.
+
+    Use instead of asyncio.run() around code calling the async twins
+    (aget_work_packages(), ...).
+
+    Returns:
+        The coroutine's result
+    """
+    async def main() -> T:
+        try:
+            return await coro
+        finally:
+            await aclose_shared_clients()
+
+    return asyncio.run(main())
+
+
+def close_shared_clients() -> None:
+    """Close every pooled sync client (registered as an atexit shutdown hook).
+
+    Async clients are bound to their event loop and cannot be closed from
+    here; see aclose_shared_clients() / run_async().
+    """
+    with _lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_shared_clients)
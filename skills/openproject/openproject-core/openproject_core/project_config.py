@@ -1,16 +1,70 @@
-"""OpenProject Project Config - Cache project metadata to reduce API calls."""
+"""OpenProject Project Config - Cache project metadata to reduce API calls.
 
+Metadata of every initialized project is kept in a store keyed by instance
+and project ID; lookups use the active project (set_active_project()).
+"""
+
+import hashlib
 import os
+import re
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, TypedDict
+from typing import Any, Optional, TypedDict
+from urllib.parse import urlsplit
 
 import yaml
 
+from . import codec
 from .client import OpenProjectClient
-from .helpers import paginate
-
+from .helpers import build_filters, extract_id_from_href, paginate
+from .name_index import NameIndex, NameMatch, RESOLVE_MIN_SCORE, SEARCH_MIN_SCORE, normalize
+from .pool import get_shared_client
+
+# Multi-project store: <store>/<instance key>/project-<id>.yml per project,
+# plus one global.yml per instance for the sections all projects share
+CONFIG_STORE_DIRNAME = ".openproject-config"
+GLOBAL_FILENAME = "global.yml"
+ACTIVE_FILENAME = "active"
+# ("instance" is /users/me, i.e. per API key: it stays in each project file)
+GLOBAL_SECTIONS = ("statuses", "priorities")
+# Config sections searchable by name (search_names(), resolve_names())
+NAME_KINDS = ("members", "types", "statuses", "priorities", "versions")
+# Pre-store single-project file, imported into the store on first use
 CONFIG_FILENAME = ".openproject-config.yml"
+# Machine-written JSON copy of each YAML file (<name>.cache.json), loaded
+# instead of it while the YAML's hash (first line of the sidecar) still matches
+CONFIG_CACHE_SUFFIX = ".cache.json"
+
+# Concurrent metadata requests in init_config() (sections + per-type schemas)
+INIT_WORKERS = 8
+
+# Page size used to fetch a whole section with one (conditional) GET
+SECTION_PAGE_SIZE = 1000
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Seconds a stored section is trusted without re-checking when age-based
+# skipping is requested: init_config() reusing another project's shared
+# sections, or refresh_config(max_age=REFRESH_MAX_AGE). A plain
+# refresh_config() re-validates every section (a 304 has no body).
+REFRESH_MAX_AGE = {
+    "instance": DAY,
+    "project": HOUR,
+    "members": 0,
+    "types": HOUR,
+    "statuses": DAY,
+    "priorities": DAY,
+    "versions": 0,
+    "categories": HOUR,
+    "custom_fields": DAY,
+}
+
+# libyaml's C loader is several times faster when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class ProjectConfig(TypedDict):
@@ -26,59 +80,448 @@ class ProjectConfig(TypedDict):
     versions: list
     categories: list
     custom_fields: dict
+    sections: dict
+    init_seconds: float
+    refresh_seconds: float
+    refreshed_sections: list
 
 
-def get_config_path() -> Path:
-    """Get config file path (skill directory root)."""
-    skill_dir = Path(__file__).parent.parent.parent
-    return skill_dir / CONFIG_FILENAME
+def _skill_dir() -> Path:
+    return Path(__file__).parent.parent.parent
 
 
-def is_config_initialized() -> bool:
-    """Check if config file exists and is valid."""
-    config_path = get_config_path()
-    if not config_path.exists():
-        return False
+def get_store_path() -> Path:
+    """Get the multi-project config store directory (skill directory root)."""
+    return _skill_dir() / CONFIG_STORE_DIRNAME
+
+
+def get_legacy_config_path() -> Path:
+    """Get the pre-store single-project config file path."""
+    return _skill_dir() / CONFIG_FILENAME
+
+
+def instance_key(url: str) -> str:
+    """Store directory name for an instance URL (e.g. "op.example.com_8080")."""
+    parsed = urlsplit(url if "://" in url else f"//{url}")
+    return re.sub(r"[^A-Za-z0-9.-]+", "_", f"{parsed.netloc}{parsed.path}".strip("/")) or "default"
+
+
+def get_config_path(project_id: Optional[int] = None, instance: Optional[str] = None) -> Path:
+    """Get a project's config file path (default: the active project).
+
+    Args:
+        project_id: Project ID (default: active project)
+        instance: Instance URL or store key (default: active project's, or OPENPROJECT_URL)
+
+    Returns:
+        `<store>/<instance>/project-<id>.yml`, or the legacy
+        `.openproject-config.yml` when no project is active
+    """
+    resolved = _resolve_project(project_id, instance)
+    if resolved is None:
+        return get_legacy_config_path()
+    key, pid = resolved
+    return get_store_path() / key / f"project-{pid}.yml"
+
+
+def get_config_cache_path(config_path: Optional[Path] = None) -> Path:
+    """Get the fast-load sidecar path next to a YAML config file."""
+    return (config_path or get_config_path()).with_suffix(CONFIG_CACHE_SUFFIX)
+
+
+def _write_sidecar(config_path: Path, digest: str, config: dict) -> None:
+    """Write the JSON sidecar; a failure only costs the next load speed."""
+    target = get_config_cache_path(config_path)
+    tmp = target.with_suffix(f".{threading.get_ident()}.tmp")
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-        return config is not None and "project" in config
-    except (yaml.YAMLError, IOError):
-        return False
+        tmp.write_bytes(digest.encode() + b"\n" + codec.dumps_bytes(config))
+        os.replace(tmp, target)
+    except (OSError, TypeError, ValueError):
+        tmp.unlink(missing_ok=True)
 
 
-def load_config() -> Optional[ProjectConfig]:
-    """Load config from YAML file.
+def _parse_yaml(raw: bytes) -> object:
+    return yaml.load(raw, Loader=_YAML_LOADER)
+
+
+def read_config_file(config_path: Path) -> Optional[dict]:
+    """Parse a config file, preferring its JSON sidecar when it is current.
+
+    The sidecar is (re)written whenever the YAML had to be parsed, e.g.
+    after a manual edit.
 
     Returns:
-        ProjectConfig dict or None if not initialized
+        Parsed config, or None if the file is missing or invalid YAML
+    """
+    try:
+        raw = config_path.read_bytes()
+    except OSError:
+        return None
+    digest = hashlib.sha256(raw).hexdigest()
+    try:
+        with open(get_config_cache_path(config_path), "rb") as f:
+            if f.readline().rstrip(b"\n").decode() == digest:
+                return codec.loads(f.read())
+    except (OSError, ValueError):
+        pass
+
+    try:
+        config = _parse_yaml(raw)
+    except yaml.YAMLError:
+        return None
+    if isinstance(config, dict):
+        _write_sidecar(config_path, digest, config)
+    return config
+
+
+class ProjectConfigIndex:
+    """Hash and search indexes over a loaded ProjectConfig.
+
+    Built once per config load so name/ID lookups are dict hits instead of
+    linear scans. Names are matched in normalized form (see name_index), so
+    case and Vietnamese diacritics do not matter.
+    """
+
+    def __init__(self, config: ProjectConfig):
+        self.config = config
+        self.types = self._by_name(config.get("types", []))
+        self.statuses = self._by_name(config.get("statuses", []))
+        self.priorities = self._by_name(config.get("priorities", []))
+        self.versions = self._by_name(config.get("versions", []))
+
+        self.member_names: dict[int, str] = {}
+        for m in config.get("members", []):
+            self.member_names.setdefault(m.get("user_id"), m.get("principal_name"))
+        # Search indexes are built on first fuzzy lookup per kind
+        self._name_indexes: dict[str, NameIndex] = {}
+
+        # custom_fields: {type_id: {field_key: info}}
+        self.custom_fields_by_type: dict[tuple[str, str], str] = {}
+        self.custom_fields_any: dict[str, str] = {}
+        self.custom_field_names: dict[tuple[str, str], Optional[str]] = {}
+        for tid, fields in config.get("custom_fields", {}).items():
+            for key, info in fields.items():
+                name = info.get("name")
+                self.custom_field_names[(str(tid), key)] = name
+                normalized = normalize(name or "")
+                self.custom_fields_by_type.setdefault((str(tid), normalized), key)
+                self.custom_fields_any.setdefault(normalized, key)
+
+    @staticmethod
+    def _by_name(items: list) -> dict[str, int]:
+        """Normalized name -> ID (first wins, like the former linear scans)."""
+        index: dict[str, int] = {}
+        for item in items:
+            index.setdefault(normalize(item.get("name") or ""), item.get("id"))
+        return index
+
+    def names(self, kind: str) -> NameIndex:
+        """Search index for one of NAME_KINDS."""
+        index = self._name_indexes.get(kind)
+        if index is None:
+            if kind == "members":
+                entries = [(m.get("user_id"), m.get("principal_name")) for m in self.config.get("members", [])]
+            elif kind in NAME_KINDS:
+                entries = [(item.get("id"), item.get("name")) for item in self.config.get(kind, [])]
+            else:
+                raise ValueError(f"Unknown name kind {kind!r}; expected one of {', '.join(NAME_KINDS)}")
+            index = self._name_indexes[kind] = NameIndex(entries)
+        return index
+
+    def member_id(self, name: str) -> Optional[int]:
+        """User ID by exact name, else by best prefix/substring match."""
+        return self.names("members").resolve(name)
+
+    def custom_field_id(self, field_name: str, type_id: Optional[int] = None) -> Optional[str]:
+        """Custom field key by name, in one type or across all types."""
+        if type_id:
+            return self.custom_fields_by_type.get((str(type_id), normalize(field_name)))
+        return self.custom_fields_any.get(normalize(field_name))
+
+
+# Parsed configs by project file: (project stamp, global stamp) -> index
+_indexes: dict[Path, tuple[tuple, ProjectConfigIndex]] = {}
+_index_lock = threading.Lock()
+# Active project: explicit switch in this process (set_active_project(),
+# save_config()), then OPENPROJECT_PROJECT_ID, then the store's `active` file
+_active_override: Optional[tuple[str, int]] = None
+_active_file: tuple[Optional[tuple], Optional[tuple[str, int]]] = (None, None)
+_legacy_checked = False
+
+
+def _file_stamp(config_path: Path) -> Optional[tuple]:
+    try:
+        stat = config_path.stat()
+    except OSError:
+        return None
+    return (str(config_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _read_active_file() -> Optional[tuple[str, int]]:
+    """Active (instance key, project ID) from the store pointer file (cached by mtime)."""
+    global _active_file
+    path = get_store_path() / ACTIVE_FILENAME
+    stamp = _file_stamp(path)
+    if stamp is None:
+        return None
+    if stamp != _active_file[0]:
+        try:
+            key, _, pid = path.read_text(encoding="utf-8").strip().rpartition("/")
+            _active_file = (stamp, (key, int(pid)) if key else None)
+        except (OSError, ValueError):
+            _active_file = (stamp, None)
+    return _active_file[1]
+
+
+def _import_legacy_config() -> None:
+    """Move a pre-store .openproject-config.yml into the store (once per process).
+
+    The old file is renamed to `.openproject-config.yml.bak` afterwards so
+    it no longer looks like the live config.
+    """
+    global _legacy_checked
+    with _index_lock:
+        if _legacy_checked:
+            return
+        _legacy_checked = True
+    if (get_store_path() / ACTIVE_FILENAME).exists():
+        return
+    legacy_path = get_legacy_config_path()
+    config = read_config_file(legacy_path)
+    if isinstance(config, dict) and "project" in config and config.get("instance", {}).get("url"):
+        save_config(config)
+        try:
+            os.replace(legacy_path, legacy_path.with_name(legacy_path.name + ".bak"))
+            get_config_cache_path(legacy_path).unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+def _resolve_project(project_id: Optional[int], instance: Optional[str]) -> Optional[tuple[str, int]]:
+    """(instance key, project ID) from explicit values, falling back to the active project."""
+    active = get_active_project()
+    if instance is not None:
+        key = instance_key(instance) if "://" in instance else instance
+    elif active is not None:
+        key = active[0]
+    elif os.getenv("OPENPROJECT_URL"):
+        key = instance_key(os.environ["OPENPROJECT_URL"])
+    else:
+        return None
+    pid = project_id if project_id is not None else (active[1] if active else None)
+    return (key, int(pid)) if pid is not None else None
+
+
+def get_active_project() -> Optional[tuple[str, int]]:
+    """Get the active (instance key, project ID), or None if no project is set."""
+    if _active_override is not None:
+        return _active_override
+    active = _read_active_file()
+    env_project = os.getenv("OPENPROJECT_PROJECT_ID", "")
+    if env_project.isdigit():
+        if os.getenv("OPENPROJECT_URL"):
+            return (instance_key(os.environ["OPENPROJECT_URL"]), int(env_project))
+        if active is not None:
+            return (active[0], int(env_project))
+    if active is None and not _legacy_checked:
+        _import_legacy_config()
+        active = _read_active_file()
+    return active
+
+
+def set_active_project(project_id: int, instance: Optional[str] = None, persist: bool = True) -> Path:
+    """Switch the project used by load_config() and the get_*_id() helpers.
+
+    No API calls and no parsing: the project's file is loaded lazily on the
+    next lookup (and kept in memory, so switching back is free).
+
+    Args:
+        project_id: Project ID (must have been initialized with init_config)
+        instance: Instance URL or store key (default: current instance)
+        persist: Also make it the default for other processes (store `active`
+            file); this process uses it either way, even when
+            OPENPROJECT_PROJECT_ID is set
+
+    Returns:
+        The project's config file path
+
+    Raises:
+        RuntimeError: If the project is not in the store
+    """
+    global _active_override
+    resolved = _resolve_project(project_id, instance)
+    path = get_config_path(project_id, instance)
+    if resolved is None or not path.exists():
+        raise RuntimeError(f"Project {project_id} not in config store; run init_config({project_id}) first")
+    key, pid = resolved
+    if persist:
+        _write_active_file(key, pid)
+    # An explicit switch wins over OPENPROJECT_PROJECT_ID for this process
+    _active_override = (key, pid)
+    return path
+
+
+def _write_active_file(key: str, pid: int) -> None:
+    target = get_store_path() / ACTIVE_FILENAME
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_suffix(f".{threading.get_ident()}.tmp")
+    tmp.write_text(f"{key}/{pid}\n", encoding="utf-8")
+    os.replace(tmp, target)
+
+
+def list_stored_projects() -> list[dict]:
+    """Projects in the config store.
+
+    Returns:
+        List of {instance, project_id, name, active, path}
+    """
+    active = get_active_project()
+    projects = []
+    for path in sorted(get_store_path().glob("*/project-*.yml")):
+        key = path.parent.name
+        try:
+            pid = int(path.stem.split("-", 1)[1])
+        except ValueError:
+            continue
+        config = read_config_file(path) or {}
+        projects.append({
+            "instance": key,
+            "project_id": pid,
+            "name": config.get("project", {}).get("name"),
+            "active": active == (key, pid),
+            "path": path,
+        })
+    return projects
+
+
+def _merge_shared(project: dict, shared: Optional[dict]) -> dict:
+    """Combine a project file with its instance's shared (global) sections."""
+    if not shared:
+        return project
+    config = dict(project)
+    for name in GLOBAL_SECTIONS:
+        if name in shared:
+            config[name] = shared[name]
+    # Stores written before "instance" moved to the project files
+    if "instance" not in config and "instance" in shared:
+        config["instance"] = shared["instance"]
+    if "sections" in shared or "sections" in project:
+        config["sections"] = {**shared.get("sections", {}), **project.get("sections", {})}
+    return config
+
+
+def get_config_index(
+    project_id: Optional[int] = None,
+    instance: Optional[str] = None
+) -> Optional[ProjectConfigIndex]:
+    """Get the indexed config of a project (default: active project).
+
+    Files are parsed only on first use and when they change on disk;
+    indexes of every project used in this process are kept.
+
+    Returns:
+        ProjectConfigIndex or None if not initialized
     """
-    if not is_config_initialized():
+    config_path = get_config_path(project_id, instance)
+    shared_path = config_path.parent / GLOBAL_FILENAME
+    stamps = (_file_stamp(config_path), _file_stamp(shared_path))
+    if stamps[0] is None:
         return None
-    config_path = get_config_path()
-    with open(config_path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    cached = _indexes.get(config_path)
+    if cached is not None and cached[0] == stamps:
+        return cached[1]
+
+    with _index_lock:
+        cached = _indexes.get(config_path)
+        if cached is None or cached[0] != stamps:
+            project = read_config_file(config_path)
+            if not (isinstance(project, dict) and "project" in project):
+                return None
+            shared = read_config_file(shared_path) if stamps[1] else None
+            cached = (stamps, ProjectConfigIndex(_merge_shared(project, shared)))
+            _indexes[config_path] = cached
+        return cached[1]
+
+
+def clear_config_cache() -> None:
+    """Forget in-memory configs and the process-local active project."""
+    global _active_override, _active_file, _legacy_checked
+    with _index_lock:
+        _indexes.clear()
+        _active_override = None
+        _active_file = (None, None)
+        _legacy_checked = False
+
+
+def is_config_initialized() -> bool:
+    """Check if the active project's config exists and is valid."""
+    return get_config_index() is not None
+
+
+def load_config(project_id: Optional[int] = None) -> Optional[ProjectConfig]:
+    """Load a project's config (default: active project).
+
+    Parsed once per process and re-read when the file changes. The
+    returned dict is shared by all callers: treat it as read-only.
+
+    Returns:
+        ProjectConfig dict or None if not initialized
+    """
+    index = get_config_index(project_id)
+    return index.config if index else None
+
+
+def _write_yaml(path: Path, data: dict) -> None:
+    """Write a YAML file and its JSON sidecar (skipped if the content is unchanged)."""
+    raw = yaml.dump(
+        data,
+        default_flow_style=False,
+        allow_unicode=True,
+        sort_keys=False,
+        width=120
+    ).encode("utf-8")
+    try:
+        if path.read_bytes() == raw:
+            return
+    except OSError:
+        pass
+    path.write_bytes(raw)
+    _write_sidecar(path, hashlib.sha256(raw).hexdigest(), data)
 
 
 def save_config(config: ProjectConfig) -> None:
-    """Save config to YAML file."""
-    config_path = get_config_path()
-    with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(
-            config,
-            f,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=False,
-            width=120
+    """Save a project config into the store and make it the active project.
+
+    Instance-wide sections (GLOBAL_SECTIONS) go to the instance's shared
+    global.yml; the rest to project-<id>.yml.
+    """
+    key = instance_key(config["instance"]["url"])
+    pid = int(config["project"]["id"])
+    config_path = get_store_path() / key / f"project-{pid}.yml"
+    shared_path = config_path.parent / GLOBAL_FILENAME
+    sections = config.get("sections", {})
+
+    # Unchanged shared data is not rewritten, so other projects' loaded indexes stay valid
+    shared = {name: config[name] for name in GLOBAL_SECTIONS if name in config}
+    project = {k: v for k, v in config.items() if k not in GLOBAL_SECTIONS and k != "sections"}
+    if sections:
+        shared["sections"] = {k: v for k, v in sections.items() if k in GLOBAL_SECTIONS}
+        project["sections"] = {k: v for k, v in sections.items() if k not in GLOBAL_SECTIONS}
+
+    with _index_lock:
+        config_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_yaml(shared_path, shared)
+        _write_yaml(config_path, project)
+        _indexes[config_path] = (
+            (_file_stamp(config_path), _file_stamp(shared_path)),
+            ProjectConfigIndex(config)
         )
+    set_active_project(pid, key)
 
 
-def _fetch_instance_info(client: OpenProjectClient) -> dict:
-    """Fetch current user and instance info."""
-    me = client.get("/users/me")
+def _parse_instance_info(me: dict) -> dict:
+    """Current user and instance info from /users/me (URL added by caller)."""
     return {
-        "url": client.base_url,
         "user_id": me.get("id"),
         "user_name": f"{me.get('firstName', '')} {me.get('lastName', '')}".strip(),
         "user_login": me.get("login"),
@@ -87,9 +530,8 @@ def _fetch_instance_info(client: OpenProjectClient) -> dict:
     }
 
 
-def _fetch_project_info(client: OpenProjectClient, project_id: int) -> dict:
-    """Fetch project details."""
-    project = client.get(f"/projects/{project_id}")
+def _parse_project_info(project: dict) -> dict:
+    """Project details."""
     return {
         "id": project.get("id"),
         "identifier": project.get("identifier"),
@@ -100,14 +542,10 @@ def _fetch_project_info(client: OpenProjectClient, project_id: int) -> dict:
     }
 
 
-def _fetch_members(client: OpenProjectClient, project_id: int) -> list:
-    """Fetch project members via memberships."""
-    from .helpers import extract_id_from_href
-
+def _parse_members(memberships: list) -> list:
+    """Project members from memberships."""
     members = []
-    for membership in paginate(client, "/memberships", params={
-        "filters": f'[{{"project":{{"operator":"=","values":["{project_id}"]}}}}]'
-    }):
+    for membership in memberships:
         principal = membership.get("_links", {}).get("principal", {})
         principal_href = principal.get("href", "")
         principal_title = principal.get("title", "")
@@ -132,140 +570,358 @@ def _fetch_members(client: OpenProjectClient, project_id: int) -> list:
     return members
 
 
-def _fetch_types(client: OpenProjectClient, project_id: int) -> list:
-    """Fetch project-specific work package types."""
-    types = []
-    for t in paginate(client, f"/projects/{project_id}/types"):
-        types.append({
+def _parse_types(elements: list) -> list:
+    """Project-specific work package types."""
+    return [
+        {
             "id": t.get("id"),
             "name": t.get("name"),
             "color": t.get("color"),
             "is_milestone": t.get("isMilestone", False)
-        })
-    return types
+        }
+        for t in elements
+    ]
 
 
-def _fetch_statuses(client: OpenProjectClient) -> list:
-    """Fetch all statuses."""
-    statuses = []
-    for s in paginate(client, "/statuses"):
-        statuses.append({
+def _parse_statuses(elements: list) -> list:
+    """All statuses, by position."""
+    statuses = [
+        {
             "id": s.get("id"),
             "name": s.get("name"),
             "color": s.get("color"),
             "is_closed": s.get("isClosed", False),
             "is_default": s.get("isDefault", False),
             "position": s.get("position")
-        })
+        }
+        for s in elements
+    ]
     return sorted(statuses, key=lambda x: x.get("position", 0))
 
 
-def _fetch_priorities(client: OpenProjectClient) -> list:
-    """Fetch all priorities."""
-    priorities = []
-    for p in paginate(client, "/priorities"):
-        priorities.append({
+def _parse_priorities(elements: list) -> list:
+    """All priorities, by position."""
+    priorities = [
+        {
             "id": p.get("id"),
             "name": p.get("name"),
             "color": p.get("color"),
             "is_default": p.get("isDefault", False),
             "position": p.get("position")
-        })
+        }
+        for p in elements
+    ]
     return sorted(priorities, key=lambda x: x.get("position", 0))
 
 
-def _fetch_versions(client: OpenProjectClient, project_id: int) -> list:
-    """Fetch project versions."""
-    versions = []
-    for v in paginate(client, f"/projects/{project_id}/versions"):
-        versions.append({
+def _parse_versions(elements: list) -> list:
+    """Project versions."""
+    return [
+        {
             "id": v.get("id"),
             "name": v.get("name"),
             "status": v.get("status"),
             "start_date": v.get("startDate"),
             "end_date": v.get("endDate"),
             "description": v.get("description", {}).get("raw", "")
-        })
-    return versions
+        }
+        for v in elements
+    ]
 
 
-def _fetch_categories(client: OpenProjectClient, project_id: int) -> list:
-    """Fetch project categories."""
-    categories = []
-    for c in paginate(client, f"/projects/{project_id}/categories"):
-        categories.append({
-            "id": c.get("id"),
-            "name": c.get("name")
-        })
-    return categories
+def _parse_categories(elements: list) -> list:
+    """Project categories."""
+    return [{"id": c.get("id"), "name": c.get("name")} for c in elements]
+
+
+_SECTION_PARSERS = {
+    "instance": _parse_instance_info,
+    "project": _parse_project_info,
+    "members": _parse_members,
+    "types": _parse_types,
+    "statuses": _parse_statuses,
+    "priorities": _parse_priorities,
+    "versions": _parse_versions,
+    "categories": _parse_categories,
+}
 
 
-def _fetch_custom_fields(client: OpenProjectClient, project_id: int, type_ids: list) -> dict:
-    """Fetch custom fields for each type via schema."""
-    custom_fields = {}
-    for type_id in type_ids:
+def _section_request(name: str, project_id: int) -> tuple[str, Optional[dict]]:
+    """Endpoint and params of a section (params None for single resources)."""
+    project_filter = build_filters([{"project": {"operator": "=", "values": [str(project_id)]}}])
+    return {
+        "instance": ("/users/me", None),
+        "project": (f"/projects/{project_id}", None),
+        "members": ("/memberships", {"filters": project_filter}),
+        "types": (f"/projects/{project_id}/types", {}),
+        "statuses": ("/statuses", {}),
+        "priorities": ("/priorities", {}),
+        "versions": (f"/projects/{project_id}/versions", {}),
+        "categories": (f"/projects/{project_id}/categories", {}),
+    }[name]
+
+
+def _fetch_section(
+    client: OpenProjectClient,
+    name: str,
+    project_id: int,
+    etag: Optional[str] = None
+) -> tuple[Optional[Any], Optional[str]]:
+    """Fetch one section unless unchanged since etag.
+
+    Collections are requested as one large page, so a single conditional
+    GET both checks and fetches them. The validator only covers that page:
+    when the server clamps the page size, no validator is returned and the
+    next check downloads the section again.
+
+    Returns:
+        (None, etag) if unchanged, else (parsed section, new validator)
+    """
+    path, params = _section_request(name, project_id)
+    if params is None:
+        body, validator = client.get_if_changed(path, etag=etag)
+        if body is None:
+            return None, etag
+        data = body
+    else:
+        first_page = dict(params, pageSize=SECTION_PAGE_SIZE, offset=1)
+        body, validator = client.get_if_changed(path, first_page, etag)
+        if body is None:
+            return None, etag
+        data = body.get("_embedded", {}).get("elements", [])
+        total = body.get("total")
+        if isinstance(total, int) and total > len(data):
+            # Server clamped the page size: read the rest page by page
+            data = list(paginate(client, path, params, page_size=len(data) or 100))
+            validator = None
+
+    parsed = _SECTION_PARSERS[name](data)
+    if name == "instance":
+        parsed = {"url": client.base_url, **parsed}
+    return parsed, validator
+
+
+def _fetch_schema_fields(
+    client: OpenProjectClient,
+    project_id: int,
+    type_id: int,
+    etag: Optional[str] = None
+) -> tuple[Optional[dict], Optional[str]]:
+    """Fetch custom field definitions from one type's schema.
+
+    Returns:
+        (None, etag) if unchanged, else (fields, validator)
+    """
+    schema, validator = client.get_if_changed(f"/work_packages/schemas/{project_id}-{type_id}", etag=etag)
+    if schema is None:
+        return None, etag
+    fields = {}
+    for key, val in schema.items():
+        if key.startswith("customField") and isinstance(val, dict):
+            fields[key] = {
+                "name": val.get("name"),
+                "type": val.get("type"),
+                "required": val.get("required", False),
+                "writable": val.get("writable", True)
+            }
+    return fields, validator
+
+
+def _fetch_custom_fields(
+    client: OpenProjectClient,
+    project_id: int,
+    type_ids: list,
+    executor: Optional[Executor] = None,
+    current: Optional[dict] = None,
+    etags: Optional[dict] = None
+) -> tuple[dict, dict, bool, bool]:
+    """Fetch custom fields for each type via schema (concurrently with an executor).
+
+    A schema that fails to load keeps its previous fields and validator.
+
+    Args:
+        current: Previous custom_fields, kept for schemas that did not change
+        etags: Previous schema validators by type ID
+
+    Returns:
+        (custom_fields, validators by type ID, whether anything changed,
+        whether every schema was checked)
+    """
+    current = current or {}
+    etags = etags or {}
+
+    def fetch(type_id: int) -> tuple[Optional[dict], Optional[str], bool]:
+        etag = etags.get(str(type_id))
         try:
-            schema = client.get(f"/work_packages/schemas/{project_id}-{type_id}")
-            fields = {}
-            for key, val in schema.items():
-                if key.startswith("customField") and isinstance(val, dict):
-                    fields[key] = {
-                        "name": val.get("name"),
-                        "type": val.get("type"),
-                        "required": val.get("required", False),
-                        "writable": val.get("writable", True)
-                    }
-            if fields:
-                custom_fields[str(type_id)] = fields
+            return (*_fetch_schema_fields(client, project_id, type_id, etag), True)
         except Exception:
+            return None, etag, False
+
+    results = list(executor.map(fetch, type_ids) if executor else map(fetch, type_ids))
+    custom_fields, validators = {}, {}
+    for type_id, (fields, validator, _) in zip(type_ids, results):
+        key = str(type_id)
+        if fields is None:
+            fields = current.get(key, {})
+        if fields:
+            custom_fields[key] = fields
+        if validator:
+            validators[key] = validator
+    complete = all(ok for _, _, ok in results)
+    return custom_fields, validators, custom_fields != current, complete
+
+
+def _section_age(meta: Optional[dict], now: datetime) -> float:
+    """Seconds since a section was last checked (inf if never)."""
+    try:
+        return (now - datetime.fromisoformat(meta["checked_at"])).total_seconds()
+    except (TypeError, KeyError, ValueError):
+        return float("inf")
+
+
+def _build_config(
+    project_id: int,
+    workers: int,
+    current: Optional[ProjectConfig] = None,
+    force: tuple = (),
+    max_age: Optional[dict] = None
+) -> tuple[ProjectConfig, list[str]]:
+    """Fetch sections (all, or only those due for a check) and assemble a config.
+
+    Args:
+        max_age: Seconds to trust each stored section (None re-checks all)
+
+    Returns:
+        (config, names of sections whose data changed)
+    """
+    now_dt = datetime.now()
+    now = now_dt.isoformat()
+    previous = (current or {}).get("sections", {})
+
+    def due(name: str) -> bool:
+        if name in force or max_age is None:
+            return True
+        return _section_age(previous.get(name), now_dt) >= max_age.get(name, 0)
+
+    def etag_of(name: str) -> Optional[str]:
+        return previous.get(name, {}).get("etag")
+
+    with get_shared_client() as client, ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {
+            name: executor.submit(_fetch_section, client, name, project_id, etag_of(name))
+            for name in _SECTION_PARSERS
+            if due(name)
+        }
+
+        # Schemas depend on the type list: fan them out as soon as it is known,
+        # and re-check them whenever it changed
+        types = futures["types"].result()[0] if "types" in futures else None
+        cf_meta = previous.get("custom_fields", {})
+        check_schemas = due("custom_fields") or types is not None
+        if check_schemas:
+            type_ids = [t["id"] for t in (types if types is not None else current["types"])]
+            custom_fields, schema_etags, schemas_changed, schemas_checked = _fetch_custom_fields(
+                client, project_id, type_ids, executor,
+                current=(current or {}).get("custom_fields"),
+                etags=cf_meta.get("etags")
+            )
+        else:
+            custom_fields, schemas_changed = current["custom_fields"], False
+
+        results = {name: future.result() for name, future in futures.items()}
+
+    data = {}
+    sections = {}
+    changed = []
+    for name in _SECTION_PARSERS:
+        if name not in results:
+            data[name] = current[name]
+            sections[name] = previous[name]
             continue
-    return custom_fields
+        value, validator = results[name]
+        # Sections without a validator come back in full: compare the data
+        if value is not None and value == (current or {}).get(name):
+            value = None
+        if value is not None:
+            changed.append(name)
+        data[name] = value if value is not None else current[name]
+        fetched_at = now if value is not None else previous.get(name, {}).get("fetched_at", now)
+        sections[name] = {"fetched_at": fetched_at, "checked_at": now, "etag": validator}
+
+    if check_schemas:
+        if schemas_changed or "custom_fields" not in previous:
+            changed.append("custom_fields")
+        fetched_at = now if "custom_fields" in changed else cf_meta.get("fetched_at", now)
+        # A failed schema keeps the section due for the next check
+        checked_at = now if schemas_checked else cf_meta.get("checked_at")
+        sections["custom_fields"] = {"fetched_at": fetched_at, "checked_at": checked_at, "etags": schema_etags}
+    else:
+        sections["custom_fields"] = cf_meta
+
+    config: ProjectConfig = {
+        "generated_at": (current or {}).get("generated_at", now),
+        "updated_at": now,
+        **data,
+        "custom_fields": custom_fields,
+        "sections": sections,
+    }
+    return config, changed
 
 
-def init_config(project_id: int) -> ProjectConfig:
+def init_config(project_id: int, workers: int = INIT_WORKERS, reuse_shared: bool = True) -> ProjectConfig:
     """Initialize config by fetching all project metadata.
 
+    Sections are fetched concurrently; type schemas (custom fields) are
+    fanned out as soon as the type list arrives. The elapsed time is stored
+    as `init_seconds`, and per-section fetch times and validators (ETags)
+    under `sections` for refresh_config().
+
+    The project is added to the config store and becomes the active project.
+    Instance-wide sections already stored by another project of the same
+    instance are reused while fresh (see REFRESH_MAX_AGE).
+
     Args:
         project_id: OpenProject project ID (numeric)
+        workers: Concurrent requests (default 8; 1 = sequential)
+        reuse_shared: Reuse stored instance-wide sections (False re-fetches them)
 
     Returns:
         ProjectConfig dict with all fetched data
     """
-    with OpenProjectClient() as client:
-        now = datetime.now().isoformat()
-
-        instance = _fetch_instance_info(client)
-        project = _fetch_project_info(client, project_id)
-        members = _fetch_members(client, project_id)
-        types = _fetch_types(client, project_id)
-        statuses = _fetch_statuses(client)
-        priorities = _fetch_priorities(client)
-        versions = _fetch_versions(client, project_id)
-        categories = _fetch_categories(client, project_id)
-
-        type_ids = [t["id"] for t in types]
-        custom_fields = _fetch_custom_fields(client, project_id, type_ids)
-
-        config: ProjectConfig = {
-            "generated_at": now,
-            "updated_at": now,
-            "instance": instance,
-            "project": project,
-            "members": members,
-            "types": types,
-            "statuses": statuses,
-            "priorities": priorities,
-            "versions": versions,
-            "categories": categories,
-            "custom_fields": custom_fields
-        }
+    started = time.monotonic()
+    shared = None
+    if reuse_shared:
+        with get_shared_client() as client:
+            shared = read_config_file(get_store_path() / instance_key(client.base_url) / GLOBAL_FILENAME)
+        if isinstance(shared, dict):
+            # Only GLOBAL_SECTIONS are reused (older stores also hold "instance")
+            sections = shared.get("sections", {})
+            shared = dict(shared, sections={k: v for k, v in sections.items() if k in GLOBAL_SECTIONS})
+    config, _ = _build_config(project_id, workers, shared, max_age=REFRESH_MAX_AGE)
+    config["init_seconds"] = round(time.monotonic() - started, 3)
+    save_config(config)
+    return config
 
-        save_config(config)
-        return config
 
+def refresh_config(
+    workers: int = INIT_WORKERS,
+    full: bool = False,
+    sections: Optional[list[str]] = None,
+    max_age: Optional[dict] = None
+) -> Optional[ProjectConfig]:
+    """Refresh config, re-downloading only sections that changed.
 
-def refresh_config() -> Optional[ProjectConfig]:
-    """Refresh config by re-fetching all data.
+    Every section is re-checked with a conditional GET (If-None-Match):
+    unchanged sections cost one request without a body. Pass
+    max_age=REFRESH_MAX_AGE to skip sections checked recently.
+
+    Args:
+        workers: Concurrent requests (see init_config)
+        full: Discard the cache and re-fetch everything (init_config)
+        sections: Section names to check regardless of max_age
+            (e.g. ["types", "custom_fields"])
+        max_age: Seconds to trust each section since its last check
+            (None re-checks all)
 
     Returns:
         Updated ProjectConfig or None if not initialized
@@ -275,7 +931,16 @@ def refresh_config() -> Optional[ProjectConfig]:
         return None
 
     project_id = current["project"]["id"]
-    return init_config(project_id)
+    if full or "sections" not in current:
+        return init_config(project_id, workers, reuse_shared=not full)
+
+    started = time.monotonic()
+    config, changed = _build_config(project_id, workers, current, tuple(sections or ()), max_age)
+    config["init_seconds"] = current.get("init_seconds")
+    config["refresh_seconds"] = round(time.monotonic() - started, 3)
+    config["refreshed_sections"] = changed
+    save_config(config)
+    return config
 
 
 def require_config() -> ProjectConfig:
@@ -305,72 +970,97 @@ def require_config() -> ProjectConfig:
 def get_project_id() -> Optional[int]:
     """Get configured project ID."""
     config = load_config()
-    if config and "project" in config:
-        return config["project"].get("id")
-    return None
+    return config["project"].get("id") if config else None
 
 
 def get_type_id(type_name: str) -> Optional[int]:
     """Get type ID by name from config."""
-    config = load_config()
-    if not config:
-        return None
-    for t in config.get("types", []):
-        if t["name"].lower() == type_name.lower():
-            return t["id"]
-    return None
+    index = get_config_index()
+    return index.types.get(normalize(type_name)) if index else None
 
 
 def get_status_id(status_name: str) -> Optional[int]:
     """Get status ID by name from config."""
-    config = load_config()
-    if not config:
-        return None
-    for s in config.get("statuses", []):
-        if s["name"].lower() == status_name.lower():
-            return s["id"]
-    return None
+    index = get_config_index()
+    return index.statuses.get(normalize(status_name)) if index else None
 
 
 def get_priority_id(priority_name: str) -> Optional[int]:
     """Get priority ID by name from config."""
-    config = load_config()
-    if not config:
-        return None
-    for p in config.get("priorities", []):
-        if p["name"].lower() == priority_name.lower():
-            return p["id"]
-    return None
+    index = get_config_index()
+    return index.priorities.get(normalize(priority_name)) if index else None
 
 
 def get_version_id(version_name: str) -> Optional[int]:
     """Get version ID by name from config."""
-    config = load_config()
-    if not config:
-        return None
-    for v in config.get("versions", []):
-        if v["name"].lower() == version_name.lower():
-            return v["id"]
-    return None
+    index = get_config_index()
+    return index.versions.get(normalize(version_name)) if index else None
 
 
 def get_member_id(name: str) -> Optional[int]:
-    """Get user ID by member name (case-insensitive partial match).
+    """Get user ID by member name (exact name first, then best prefix/substring match).
+
+    Case and diacritics are ignored; see search_names() for ranked candidates.
 
     Args:
-        name: Member name to search (e.g., "Hung NB", "hung")
+        name: Member name to search (e.g., "Hung NB", "hùng", "nguyen hung")
 
     Returns:
         User ID or None if not found
     """
-    config = load_config()
-    if not config:
-        return None
-    name_lower = name.lower()
-    for m in config.get("members", []):
-        if name_lower in m.get("principal_name", "").lower():
-            return m.get("user_id")
-    return None
+    index = get_config_index()
+    return index.member_id(name) if index else None
+
+
+def search_names(
+    kind: str,
+    query: str,
+    limit: int = 5,
+    min_score: float = SEARCH_MIN_SCORE
+) -> list[NameMatch]:
+    """Ranked candidates for a name typed by a user.
+
+    Matching ignores case, diacritics and word order, accepts word prefixes
+    ("hung n" -> "Hùng NB") and tolerates typos (low scores).
+
+    Args:
+        kind: One of NAME_KINDS ("members", "types", "statuses", "priorities", "versions")
+        query: Name as typed
+        limit: Maximum candidates (default 5)
+        min_score: Drop weaker candidates (1.0 = exact, >= 0.5 = prefix/substring)
+
+    Returns:
+        NameMatch(id, name, score) list, best first (empty without config)
+
+    Raises:
+        ValueError: Unknown kind
+    """
+    index = get_config_index()
+    return index.names(kind).search(query, limit, min_score) if index else []
+
+
+def resolve_names(
+    kind: str,
+    names: list[str],
+    min_score: float = RESOLVE_MIN_SCORE
+) -> dict[str, Optional[int]]:
+    """Resolve many names to IDs in one call (best match per name).
+
+    Args:
+        kind: One of NAME_KINDS
+        names: Names as typed, e.g. assignees from a spreadsheet
+        min_score: Weakest accepted match (default: prefix/substring, no typos)
+
+    Returns:
+        {name: ID or None}
+
+    Raises:
+        ValueError: Unknown kind
+    """
+    index = get_config_index()
+    if not index:
+        return dict.fromkeys(names)
+    return index.names(kind).resolve_many(names, min_score)
 
 
 def get_member_name(user_id: int) -> Optional[str]:
@@ -382,13 +1072,8 @@ def get_member_name(user_id: int) -> Optional[str]:
     Returns:
         Member name or None
     """
-    config = load_config()
-    if not config:
-        return None
-    for m in config.get("members", []):
-        if m.get("user_id") == user_id:
-            return m.get("principal_name")
-    return None
+    index = get_config_index()
+    return index.member_names.get(user_id) if index else None
 
 
 def get_custom_field_id(field_name: str, type_id: Optional[int] = None) -> Optional[str]:
@@ -401,21 +1086,8 @@ def get_custom_field_id(field_name: str, type_id: Optional[int] = None) -> Optio
     Returns:
         Custom field key (e.g., "customField8") or None
     """
-    config = load_config()
-    if not config:
-        return None
-
-    name_lower = field_name.lower()
-    custom_fields = config.get("custom_fields", {})
-
-    types_to_search = [str(type_id)] if type_id else custom_fields.keys()
-
-    for tid in types_to_search:
-        type_fields = custom_fields.get(tid, {})
-        for field_key, field_info in type_fields.items():
-            if field_info.get("name", "").lower() == name_lower:
-                return field_key
-    return None
+    index = get_config_index()
+    return index.custom_field_id(field_name, type_id) if index else None
 
 
 def get_custom_field_name(field_key: str, type_id: int) -> Optional[str]:
@@ -428,12 +1100,8 @@ def get_custom_field_name(field_key: str, type_id: int) -> Optional[str]:
     Returns:
         Field name or None
     """
-    config = load_config()
-    if not config:
-        return None
-    type_fields = config.get("custom_fields", {}).get(str(type_id), {})
-    field_info = type_fields.get(field_key, {})
-    return field_info.get("name")
+    index = get_config_index()
+    return index.custom_field_names.get((str(type_id), field_key)) if index else None
 
 
 def print_config_summary() -> None:
@@ -446,6 +1114,11 @@ def print_config_summary() -> None:
     print(f"=== OpenProject Config ===")
     print(f"Generated: {config.get('generated_at')}")
     print(f"Updated: {config.get('updated_at')}")
+    if config.get("init_seconds") is not None:
+        print(f"Fetch time: {config['init_seconds']}s")
+    if config.get("refresh_seconds") is not None:
+        changed = ", ".join(config.get("refreshed_sections") or []) or "nothing changed"
+        print(f"Last refresh: {config['refresh_seconds']}s ({changed})")
     print()
 
     inst = config.get("instance", {})
@@ -491,17 +1164,11 @@ def load_session_config() -> dict:
         ... else:
         ...     print(f"Session ready: {session['project']} (ID: {session['project_id']})")
     """
-    if not is_config_initialized():
-        return {
-            "ok": False,
-            "error": "Config not initialized! Run init_config(project_id) first."
-        }
-
     config = load_config()
     if not config:
         return {
             "ok": False,
-            "error": "Failed to load config file."
+            "error": "Config not initialized! Run init_config(project_id) first."
         }
 
     proj = config.get("project", {})
@@ -0,0 +1,207 @@
+"""Client-side token-bucket rate limiting for OpenProject requests.
+
+One limiter is shared by every client, thread and asyncio task in the
+process, so bulk fan-out stays under the server's sustainable rate instead of
+bursting into 429 responses and retrying.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from typing import Optional
+
+# Methods that count against the "read" bucket; everything else is a write
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class TokenBucket:
+    """Thread-safe token bucket with additive-increase/multiplicative-decrease.
+
+    Callers reserve a token and sleep for the returned wait, so waiting never
+    holds the lock and works the same from threads and coroutines. After a 429
+    the refill rate is halved and then recovers gradually toward `rate`.
+    """
+
+    def __init__(self, rate: float, burst: int, min_rate: Optional[float] = None):
+        """Initialize bucket.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket capacity (requests allowed back-to-back)
+            min_rate: Floor for the refill rate after throttling (default rate / 10)
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be > 0 and burst >= 1")
+        self.rate = float(rate)
+        self.burst = burst
+        self.min_rate = min_rate if min_rate is not None else self.rate / 10
+        self.current_rate = self.rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.current_rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens now and return how long the caller must wait (seconds)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.current_rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block the current thread until tokens are available.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(tokens)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Await until tokens are available without blocking the event loop.
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_throttled(self) -> None:
+        """Server answered 429: halve the refill rate."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.current_rate = max(self.min_rate, self.current_rate / 2)
+
+    def on_success(self) -> None:
+        """Successful response: recover 5% of the configured rate."""
+        if self.current_rate >= self.rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.current_rate = min(self.rate, self.current_rate + self.rate * 0.05)
+
+
+class RateLimiter:
+    """Token buckets grouped by endpoint: reads, writes and path overrides."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        write_rate: Optional[float] = None,
+        write_burst: Optional[int] = None,
+        endpoint_limits: Optional[dict[str, tuple[float, int]]] = None
+    ):
+        """Initialize limiter.
+
+        Args:
+            rate: Requests per second for reads (GET)
+            burst: Burst size for reads
+            write_rate: Requests per second for POST/PATCH/DELETE (default: rate)
+            write_burst: Burst size for writes (default: burst)
+            endpoint_limits: Path prefix -> (rate, burst), e.g.
+                {"/work_packages/schemas": (2, 4)}; the longest matching
+                prefix wins over the read/write buckets
+        """
+        self.read = TokenBucket(rate, burst)
+        self.write = TokenBucket(write_rate or rate, write_burst or burst)
+        self.endpoints = {
+            prefix.rstrip("/"): TokenBucket(r, b)
+            for prefix, (r, b) in (endpoint_limits or {}).items()
+        }
+        # Longest prefix first so the most specific group wins
+        self._prefixes = sorted(self.endpoints, key=len, reverse=True)
+
+    def bucket_for(self, method: str, path: str) -> TokenBucket:
+        """Select the bucket a request counts against."""
+        for prefix in self._prefixes:
+            if path == prefix or path.startswith(prefix + "/"):
+                return self.endpoints[prefix]
+        return self.read if method.upper() in READ_METHODS else self.write
+
+    def acquire(self, method: str, path: str) -> float:
+        """Block until the request may be sent. Returns seconds waited."""
+        return self.bucket_for(method, path).acquire()
+
+    async def acquire_async(self, method: str, path: str) -> float:
+        """Await until the request may be sent. Returns seconds waited."""
+        return await self.bucket_for(method, path).acquire_async()
+
+    def record_status(self, method: str, path: str, status_code: int) -> None:
+        """Feed a response status back into the request's bucket."""
+        bucket = self.bucket_for(method, path)
+        if status_code == 429:
+            bucket.on_throttled()
+        elif status_code < 400:
+            bucket.on_success()
+
+
+_limiter: Optional[RateLimiter] = None
+_limiter_lock = threading.Lock()
+_env_checked = False
+
+
+def configure_rate_limit(
+    rate: float,
+    burst: int = 10,
+    write_rate: Optional[float] = None,
+    write_burst: Optional[int] = None,
+    endpoint_limits: Optional[dict[str, tuple[float, int]]] = None
+) -> RateLimiter:
+    """Install the process-wide rate limiter used by all clients.
+
+    Args:
+        rate: Requests per second for reads
+        burst: Burst size for reads (default 10)
+        write_rate: Requests per second for writes (default: rate)
+        write_burst: Burst size for writes (default: burst)
+        endpoint_limits: Path prefix -> (rate, burst) overrides
+
+    Returns:
+        The installed RateLimiter
+    """
+    global _limiter, _env_checked
+    limiter = RateLimiter(rate, burst, write_rate, write_burst, endpoint_limits)
+    with _limiter_lock:
+        _limiter = limiter
+        _env_checked = True
+    return limiter
+
+
+def disable_rate_limit() -> None:
+    """Remove the process-wide rate limiter."""
+    global _limiter, _env_checked
+    with _limiter_lock:
+        _limiter = None
+        _env_checked = True
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Get the process-wide limiter (None when rate limiting is off).
+
+    On first use, OPENPROJECT_RATE_LIMIT (requests/second) and
+    OPENPROJECT_RATE_BURST enable a limiter without code changes.
+    """
+    global _limiter, _env_checked
+    if not _env_checked:
+        with _limiter_lock:
+            if not _env_checked:
+                _env_checked = True
+                try:
+                    rate = float(os.getenv("OPENPROJECT_RATE_LIMIT", "0"))
+                    burst = int(os.getenv("OPENPROJECT_RATE_BURST", "10"))
+                except ValueError:
+                    rate = 0
+                if rate > 0:
+                    _limiter = RateLimiter(rate, burst)
+    return _limiter
@@ -0,0 +1,185 @@
+"""Compact typed projections of OpenProject resources.
+
+A raw HAL work package dict (nested `_links` with titles, formattable text,
+embedded resources) costs several KB in memory; a record keeps only scalar
+fields and link IDs in a __slots__ dataclass, which is what reporting over
+tens of thousands of items needs. Fields absent from the response (e.g. when
+listing with `fields=`/`select`) stay None.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional, TypeVar
+
+try:
+    from .helpers import extract_id_from_href
+except ImportError:
+    from helpers import extract_id_from_href
+
+R = TypeVar("R", "WorkPackageRecord", "TimeEntryRecord", "UserRecord")
+
+
+def link_id(data: dict, name: str) -> Optional[int]:
+    """ID of a `_links` entry (same rules as extract_id_from_href)."""
+    link = data.get("_links", {}).get(name)
+    if isinstance(link, dict):
+        return extract_id_from_href(link.get("href"))
+    return None
+
+
+def _raw(value) -> Optional[str]:
+    """Plain text of a formattable field ({"raw": ...}) or string."""
+    if isinstance(value, dict):
+        return value.get("raw")
+    return value
+
+
+@dataclass(slots=True)
+class WorkPackageRecord:
+    """Work package without links/embedded payloads (description omitted)."""
+    id: int
+    subject: Optional[str] = None
+    lock_version: Optional[int] = None
+    project_id: Optional[int] = None
+    type_id: Optional[int] = None
+    status_id: Optional[int] = None
+    priority_id: Optional[int] = None
+    author_id: Optional[int] = None
+    assignee_id: Optional[int] = None
+    responsible_id: Optional[int] = None
+    version_id: Optional[int] = None
+    parent_id: Optional[int] = None
+    start_date: Optional[str] = None
+    due_date: Optional[str] = None
+    estimated_time: Optional[str] = None
+    spent_time: Optional[str] = None
+    percentage_done: Optional[int] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    custom_fields: Optional[dict] = None
+
+    @classmethod
+    def from_hal(cls, data: dict) -> "WorkPackageRecord":
+        """Build from a (possibly `select`-trimmed) API work package."""
+        custom = {}
+        for key, value in data.items():
+            if key.startswith("customField"):
+                custom[key] = _raw(value)
+        for key, link in data.get("_links", {}).items():
+            if key.startswith("customField"):
+                if isinstance(link, list):
+                    custom[key] = [extract_id_from_href(item.get("href")) for item in link]
+                elif isinstance(link, dict):
+                    custom[key] = extract_id_from_href(link.get("href"))
+
+        return cls(
+            id=data.get("id"),
+            subject=data.get("subject"),
+            lock_version=data.get("lockVersion"),
+            project_id=link_id(data, "project"),
+            type_id=link_id(data, "type"),
+            status_id=link_id(data, "status"),
+            priority_id=link_id(data, "priority"),
+            author_id=link_id(data, "author"),
+            assignee_id=link_id(data, "assignee"),
+            responsible_id=link_id(data, "responsible"),
+            version_id=link_id(data, "version"),
+            parent_id=link_id(data, "parent"),
+            start_date=data.get("startDate"),
+            due_date=data.get("dueDate"),
+            estimated_time=data.get("estimatedTime"),
+            spent_time=data.get("spentTime"),
+            percentage_done=data.get("percentageDone"),
+            created_at=data.get("createdAt"),
+            updated_at=data.get("updatedAt"),
+            custom_fields=custom or None,
+        )
+
+
+@dataclass(slots=True)
+class TimeEntryRecord:
+    """Time entry; `hours` is the ISO 8601 duration (see parse_duration)."""
+    id: int
+    hours: Optional[str] = None
+    spent_on: Optional[str] = None
+    comment: Optional[str] = None
+    ongoing: Optional[bool] = None
+    project_id: Optional[int] = None
+    work_package_id: Optional[int] = None
+    user_id: Optional[int] = None
+    activity_id: Optional[int] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    @classmethod
+    def from_hal(cls, data: dict) -> "TimeEntryRecord":
+        """Build from a (possibly `select`-trimmed) API time entry."""
+        work_package_id = link_id(data, "workPackage")
+        if work_package_id is None:
+            # Newer versions link the logged entity instead of workPackage
+            entity = data.get("_links", {}).get("entity") or {}
+            if "/work_packages/" in (entity.get("href") or ""):
+                work_package_id = extract_id_from_href(entity["href"])
+
+        return cls(
+            id=data.get("id"),
+            hours=data.get("hours"),
+            spent_on=data.get("spentOn"),
+            comment=_raw(data.get("comment")),
+            ongoing=data.get("ongoing"),
+            project_id=link_id(data, "project"),
+            work_package_id=work_package_id,
+            user_id=link_id(data, "user"),
+            activity_id=link_id(data, "activity"),
+            created_at=data.get("createdAt"),
+            updated_at=data.get("updatedAt"),
+        )
+
+
+@dataclass(slots=True)
+class UserRecord:
+    """User without links/embedded payloads."""
+    id: int
+    login: Optional[str] = None
+    name: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    email: Optional[str] = None
+    status: Optional[str] = None
+    admin: Optional[bool] = None
+    language: Optional[str] = None
+    created_at: Optional[str] = None
+    updated_at: Optional[str] = None
+
+    @classmethod
+    def from_hal(cls, data: dict) -> "UserRecord":
+        """Build from a (possibly `select`-trimmed) API user."""
+        return cls(
+            id=data.get("id"),
+            login=data.get("login"),
+            name=data.get("name"),
+            first_name=data.get("firstName"),
+            last_name=data.get("lastName"),
+            email=data.get("email"),
+            status=data.get("status"),
+            admin=data.get("admin"),
+            language=data.get("language"),
+            created_at=data.get("createdAt"),
+            updated_at=data.get("updatedAt"),
+        )
+
+
+def to_records(items: Iterable[dict], record_type: type[R]) -> Iterator[R]:
+    """Convert API dicts to records lazily.
+
+    Args:
+        items: Iterable of API dicts (e.g. from paginate())
+        record_type: WorkPackageRecord, TimeEntryRecord or UserRecord
+
+    Yields:
+        Records in the same order
+    """
+    from_hal = record_type.from_hal
+    for item in items:
+        yield from_hal(item)
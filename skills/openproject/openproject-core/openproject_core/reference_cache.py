@@ -0,0 +1,342 @@
+"""Persistent TTL cache for rarely changing reference data.
+
+Statuses, priorities, types, roles, time entry activities and schemas are
+re-downloaded by every new agent process although they change a few times a
+year. The reference cache keeps them in a SQLite file under the skill
+directory, keyed by instance URL and endpoint, so lookups are served from
+disk across processes until their per-resource TTL expires.
+
+Unlike ResponseCache (http_cache.py), entries are served without
+revalidation while fresh; call invalidate() after changing reference data.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Generator, Optional, Union, TYPE_CHECKING
+
+from . import codec
+from .exceptions import OpenProjectError
+from .helpers import paginate
+from .http_cache import CacheStats
+
+if TYPE_CHECKING:
+    from .async_client import AsyncOpenProjectClient
+    from .client import OpenProjectClient
+
+CACHE_FILENAME = ".openproject-cache.sqlite3"
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Seconds an entry is served without contacting the server, per resource
+DEFAULT_TTLS = {
+    "statuses": DAY,
+    "priorities": DAY,
+    "types": DAY,
+    "roles": DAY,
+    "activities": DAY,
+    "schemas": HOUR,
+}
+DEFAULT_TTL = HOUR
+
+# Endpoints of the resources in DEFAULT_TTLS (activities come from the time
+# entry schema; work package schemas are per project/type, cached by get_schema())
+REFERENCE_PATHS = {
+    "statuses": "/statuses",
+    "priorities": "/priorities",
+    "types": "/types",
+    "roles": "/roles",
+    "activities": "/time_entries/schema",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    instance TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (instance, endpoint)
+)
+"""
+
+
+class OfflineCacheMiss(OpenProjectError):
+    """Offline mode and the requested reference data is not cached."""
+
+    def __init__(self, resource: str, endpoint: str):
+        self.resource = resource
+        self.endpoint = endpoint
+        super().__init__(f"{endpoint} ({resource}) not cached; run once online to populate")
+
+
+def get_cache_path() -> Path:
+    """Default cache file path (skill directory root, next to the project config)."""
+    skill_dir = Path(__file__).parent.parent.parent
+    return skill_dir / CACHE_FILENAME
+
+
+class ReferenceCache:
+    """SQLite-backed store of decoded JSON values with per-resource TTLs.
+
+    Safe to share between threads; WAL mode lets several processes read
+    while one writes.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        ttls: Optional[dict[str, float]] = None,
+        offline: bool = False
+    ):
+        """Initialize cache.
+
+        Args:
+            path: SQLite file (default get_cache_path()); ":memory:" for a private cache
+            ttls: Resource -> seconds overrides merged into DEFAULT_TTLS
+            offline: Serve cached entries regardless of age, never fetch
+        """
+        self.path = str(path or get_cache_path())
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.offline = offline
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(_SCHEMA)
+
+    def ttl(self, resource: str) -> float:
+        """Time-to-live in seconds for a resource."""
+        return self.ttls.get(resource, DEFAULT_TTL)
+
+    def get(self, instance: str, endpoint: str, max_age: Optional[float] = None) -> Optional[Any]:
+        """Stored value, or None if missing or older than max_age seconds."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT stored_at, body FROM entries WHERE instance = ? AND endpoint = ?",
+                (instance, endpoint)
+            ).fetchone()
+        if row is None:
+            return None
+        stored_at, body = row
+        if max_age is not None and time.time() - stored_at > max_age:
+            return None
+        return codec.loads(body)
+
+    def put(self, instance: str, resource: str, endpoint: str, value: Any) -> None:
+        """Store a JSON-serializable value."""
+        body = codec.dumps_bytes(value)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (instance, endpoint, resource, time.time(), body)
+            )
+        self.stats.incr("stores")
+
+    def fetch(
+        self,
+        instance: str,
+        resource: str,
+        endpoint: str,
+        loader: Callable[[], Any]
+    ) -> Any:
+        """Serve a fresh entry, or call loader() and store its result.
+
+        Raises:
+            OfflineCacheMiss: If offline and the entry was never cached
+        """
+        value = self._lookup(instance, resource, endpoint)
+        if value is None:
+            value = loader()
+            self.put(instance, resource, endpoint, value)
+        return value
+
+    async def afetch(
+        self,
+        instance: str,
+        resource: str,
+        endpoint: str,
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Async twin of fetch(); loader is awaited (SQLite access stays synchronous)."""
+        value = self._lookup(instance, resource, endpoint)
+        if value is None:
+            value = await loader()
+            self.put(instance, resource, endpoint, value)
+        return value
+
+    def _lookup(self, instance: str, resource: str, endpoint: str) -> Optional[Any]:
+        """Fresh (or, offline, any) cached value; None when it must be loaded."""
+        value = self.get(instance, endpoint, None if self.offline else self.ttl(resource))
+        if value is not None:
+            self.stats.incr("hits")
+            return value
+        if self.offline:
+            self.stats.incr("misses")
+            raise OfflineCacheMiss(resource, endpoint)
+
+        expired = self.get(instance, endpoint) is not None
+        self.stats.incr("refreshed" if expired else "misses")
+        return None
+
+    def invalidate(self, resource: Optional[str] = None, instance: Optional[str] = None) -> int:
+        """Drop cached entries.
+
+        Args:
+            resource: Only this resource, e.g. "statuses" (default: all)
+            instance: Only this instance URL (default: all)
+
+        Returns:
+            Number of entries removed
+        """
+        clauses, args = [], []
+        if resource is not None:
+            clauses.append("resource = ?")
+            args.append(resource)
+        if instance is not None:
+            clauses.append("instance = ?")
+            args.append(instance.rstrip("/"))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            removed = self._db.execute(f"DELETE FROM entries{where}", args).rowcount
+        self.stats.incr("invalidations", removed)
+        return removed
+
+    def entries(self) -> list[dict]:
+        """Cached entries (without bodies) with their age in seconds."""
+        now = time.time()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT instance, resource, endpoint, stored_at, length(body) FROM entries"
+                " ORDER BY instance, resource, endpoint"
+            ).fetchall()
+        return [
+            {
+                "instance": instance,
+                "resource": resource,
+                "endpoint": endpoint,
+                "age": round(now - stored_at, 1),
+                "fresh": now - stored_at <= self.ttl(resource),
+                "bytes": size,
+            }
+            for instance, resource, endpoint, stored_at, size in rows
+        ]
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+
+_cache: Optional[ReferenceCache] = None
+_cache_lock = threading.Lock()
+_env_checked = False
+
+
+def configure_reference_cache(
+    path: Optional[Union[str, Path]] = None,
+    ttls: Optional[dict[str, float]] = None,
+    offline: bool = False
+) -> ReferenceCache:
+    """Install the process-wide reference cache used by list_statuses() etc.
+
+    Args:
+        path: SQLite file (default get_cache_path())
+        ttls: Resource -> seconds overrides
+        offline: Serve only cached data (no network), see OfflineCacheMiss
+
+    Returns:
+        The installed ReferenceCache
+    """
+    global _cache, _env_checked
+    cache = ReferenceCache(path, ttls, offline)
+    with _cache_lock:
+        previous, _cache = _cache, cache
+        _env_checked = True
+    if previous is not None:
+        previous.close()
+    return cache
+
+
+def disable_reference_cache() -> None:
+    """Remove the process-wide reference cache (always hit the network)."""
+    global _cache, _env_checked
+    with _cache_lock:
+        previous, _cache = _cache, None
+        _env_checked = True
+    if previous is not None:
+        previous.close()
+
+
+def get_reference_cache() -> Optional[ReferenceCache]:
+    """Get the process-wide reference cache (None when disabled).
+
+    On first use, OPENPROJECT_REFERENCE_CACHE ("1" for the default file, or
+    a path) enables it without code changes; OPENPROJECT_OFFLINE=1 turns on
+    offline mode.
+    """
+    global _cache, _env_checked
+    if not _env_checked:
+        with _cache_lock:
+            if not _env_checked:
+                _env_checked = True
+                setting = os.getenv("OPENPROJECT_REFERENCE_CACHE", "")
+                offline = os.getenv("OPENPROJECT_OFFLINE", "").lower() in ("1", "true", "yes")
+                if setting.lower() not in ("", "0", "false", "no") or offline:
+                    path = None if setting.lower() in ("", "1", "true", "yes") else setting
+                    _cache = ReferenceCache(path, offline=offline)
+    return _cache
+
+
+def cached_reference(
+    client: "OpenProjectClient",
+    resource: str,
+    path: str,
+    params: Optional[dict] = None
+) -> Any:
+    """GET a reference resource through the process-wide cache (if enabled)."""
+    cache = get_reference_cache()
+    if cache is None:
+        return client.get(path, params=params)
+    return cache.fetch(client.base_url, resource, _endpoint(path, params), lambda: client.get(path, params=params))
+
+
+async def acached_reference(
+    client: "AsyncOpenProjectClient",
+    resource: str,
+    path: str,
+    params: Optional[dict] = None
+) -> Any:
+    """Async twin of cached_reference()."""
+    cache = get_reference_cache()
+    if cache is None:
+        return await client.get(path, params=params)
+    return await cache.afetch(client.base_url, resource, _endpoint(path, params), lambda: client.get(path, params=params))
+
+
+def _endpoint(path: str, params: Optional[dict]) -> str:
+    return path if not params else f"{path}?{codec.dumps(sorted(params.items()))}"
+
+
+def cached_collection(
+    client: "OpenProjectClient",
+    resource: str,
+    path: str,
+    page_size: int = 100
+) -> Generator[dict, None, None]:
+    """Paginate a reference collection through the process-wide cache (if enabled).
+
+    Without a cache this is plain paginate(); with one, the whole collection
+    is stored as a single entry.
+    """
+    cache = get_reference_cache()
+    if cache is None:
+        yield from paginate(client, path, page_size=page_size)
+        return
+    yield from cache.fetch(
+        client.base_url, resource, path, lambda: list(paginate(client, path, page_size=page_size))
+    )
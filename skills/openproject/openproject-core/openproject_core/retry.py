@@ -0,0 +1,142 @@
+"""Retry policy with exponential backoff for OpenProject requests."""
+
+import random
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+# Methods that are safe to repeat (RFC 9110 idempotent methods)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# 500 is left out on purpose: OpenProject answers deterministic application
+# errors (bad filters, broken custom fields) with 500, retrying only adds latency.
+DEFAULT_RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how long to wait before re-sending a failed request.
+
+    Attributes:
+        max_retries: Retries after the first attempt (0 disables retrying)
+        backoff_factor: Base delay in seconds, doubled per attempt
+        max_backoff: Cap for a single delay in seconds
+        total_budget: Max seconds spent waiting across all retries of a request
+        retry_statuses: HTTP statuses that trigger a retry
+        respect_retry_after: Use the server's Retry-After header when present
+        jitter: Randomize delays ("full jitter") to avoid retry storms
+    """
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    total_budget: float = 60.0
+    retry_statuses: frozenset = DEFAULT_RETRY_STATUSES
+    respect_retry_after: bool = True
+    jitter: bool = True
+
+    def allows(self, method: str, idempotent: bool = False) -> bool:
+        """Whether a request with this method may be retried at all."""
+        return self.max_retries > 0 and (idempotent or method.upper() in IDEMPOTENT_METHODS)
+
+    def should_retry_response(self, response: httpx.Response) -> bool:
+        """Whether the response status is transient."""
+        return response.status_code in self.retry_statuses
+
+    def next_delay(
+        self,
+        attempt: int,
+        waited: float,
+        response: Optional[httpx.Response] = None
+    ) -> Optional[float]:
+        """Delay before retry number `attempt + 1`, or None to give up.
+
+        Args:
+            attempt: Retries already made for this request
+            waited: Seconds already spent waiting for this request
+            response: Failed response (None for connection errors)
+
+        Returns:
+            Seconds to sleep, or None when retries or budget are exhausted
+        """
+        if attempt >= self.max_retries:
+            return None
+
+        delay = None
+        if response is not None and self.respect_retry_after:
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+        if delay is None:
+            delay = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+            if self.jitter:
+                delay = random.uniform(0, delay)
+
+        if waited + delay > self.total_budget:
+            return None
+        return delay
+
+
+NO_RETRY = RetryPolicy(max_retries=0)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date).
+
+    Returns:
+        Seconds to wait (never negative) or None if missing/invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryStats:
+    """Thread-safe retry counters for one client."""
+    requests: int = 0
+    retried_requests: int = 0
+    retries: int = 0
+    retry_wait_seconds: float = 0.0
+    exhausted: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record_request(self, retries: int, waited: float, exhausted: bool) -> None:
+        """Record the outcome of one logical request."""
+        with self._lock:
+            self.requests += 1
+            if retries:
+                self.retried_requests += 1
+                self.retries += retries
+                self.retry_wait_seconds += waited
+            if exhausted:
+                self.exhausted += 1
+
+    def snapshot(self) -> dict:
+        """Current counters as a plain dict."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retried_requests": self.retried_requests,
+                "retries": self.retries,
+                "retry_wait_seconds": round(self.retry_wait_seconds, 3),
+                "exhausted": self.exhausted,
+            }
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self.requests = self.retried_requests = self.retries = self.exhausted = 0
+            self.retry_wait_seconds = 0.0
@@ -0,0 +1,139 @@
+"""Incremental parsing of HAL collection responses.
+
+`response.json()` buffers the whole body and builds the full dict tree before
+the first element can be used. For large pages (pageSize 500-1000, embedded
+schemas) iter_collection() instead walks the body as it arrives and yields
+each `_embedded.elements` item as soon as it is complete, so only one element
+(plus the unread part of the current chunk) is held at a time.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, Optional
+
+# Drop the consumed part of the buffer once it grows past this many chars
+_COMPACT_AT = 64 * 1024
+_WHITESPACE = " \t\n\r"
+
+
+class _Reader:
+    """Pull parser over an iterable of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer. Returns False at end of stream."""
+        if self.eof:
+            return False
+        if self.pos > _COMPACT_AT:
+            self.buf = self.buf[self.pos:]
+            self.pos = 0
+        for chunk in self._chunks:
+            text = self._decoder.decode(chunk)
+            if text:
+                self.buf += text
+                return True
+        self.buf += self._decoder.decode(b"", final=True)
+        self.eof = True
+        return False
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at end of stream)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos}, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def keys(self) -> Iterator[str]:
+        """Iterate object keys; the caller must consume each value."""
+        if self.peek() == "}":
+            self.pos += 1
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or '}}' at offset {self.pos - 1}")
+
+    def items(self) -> Iterator[Any]:
+        """Iterate array items."""
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(f"Expected ',' or ']' at offset {self.pos - 1}")
+
+
+def iter_collection(chunks: Iterable[bytes], meta: Optional[dict] = None) -> Iterator[dict]:
+    """Yield `_embedded.elements` of a HAL collection body as it is parsed.
+
+    Args:
+        chunks: Raw body chunks, e.g. response.iter_bytes()
+        meta: Optional dict filled with all other fields (total, count,
+            pageSize, offset, _links, other `_embedded` entries); keys that
+            precede the elements in the body are available before the
+            first element is yielded
+
+    Yields:
+        Collection elements in order
+
+    Raises:
+        ValueError: If the body is not a JSON object
+    """
+    meta = meta if meta is not None else {}
+    reader = _Reader(chunks)
+    reader.expect("{")
+    for key in reader.keys():
+        if key != "_embedded":
+            meta[key] = reader.value()
+            continue
+        embedded = meta.setdefault("_embedded", {})
+        reader.expect("{")
+        for name in reader.keys():
+            if name == "elements":
+                reader.expect("[")
+                yield from reader.items()
+            else:
+                embedded[name] = reader.value()
@@ -6,12 +6,12 @@ is only possible through the OpenProject web UI.
 
 from typing import Iterator
 
-from openproject_core import OpenProjectClient, paginate
+from openproject_core import OpenProjectClient, get_shared_client, paginate
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
 
 
 def list_documents(page_size: int = 100) -> Iterator[dict]:
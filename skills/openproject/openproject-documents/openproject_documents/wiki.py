@@ -2,12 +2,12 @@
 
 from typing import Iterator, Optional
 
-from openproject_core import OpenProjectClient, paginate
+from openproject_core import OpenProjectClient, get_shared_client, paginate
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
 
 
 def get_wiki_page(page_id: int) -> dict:
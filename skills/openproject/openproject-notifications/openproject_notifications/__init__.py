@@ -9,6 +9,12 @@ from .notifications import (
     mark_all_read,
     mark_read,
     mark_unread,
+    alist_notifications,
+    aget_notification,
+    amark_read,
+    amark_unread,
+    amark_all_read,
+    aget_unread_count,
 )
 
 __all__ = [
@@ -20,4 +26,10 @@ __all__ = [
     "get_unread_count",
     "list_unread",
     "list_by_reason",
+    "alist_notifications",
+    "aget_notification",
+    "amark_read",
+    "amark_unread",
+    "amark_all_read",
+    "aget_unread_count",
 ]
@@ -1,13 +1,46 @@
 """OpenProject Notifications API operations."""
 
-from typing import Iterator, Optional
+from typing import AsyncIterator, Iterator, Optional
 
-from openproject_core import OpenProjectClient, build_filters, paginate
+from openproject_core import (
+    AsyncOpenProjectClient,
+    OpenProjectClient,
+    apaginate,
+    build_filters,
+    get_shared_async_client,
+    get_shared_client,
+    paginate,
+)
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
+
+
+def get_async_client() -> AsyncOpenProjectClient:
+    """Get the shared async client for the running event loop."""
+    return get_shared_async_client()
+
+
+def _list_params(read_status: Optional[bool], reason: Optional[str]) -> dict:
+    """Build query params for notification listings."""
+    filters = []
+
+    if read_status is not None:
+        filters.append({
+            "readIAN": {"operator": "=", "values": ["t" if read_status else "f"]}
+        })
+
+    if reason:
+        filters.append({
+            "reason": {"operator": "=", "values": [reason]}
+        })
+
+    params = {}
+    if filters:
+        params["filters"] = build_filters(filters)
+    return params
 
 
 def list_notifications(
@@ -25,23 +58,7 @@ def list_notifications(
         Notification dicts
     """
     with get_client() as client:
-        filters = []
-
-        if read_status is not None:
-            filters.append({
-                "readIAN": {"operator": "=", "values": ["t" if read_status else "f"]}
-            })
-
-        if reason:
-            filters.append({
-                "reason": {"operator": "=", "values": [reason]}
-            })
-
-        params = {}
-        if filters:
-            params["filters"] = build_filters(filters)
-
-        yield from paginate(client, "/notifications", params, page_size)
+        yield from paginate(client, "/notifications", _list_params(read_status, reason), page_size)
 
 
 def get_notification(notification_id: int) -> dict:
@@ -98,3 +115,52 @@ def list_by_reason(reason: str) -> Iterator[dict]:
         - scheduled: Date changed
     """
     return list_notifications(reason=reason)
+
+
+# Async twins
+
+
+async def alist_notifications(
+    read_status: Optional[bool] = None,
+    reason: Optional[str] = None,
+    page_size: int = 100
+) -> AsyncIterator[dict]:
+    """Async twin of list_notifications()."""
+    async with get_async_client() as client:
+        params = _list_params(read_status, reason)
+        async for notification in apaginate(client, "/notifications", params, page_size):
+            yield notification
+
+
+async def aget_notification(notification_id: int) -> dict:
+    """Async twin of get_notification()."""
+    async with get_async_client() as client:
+        return await client.get(f"/notifications/{notification_id}")
+
+
+async def amark_read(notification_id: int) -> dict:
+    """Async twin of mark_read()."""
+    async with get_async_client() as client:
+        return await client.post(f"/notifications/{notification_id}/read_ian", {})
+
+
+async def amark_unread(notification_id: int) -> dict:
+    """Async twin of mark_unread()."""
+    async with get_async_client() as client:
+        return await client.post(f"/notifications/{notification_id}/unread_ian", {})
+
+
+async def amark_all_read() -> dict:
+    """Async twin of mark_all_read()."""
+    async with get_async_client() as client:
+        return await client.post("/notifications/read_ian", {})
+
+
+async def aget_unread_count() -> int:
+    """Async twin of get_unread_count()."""
+    async with get_async_client() as client:
+        response = await client.get("/notifications", params={
+            "filters": build_filters([{"readIAN": {"operator": "=", "values": ["f"]}}]),
+            "pageSize": 1
+        })
+        return response.get("total", 0)
@@ -11,6 +11,13 @@ from .projects import (
     get_categories,
     get_types,
     toggle_favorite,
+    alist_projects,
+    aget_project,
+    acreate_project,
+    aupdate_project,
+    adelete_project,
+    aget_versions,
+    aget_types,
 )
 
 __all__ = [
@@ -24,4 +31,11 @@ __all__ = [
     "get_categories",
     "get_types",
     "toggle_favorite",
+    "alist_projects",
+    "aget_project",
+    "acreate_project",
+    "aupdate_project",
+    "adelete_project",
+    "aget_versions",
+    "aget_types",
 ]
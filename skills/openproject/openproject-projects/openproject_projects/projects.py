@@ -1,19 +1,47 @@
 """OpenProject Projects API operations."""
 
-from typing import Optional, Iterator, Union
+from typing import AsyncIterator, Optional, Iterator, Union
 
-from openproject_core import OpenProjectClient, build_filters, build_sort, paginate
+from openproject_core import (
+    AsyncOpenProjectClient,
+    OpenProjectClient,
+    apaginate,
+    build_filters,
+    build_sort,
+    get_shared_async_client,
+    get_shared_client,
+    paginate,
+)
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
+
+
+def get_async_client() -> AsyncOpenProjectClient:
+    """Get the shared async client for the running event loop."""
+    return get_shared_async_client()
+
+
+def _list_params(
+    filters: Optional[list[dict]],
+    sort_by: Optional[list[tuple[str, str]]]
+) -> dict:
+    """Build query params for project listings."""
+    params = {}
+    if filters:
+        params["filters"] = build_filters(filters)
+    if sort_by:
+        params["sortBy"] = build_sort(sort_by)
+    return params
 
 
 def list_projects(
     filters: Optional[list[dict]] = None,
     sort_by: Optional[list[tuple[str, str]]] = None,
-    page_size: int = 100
+    page_size: int = 100,
+    fields: Optional[list[str]] = None
 ) -> Iterator[dict]:
     """List all projects with optional filters.
 
@@ -25,18 +53,15 @@ def list_projects(
             - parent_id: parent project ID
 
         sort_by: Sort criteria, e.g. [("name", "asc")]
+        fields: Only download these properties, e.g. ["name", "identifier"]
 
     Yields:
         Project dicts
     """
     with get_client() as client:
-        params = {}
-        if filters:
-            params["filters"] = build_filters(filters)
-        if sort_by:
-            params["sortBy"] = build_sort(sort_by)
-
-        yield from paginate(client, "/projects", params, page_size)
+        yield from paginate(
+            client, "/projects", _list_params(filters, sort_by), page_size, fields=fields
+        )
 
 
 def get_project(project_id: Union[int, str]) -> dict:
@@ -73,6 +98,21 @@ def create_project(
     Returns:
         Created project dict
     """
+    data = _build_create_payload(name, identifier, description, public, parent_id, custom_fields)
+
+    with get_client() as client:
+        return client.post("/projects", data)
+
+
+def _build_create_payload(
+    name: str,
+    identifier: Optional[str],
+    description: Optional[str],
+    public: bool,
+    parent_id: Optional[int],
+    custom_fields: dict
+) -> dict:
+    """Build POST body for create_project / acreate_project."""
     data = {
         "name": name,
         "public": public
@@ -89,9 +129,7 @@ def create_project(
 
     # Add custom fields
     data.update(custom_fields)
-
-    with get_client() as client:
-        return client.post("/projects", data)
+    return data
 
 
 def update_project(project_id: Union[int, str], **updates) -> dict:
@@ -104,6 +142,14 @@ def update_project(project_id: Union[int, str], **updates) -> dict:
     Returns:
         Updated project dict
     """
+    data = _build_update_payload(updates)
+
+    with get_client() as client:
+        return client.patch(f"/projects/{project_id}", data)
+
+
+def _build_update_payload(updates: dict) -> dict:
+    """Build PATCH body for update_project / aupdate_project."""
     data = {}
 
     if "name" in updates:
@@ -124,8 +170,7 @@ def update_project(project_id: Union[int, str], **updates) -> dict:
         else:
             data["_links"]["parent"] = {"href": None}
 
-    with get_client() as client:
-        return client.patch(f"/projects/{project_id}", data)
+    return data
 
 
 def delete_project(project_id: Union[int, str]) -> dict:
@@ -209,3 +254,66 @@ def toggle_favorite(project_id: Union[int, str], favorite: bool = True) -> dict:
             return client.post(f"/projects/{project_id}/favorite")
         else:
             return client.delete(f"/projects/{project_id}/favorite")
+
+
+# Async twins
+
+
+async def alist_projects(
+    filters: Optional[list[dict]] = None,
+    sort_by: Optional[list[tuple[str, str]]] = None,
+    page_size: int = 100
+) -> AsyncIterator[dict]:
+    """Async twin of list_projects()."""
+    async with get_async_client() as client:
+        async for project in apaginate(client, "/projects", _list_params(filters, sort_by), page_size):
+            yield project
+
+
+async def aget_project(project_id: Union[int, str]) -> dict:
+    """Async twin of get_project()."""
+    async with get_async_client() as client:
+        return await client.get(f"/projects/{project_id}")
+
+
+async def acreate_project(
+    name: str,
+    identifier: Optional[str] = None,
+    description: Optional[str] = None,
+    public: bool = False,
+    parent_id: Optional[int] = None,
+    **custom_fields
+) -> dict:
+    """Async twin of create_project()."""
+    data = _build_create_payload(name, identifier, description, public, parent_id, custom_fields)
+
+    async with get_async_client() as client:
+        return await client.post("/projects", data)
+
+
+async def aupdate_project(project_id: Union[int, str], **updates) -> dict:
+    """Async twin of update_project()."""
+    data = _build_update_payload(updates)
+
+    async with get_async_client() as client:
+        return await client.patch(f"/projects/{project_id}", data)
+
+
+async def adelete_project(project_id: Union[int, str]) -> dict:
+    """Async twin of delete_project()."""
+    async with get_async_client() as client:
+        return await client.delete(f"/projects/{project_id}")
+
+
+async def aget_versions(project_id: Union[int, str]) -> AsyncIterator[dict]:
+    """Async twin of get_versions()."""
+    async with get_async_client() as client:
+        async for version in apaginate(client, f"/projects/{project_id}/versions"):
+            yield version
+
+
+async def aget_types(project_id: Union[int, str]) -> AsyncIterator[dict]:
+    """Async twin of get_types()."""
+    async with get_async_client() as client:
+        async for wp_type in apaginate(client, f"/projects/{project_id}/types"):
+            yield wp_type
@@ -2,12 +2,12 @@
 
 from typing import Iterator, List, Optional, Tuple
 
-from openproject_core import OpenProjectClient, build_filters, build_sort, paginate
+from openproject_core import OpenProjectClient, get_shared_client, build_filters, build_sort, paginate
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
 
 
 def list_queries(
@@ -1,6 +1,11 @@
 """OpenProject Time - Time tracking operations."""
 
 from .time_entries import (
+    acreate_time_entry,
+    adelete_time_entry,
+    aget_time_entry,
+    alist_time_entries,
+    aupdate_time_entry,
     create_time_entry,
     delete_time_entry,
     get_activity,
@@ -28,4 +33,9 @@ __all__ = [
     "get_work_package_time",
     "get_work_packages_time",
     "parse_duration",
+    "alist_time_entries",
+    "aget_time_entry",
+    "acreate_time_entry",
+    "aupdate_time_entry",
+    "adelete_time_entry",
 ]
@@ -2,9 +2,22 @@
 
 import re
 from datetime import date
-from typing import Iterator, List, Optional, Tuple, Union
-
-from openproject_core import OpenProjectClient, build_filters, build_sort, paginate, extract_id_from_href
+from typing import AsyncIterator, Iterator, List, Optional, Tuple, Union
+
+from openproject_core import (
+    AsyncOpenProjectClient,
+    OpenProjectClient,
+    TimeEntryRecord,
+    apaginate,
+    build_filters,
+    build_sort,
+    cached_reference,
+    extract_id_from_href,
+    get_shared_async_client,
+    get_shared_client,
+    paginate,
+    to_records,
+)
 
 
 def parse_duration(duration_str: str) -> float:
@@ -51,15 +64,37 @@ def parse_duration(duration_str: str) -> float:
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
+
+
+def get_async_client() -> AsyncOpenProjectClient:
+    """Get the shared async client for the running event loop."""
+    return get_shared_async_client()
+
+
+def _list_params(
+    filters: Optional[List[dict]],
+    sort_by: Optional[List[Tuple[str, str]]]
+) -> dict:
+    """Build query params for time entry listings."""
+    params = {}
+    if filters:
+        params["filters"] = build_filters(filters)
+    if sort_by:
+        params["sortBy"] = build_sort(sort_by)
+    return params
 
 
 def list_time_entries(
     filters: Optional[List[dict]] = None,
     sort_by: Optional[List[Tuple[str, str]]] = None,
-    page_size: int = 100
-) -> Iterator[dict]:
+    page_size: int = 100,
+    workers: int = 1,
+    adaptive: bool = False,
+    as_records: bool = False,
+    fields: Optional[List[str]] = None
+) -> Iterator[Union[dict, TimeEntryRecord]]:
     """List time entries with filters.
 
     Valid filters:
@@ -77,17 +112,21 @@ def list_time_entries(
     Example: [{"entity_type": {"operator": "=", "values": ["WorkPackage"]}},
               {"entity_id": {"operator": "=", "values": ["123"]}}]
 
+    Set workers > 1 to fetch pages concurrently on large scans and
+    adaptive=True to tune page size from the server limit. as_records=True
+    yields compact TimeEntryRecord objects instead of dicts; fields=[...]
+    downloads only the listed properties/links (`select`).
+
     Yields:
-        Time entry dicts
+        Time entry dicts (or TimeEntryRecord)
     """
     with get_client() as client:
-        params = {}
-        if filters:
-            params["filters"] = build_filters(filters)
-        if sort_by:
-            params["sortBy"] = build_sort(sort_by)
-
-        yield from paginate(client, "/time_entries", params, page_size)
+        params = _list_params(filters, sort_by)
+        items = paginate(
+            client, "/time_entries", params, page_size,
+            workers=workers, adaptive=adaptive, fields=fields
+        )
+        yield from to_records(items, TimeEntryRecord) if as_records else items
 
 
 def get_time_entry(entry_id: int) -> dict:
@@ -117,6 +156,21 @@ def create_time_entry(
     Returns:
         Created time entry dict
     """
+    data = _build_create_payload(work_package_id, hours, activity_id, comment, spent_on, user_id)
+
+    with get_client() as client:
+        return client.post("/time_entries", data)
+
+
+def _build_create_payload(
+    work_package_id: int,
+    hours: float,
+    activity_id: Optional[int],
+    comment: Optional[str],
+    spent_on: Optional[Union[str, date]],
+    user_id: Optional[int]
+) -> dict:
+    """Build POST body for create_time_entry / acreate_time_entry."""
     # Format hours as ISO duration
     hours_str = f"PT{hours}H"
 
@@ -139,8 +193,7 @@ def create_time_entry(
     if user_id:
         data["_links"]["user"] = {"href": f"/users/{user_id}"}
 
-    with get_client() as client:
-        return client.post("/time_entries", data)
+    return data
 
 
 def update_time_entry(entry_id: int, **updates) -> dict:
@@ -148,6 +201,14 @@ def update_time_entry(entry_id: int, **updates) -> dict:
 
     Updatable: hours, comment, spent_on, activity_id, work_package_id
     """
+    data = _build_update_payload(updates)
+
+    with get_client() as client:
+        return client.patch(f"/time_entries/{entry_id}", data)
+
+
+def _build_update_payload(updates: dict) -> dict:
+    """Build PATCH body for update_time_entry / aupdate_time_entry."""
     data = {}
     links = {}
 
@@ -169,8 +230,7 @@ def update_time_entry(entry_id: int, **updates) -> dict:
     if links:
         data["_links"] = links
 
-    with get_client() as client:
-        return client.patch(f"/time_entries/{entry_id}", data)
+    return data
 
 
 def delete_time_entry(entry_id: int) -> dict:
@@ -185,8 +245,8 @@ def list_activities() -> Iterator[dict]:
     Common activities: Development, Design, Testing, Management, etc.
     """
     with get_client() as client:
-        # Activities are available via schema
-        schema = client.get("/time_entries/schema")
+        # Activities are available via schema (reference cache, if enabled)
+        schema = cached_reference(client, "activities", "/time_entries/schema")
         activity_schema = schema.get("activity", {})
         allowed = activity_schema.get("_links", {}).get("allowedValues", [])
 
@@ -271,3 +331,52 @@ def get_work_packages_time(wp_ids: List[int]) -> dict[int, List[dict]]:
             result[entry_wp_id].append(entry)
 
     return result
+
+
+# Async twins
+
+
+async def alist_time_entries(
+    filters: Optional[List[dict]] = None,
+    sort_by: Optional[List[Tuple[str, str]]] = None,
+    page_size: int = 100
+) -> AsyncIterator[dict]:
+    """Async twin of list_time_entries()."""
+    async with get_async_client() as client:
+        async for entry in apaginate(client, "/time_entries", _list_params(filters, sort_by), page_size):
+            yield entry
+
+
+async def aget_time_entry(entry_id: int) -> dict:
+    """Async twin of get_time_entry()."""
+    async with get_async_client() as client:
+        return await client.get(f"/time_entries/{entry_id}")
+
+
+async def acreate_time_entry(
+    work_package_id: int,
+    hours: float,
+    activity_id: Optional[int] = None,
+    comment: Optional[str] = None,
+    spent_on: Optional[Union[str, date]] = None,
+    user_id: Optional[int] = None
+) -> dict:
+    """Async twin of create_time_entry()."""
+    data = _build_create_payload(work_package_id, hours, activity_id, comment, spent_on, user_id)
+
+    async with get_async_client() as client:
+        return await client.post("/time_entries", data)
+
+
+async def aupdate_time_entry(entry_id: int, **updates) -> dict:
+    """Async twin of update_time_entry()."""
+    data = _build_update_payload(updates)
+
+    async with get_async_client() as client:
+        return await client.patch(f"/time_entries/{entry_id}", data)
+
+
+async def adelete_time_entry(entry_id: int) -> dict:
+    """Async twin of delete_time_entry()."""
+    async with get_async_client() as client:
+        return await client.delete(f"/time_entries/{entry_id}")
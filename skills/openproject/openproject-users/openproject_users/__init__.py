@@ -9,6 +9,13 @@ from .users import (
     delete_user,
     lock_user,
     unlock_user,
+    alist_users,
+    aget_user,
+    aget_users,
+    aget_current_user,
+    acreate_user,
+    aupdate_user,
+    adelete_user,
 )
 from .groups import (
     list_groups,
@@ -48,4 +55,11 @@ __all__ = [
     "create_membership",
     "update_membership",
     "delete_membership",
+    "alist_users",
+    "aget_user",
+    "aget_users",
+    "aget_current_user",
+    "acreate_user",
+    "aupdate_user",
+    "adelete_user",
 ]
@@ -2,12 +2,12 @@
 
 from typing import Iterator, List, Optional
 
-from openproject_core import OpenProjectClient, paginate
+from openproject_core import OpenProjectClient, get_shared_client, paginate
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
 
 
 def list_groups(page_size: int = 100) -> Iterator[dict]:
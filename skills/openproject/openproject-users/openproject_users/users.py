@@ -1,19 +1,37 @@
 """OpenProject Users API operations."""
 
-from typing import Iterator, Optional, Union
-
-from openproject_core import OpenProjectClient, build_filters, paginate
+from typing import AsyncIterator, Iterable, Iterator, Optional, Union
+
+from openproject_core import (
+    AsyncOpenProjectClient,
+    OpenProjectClient,
+    UserRecord,
+    apaginate,
+    build_filters,
+    gather_limited,
+    get_shared_async_client,
+    get_shared_client,
+    paginate,
+    to_records,
+)
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
+
+
+def get_async_client() -> AsyncOpenProjectClient:
+    """Get the shared async client for the running event loop."""
+    return get_shared_async_client()
 
 
 def list_users(
     filters: Optional[list] = None,
-    page_size: int = 100
-) -> Iterator[dict]:
+    page_size: int = 100,
+    as_records: bool = False,
+    fields: Optional[list[str]] = None
+) -> Iterator[Union[dict, UserRecord]]:
     """List users.
 
     Requires: Admin or manage_user permission
@@ -24,14 +42,17 @@ def list_users(
         - name: Name or email search
         - login: User login
 
+    Pass fields=["login", "name"] to download only those properties.
+
     Yields:
-        User dicts
+        User dicts (or compact UserRecord objects with as_records=True)
     """
     with get_client() as client:
         params = {}
         if filters:
             params["filters"] = build_filters(filters)
-        yield from paginate(client, "/users", params, page_size)
+        items = paginate(client, "/users", params, page_size, fields=fields)
+        yield from to_records(items, UserRecord) if as_records else items
 
 
 def get_user(user_id: Union[int, str]) -> dict:
@@ -68,6 +89,22 @@ def create_user(
     Returns:
         Created user dict
     """
+    data = _build_create_payload(email, login, first_name, last_name, password, status, admin)
+
+    with get_client() as client:
+        return client.post("/users", data)
+
+
+def _build_create_payload(
+    email: str,
+    login: Optional[str],
+    first_name: Optional[str],
+    last_name: Optional[str],
+    password: Optional[str],
+    status: str,
+    admin: bool
+) -> dict:
+    """Build POST body for create_user / acreate_user."""
     data = {
         "email": email,
         "login": login or email.split("@")[0],
@@ -82,8 +119,7 @@ def create_user(
     if password:
         data["password"] = password
 
-    with get_client() as client:
-        return client.post("/users", data)
+    return data
 
 
 def update_user(user_id: int, **updates) -> dict:
@@ -91,6 +127,14 @@ def update_user(user_id: int, **updates) -> dict:
 
     Updatable: email, login, firstName, lastName, admin
     """
+    data = _build_update_payload(updates)
+
+    with get_client() as client:
+        return client.patch(f"/users/{user_id}", data)
+
+
+def _build_update_payload(updates: dict) -> dict:
+    """Build PATCH body for update_user / aupdate_user."""
     field_mapping = {
         "email": "email",
         "login": "login",
@@ -103,9 +147,7 @@ def update_user(user_id: int, **updates) -> dict:
     for arg, api_field in field_mapping.items():
         if arg in updates:
             data[api_field] = updates[arg]
-
-    with get_client() as client:
-        return client.patch(f"/users/{user_id}", data)
+    return data
 
 
 def delete_user(user_id: int) -> dict:
@@ -124,3 +166,73 @@ def unlock_user(user_id: int) -> dict:
     """Unlock user account."""
     with get_client() as client:
         return client.delete(f"/users/{user_id}/lock")
+
+
+# Async twins
+
+
+async def alist_users(
+    filters: Optional[list] = None,
+    page_size: int = 100
+) -> AsyncIterator[dict]:
+    """Async twin of list_users()."""
+    async with get_async_client() as client:
+        params = {}
+        if filters:
+            params["filters"] = build_filters(filters)
+        async for user in apaginate(client, "/users", params, page_size):
+            yield user
+
+
+async def aget_user(user_id: Union[int, str]) -> dict:
+    """Async twin of get_user()."""
+    async with get_async_client() as client:
+        return await client.get(f"/users/{user_id}")
+
+
+async def aget_users(user_ids: Iterable[Union[int, str]], concurrency: int = 10) -> list[dict]:
+    """Fetch several users concurrently.
+
+    Args:
+        user_ids: User IDs
+        concurrency: Maximum requests in flight (default 10)
+
+    Returns:
+        User dicts in the same order as user_ids
+    """
+    return await gather_limited((aget_user(user_id) for user_id in user_ids), concurrency)
+
+
+async def aget_current_user() -> dict:
+    """Async twin of get_current_user()."""
+    return await aget_user("me")
+
+
+async def acreate_user(
+    email: str,
+    login: Optional[str] = None,
+    first_name: Optional[str] = None,
+    last_name: Optional[str] = None,
+    password: Optional[str] = None,
+    status: str = "invited",
+    admin: bool = False
+) -> dict:
+    """Async twin of create_user()."""
+    data = _build_create_payload(email, login, first_name, last_name, password, status, admin)
+
+    async with get_async_client() as client:
+        return await client.post("/users", data)
+
+
+async def aupdate_user(user_id: int, **updates) -> dict:
+    """Async twin of update_user()."""
+    data = _build_update_payload(updates)
+
+    async with get_async_client() as client:
+        return await client.patch(f"/users/{user_id}", data)
+
+
+async def adelete_user(user_id: int) -> dict:
+    """Async twin of delete_user()."""
+    async with get_async_client() as client:
+        return await client.delete(f"/users/{user_id}")
@@ -7,7 +7,19 @@ from .work_packages import (
     update_work_package,
     delete_work_package,
     get_schema,
+    alist_work_packages,
+    aget_work_package,
+    aget_work_packages,
+    acreate_work_package,
+    aupdate_work_package,
+    adelete_work_package,
+    aget_schema,
 )
+from .bulk import bulk_upsert_work_packages, BulkItemResult
+from .lock_versions import LockVersionCache, get_lock_version_cache
+from .sync import sync_work_packages, SyncResult, WorkPackageStore, get_work_package_store
+from .mirror import query_work_packages
+from .graph import WorkPackageGraph, load_work_package_graph
 from .activities import (
     list_activities,
     add_comment,
@@ -27,6 +39,17 @@ __all__ = [
     "update_work_package",
     "delete_work_package",
     "get_schema",
+    "bulk_upsert_work_packages",
+    "BulkItemResult",
+    "LockVersionCache",
+    "get_lock_version_cache",
+    "sync_work_packages",
+    "SyncResult",
+    "WorkPackageStore",
+    "get_work_package_store",
+    "query_work_packages",
+    "WorkPackageGraph",
+    "load_work_package_graph",
     "list_activities",
     "add_comment",
     "get_activity",
@@ -34,4 +57,11 @@ __all__ = [
     "create_relation",
     "delete_relation",
     "get_relation",
+    "alist_work_packages",
+    "aget_work_package",
+    "aget_work_packages",
+    "acreate_work_package",
+    "aupdate_work_package",
+    "adelete_work_package",
+    "aget_schema",
 ]
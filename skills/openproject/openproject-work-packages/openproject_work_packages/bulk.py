@@ -0,0 +1,200 @@
+"""Bulk work package create/update with bounded concurrency."""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator, Optional, TypedDict
+
+import httpx
+
+from openproject_core import (
+    AuthenticationError,
+    OpenProjectAPIError,
+    OpenProjectClient,
+    OpenProjectError,
+    fetch_many,
+    get_shared_client,
+)
+
+from .lock_versions import get_lock_version_cache
+from .work_packages import _build_create_payload, _build_update_payload
+
+# Concurrent writes in bulk_upsert_work_packages()
+BULK_WORKERS = 8
+
+# Re-read + re-apply attempts after a 409 (lockVersion) conflict
+CONFLICT_RETRIES = 2
+
+# create_work_package() arguments accepted in create items (others are custom fields)
+_CREATE_FIELDS = (
+    "type_id", "description", "assignee_id", "status_id", "priority_id",
+    "parent_id", "start_date", "due_date", "estimated_hours",
+)
+
+
+class BulkItemResult(TypedDict):
+    """Outcome of one bulk_upsert_work_packages() item."""
+    index: int
+    action: str
+    id: Optional[int]
+    ok: bool
+    work_package: Optional[dict]
+    error: Optional[str]
+    status_code: Optional[int]
+    attempts: int
+
+
+def get_client() -> OpenProjectClient:
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
+
+
+def bulk_upsert_work_packages(
+    items: Iterable[dict],
+    project_id: Optional[int] = None,
+    workers: int = BULK_WORKERS,
+    conflict_retries: int = CONFLICT_RETRIES
+) -> Iterator[BulkItemResult]:
+    """Create and update many work packages concurrently.
+
+    Items with an "id" are updates (same keys as update_work_package());
+    others are creates (same keys as create_work_package(), "project_id"
+    optional when given here). lockVersions of updates come from the
+    lockVersion cache or are prefetched with a few `id =` filter requests
+    instead of one GET per item, then writes run on a pool of `workers`
+    threads.
+
+    A 409 conflict re-reads the work package and re-applies the item, up to
+    conflict_retries times; items that carry their own "lockVersion" are
+    not retried (the caller asked for that exact version).
+
+    Args:
+        items: Work package dicts, e.g. rows of a spreadsheet
+        project_id: Default project for creates
+        workers: Concurrent writes (default 8)
+        conflict_retries: Retries per update after a 409 (default 2)
+
+    Yields:
+        BulkItemResult per item, in completion order (`index` is the
+        position in items); failures are reported, not raised
+
+    Raises:
+        AuthenticationError: Invalid API key (aborts the batch)
+    """
+    items = list(items)
+    workers = max(1, workers)
+    with get_client() as client:
+        lock_versions = _prefetch_lock_versions(client, items, workers)
+
+        executor = ThreadPoolExecutor(max_workers=workers)
+        pending: set[Future] = set()
+        try:
+            for index, item in enumerate(items):
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+                pending.add(executor.submit(
+                    _upsert_one, client, index, item, project_id, lock_versions, conflict_retries
+                ))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _prefetch_lock_versions(client: OpenProjectClient, items: list[dict], workers: int) -> dict[int, int]:
+    """lockVersion by ID for update items that do not carry one (cache first)."""
+    locks = get_lock_version_cache()
+    versions: dict[int, int] = {}
+    missing: dict[int, None] = {}
+    for item in items:
+        if item.get("id") and "lockVersion" not in item:
+            wp_id = int(item["id"])
+            if wp_id in versions or wp_id in missing:
+                continue
+            version = locks.get(wp_id)
+            if version is None:
+                missing[wp_id] = None
+            else:
+                versions[wp_id] = version
+    if missing:
+        found = fetch_many(client, "work_packages", list(missing), workers=workers, fields=["lockVersion"])
+        for wp in found["items"].values():
+            locks.remember(wp)
+            versions[wp["id"]] = wp.get("lockVersion")
+    return versions
+
+
+def _upsert_one(
+    client: OpenProjectClient,
+    index: int,
+    item: dict,
+    project_id: Optional[int],
+    lock_versions: dict[int, int],
+    conflict_retries: int
+) -> BulkItemResult:
+    """Apply one item, capturing any error in the result."""
+    fields = dict(item)
+    wp_id = fields.pop("id", None)
+    result = BulkItemResult(
+        index=index, action="update" if wp_id else "create", id=int(wp_id) if wp_id else None,
+        ok=False, work_package=None, error=None, status_code=None, attempts=0
+    )
+    try:
+        if wp_id:
+            wp = _apply_update(client, int(wp_id), fields, lock_versions, conflict_retries, result)
+        else:
+            wp = _apply_create(client, fields, project_id, result)
+        get_lock_version_cache().remember(wp)
+        result.update(ok=True, id=wp.get("id", result["id"]), work_package=wp)
+    except AuthenticationError:
+        raise
+    except OpenProjectAPIError as e:
+        result.update(error=e.message, status_code=e.status_code)
+    except (OpenProjectError, httpx.HTTPError, ValueError) as e:
+        result["error"] = str(e)
+    return result
+
+
+def _apply_update(
+    client: OpenProjectClient,
+    wp_id: int,
+    fields: dict,
+    lock_versions: dict[int, int],
+    conflict_retries: int,
+    result: BulkItemResult
+) -> dict:
+    explicit = "lockVersion" in fields
+    if not explicit:
+        if wp_id not in lock_versions:
+            raise OpenProjectAPIError(404, "Work package not found or not visible")
+        fields["lockVersion"] = lock_versions[wp_id]
+
+    attempt = 0
+    while True:
+        result["attempts"] += 1
+        try:
+            return client.patch(f"/work_packages/{wp_id}", _build_update_payload(fields))
+        except OpenProjectAPIError as e:
+            if e.status_code != 409 or explicit or attempt >= conflict_retries:
+                raise
+        attempt += 1
+        get_lock_version_cache().stats.incr("refreshed")
+        fields["lockVersion"] = client.get(f"/work_packages/{wp_id}").get("lockVersion")
+
+
+def _apply_create(
+    client: OpenProjectClient,
+    fields: dict,
+    project_id: Optional[int],
+    result: BulkItemResult
+) -> dict:
+    target = fields.pop("project_id", None) or project_id
+    subject = fields.pop("subject", None)
+    if not target or not subject:
+        raise ValueError("Create items need 'subject' and 'project_id' (item or argument)")
+    known = {name: fields.pop(name, None) for name in _CREATE_FIELDS}
+    data = _build_create_payload(target, subject, custom_fields=fields, **known)
+    result["attempts"] = 1
+    return client.post(f"/projects/{target}/work_packages", data)
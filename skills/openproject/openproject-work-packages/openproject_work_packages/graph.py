@@ -0,0 +1,315 @@
+"""Work package hierarchy and relation graph.
+
+load_work_package_graph() replaces per-node list_relations()/get_work_package()
+recursion: work packages (with parent links) come from one paged listing,
+relations from `/relations` filtered by chunks of involved IDs fetched
+concurrently. The result is indexed in memory for traversals (descendants,
+cycles, critical path) without further requests.
+"""
+
+import re
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Iterable, Optional
+
+from openproject_core import (
+    OpenProjectClient,
+    build_filters,
+    extract_id_from_href,
+    fetch_many,
+    get_shared_client,
+    link_id,
+    paginate,
+)
+
+from .sync import ALL_STATUSES
+
+# Work package IDs per `involved` filter (keeps request URLs short)
+GRAPH_CHUNK_SIZE = 100
+
+# Work package fields needed for hierarchy and scheduling
+GRAPH_FIELDS = ["subject", "parent", "startDate", "dueDate", "duration"]
+
+# Relation types stored under their forward name, with from/to swapped
+REVERSE_TYPES = {
+    "follows": "precedes",
+    "blocked": "blocks",
+    "partof": "includes",
+    "required": "requires",
+    "duplicated": "duplicates",
+}
+
+_DAYS = re.compile(r"^P(\d+)D$")
+
+
+def get_client() -> OpenProjectClient:
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
+
+
+def _duration_days(wp: dict) -> int:
+    """Working duration in days: `duration` (P3D), else start..due, else 1."""
+    match = _DAYS.match(wp.get("duration") or "")
+    if match:
+        return int(match.group(1))
+    start, due = wp.get("startDate"), wp.get("dueDate")
+    if start and due:
+        return max(1, (date.fromisoformat(due) - date.fromisoformat(start)).days + 1)
+    return 1
+
+
+class WorkPackageGraph:
+    """In-memory parent/child and relation indexes.
+
+    Relations are normalized to their forward type: "A follows B" is stored
+    as precedes[B] -> A, "A blocked by B" as blocks[B] -> A. Work packages
+    outside the loaded set can appear as relation endpoints.
+    """
+
+    def __init__(self, work_packages: Iterable[dict] = (), relations: Iterable[dict] = ()):
+        """Build indexes.
+
+        Args:
+            work_packages: Work package dicts (parent taken from `_links.parent`)
+            relations: Relation dicts from the API
+        """
+        self.nodes: dict[int, dict] = {}
+        self.parent: dict[int, int] = {}
+        self.children: dict[int, list[int]] = defaultdict(list)
+        self.edges: dict[str, dict[int, set[int]]] = defaultdict(lambda: defaultdict(set))
+        self.reverse: dict[str, dict[int, set[int]]] = defaultdict(lambda: defaultdict(set))
+        self.lags: dict[tuple[int, int], int] = {}
+        self.relations: dict[int, dict] = {}
+
+        for wp in work_packages:
+            self.add_work_package(wp)
+        for relation in relations:
+            self.add_relation(relation)
+
+    def add_work_package(self, wp: dict) -> None:
+        """Index one work package and its parent link."""
+        wp_id = wp["id"]
+        self.nodes[wp_id] = wp
+        parent_id = link_id(wp, "parent")
+        if parent_id is not None and self.parent.get(wp_id) != parent_id:
+            self.parent[wp_id] = parent_id
+            self.children[parent_id].append(wp_id)
+
+    def add_relation(self, relation: dict) -> None:
+        """Index one relation (duplicates by ID are ignored)."""
+        if relation.get("id") in self.relations:
+            return
+        links = relation.get("_links", {})
+        source = extract_id_from_href((links.get("from") or {}).get("href"))
+        target = extract_id_from_href((links.get("to") or {}).get("href"))
+        kind = relation.get("type")
+        if source is None or target is None or not kind:
+            return
+        if kind in REVERSE_TYPES:
+            kind, source, target = REVERSE_TYPES[kind], target, source
+        self.relations[relation.get("id")] = relation
+        self.edges[kind][source].add(target)
+        self.reverse[kind][target].add(source)
+        if kind == "precedes":
+            self.lags[(source, target)] = relation.get("lag") or 0
+
+    def blocks(self, wp_id: int) -> set[int]:
+        """Work packages blocked by wp_id."""
+        return set(self.edges["blocks"].get(wp_id, ()))
+
+    def blocked_by(self, wp_id: int) -> set[int]:
+        """Work packages blocking wp_id."""
+        return set(self.reverse["blocks"].get(wp_id, ()))
+
+    def precedes(self, wp_id: int) -> set[int]:
+        """Successors of wp_id (work packages that follow it)."""
+        return set(self.edges["precedes"].get(wp_id, ()))
+
+    def follows(self, wp_id: int) -> set[int]:
+        """Predecessors of wp_id."""
+        return set(self.reverse["precedes"].get(wp_id, ()))
+
+    def ancestors(self, wp_id: int) -> list[int]:
+        """Parent chain, nearest first."""
+        chain, seen = [], {wp_id}
+        while wp_id in self.parent and self.parent[wp_id] not in seen:
+            wp_id = self.parent[wp_id]
+            seen.add(wp_id)
+            chain.append(wp_id)
+        return chain
+
+    def descendants(self, wp_id: int) -> list[int]:
+        """All children, grandchildren, ... (breadth-first)."""
+        found, seen = [], {wp_id}
+        queue = deque(self.children.get(wp_id, ()))
+        while queue:
+            child = queue.popleft()
+            if child in seen:
+                continue
+            seen.add(child)
+            found.append(child)
+            queue.extend(self.children.get(child, ()))
+        return found
+
+    def _adjacency(self, kind: str) -> dict[int, set[int]]:
+        if kind == "parent":
+            return {parent: set(children) for parent, children in self.children.items()}
+        return self.edges.get(kind, {})
+
+    def find_cycles(self, kind: str = "precedes") -> list[list[int]]:
+        """Cycles in one edge kind ("precedes", "blocks", "requires", "parent", ...).
+
+        Returns:
+            Each cycle's work package IDs (strongly connected components with
+            more than one node, or self-loops), sorted
+        """
+        adjacency = self._adjacency(kind)
+        index: dict[int, int] = {}
+        low: dict[int, int] = {}
+        stack: list[int] = []
+        on_stack: set[int] = set()
+        cycles: list[list[int]] = []
+        counter = 0
+
+        # Iterative Tarjan (deep precedes chains would exceed the recursion limit)
+        for root in list(adjacency):
+            if root in index:
+                continue
+            work = [(root, iter(adjacency.get(root, ())))]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, successors = work[-1]
+                advanced = False
+                for succ in successors:
+                    if succ not in index:
+                        index[succ] = low[succ] = counter
+                        counter += 1
+                        stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, iter(adjacency.get(succ, ()))))
+                        advanced = True
+                        break
+                    if succ in on_stack:
+                        low[node] = min(low[node], index[succ])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    low[work[-1][0]] = min(low[work[-1][0]], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in adjacency.get(node, ()):
+                        cycles.append(sorted(component))
+        return sorted(cycles)
+
+    def critical_path(self) -> dict:
+        """Longest chain through precedes relations, weighted by duration and lag.
+
+        Node weight is the work package's duration in days (duration, else
+        start..due, else 1; unknown work packages count 1), plus each
+        relation's lag.
+
+        Returns:
+            {"path": [IDs in order], "days": total}
+
+        Raises:
+            ValueError: If precedes relations form a cycle
+        """
+        successors = self.edges.get("precedes", {})
+        nodes = set(successors) | {t for targets in successors.values() for t in targets}
+        indegree = {node: 0 for node in nodes}
+        for targets in successors.values():
+            for target in targets:
+                indegree[target] += 1
+
+        weight = {node: _duration_days(self.nodes[node]) if node in self.nodes else 1 for node in nodes}
+        best = dict(weight)
+        previous: dict[int, int] = {}
+        queue = deque(sorted(node for node, degree in indegree.items() if degree == 0))
+        visited = 0
+        while queue:
+            node = queue.popleft()
+            visited += 1
+            for target in sorted(successors.get(node, ())):
+                length = best[node] + self.lags.get((node, target), 0) + weight[target]
+                if length > best[target]:
+                    best[target] = length
+                    previous[target] = node
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    queue.append(target)
+        if visited < len(nodes):
+            raise ValueError(f"precedes relations contain cycles: {self.find_cycles('precedes')}")
+        if not nodes:
+            return {"path": [], "days": 0}
+
+        end = max(sorted(nodes), key=lambda node: best[node])
+        path = [end]
+        while path[-1] in previous:
+            path.append(previous[path[-1]])
+        return {"path": path[::-1], "days": best[end]}
+
+
+def _relations_for(client: OpenProjectClient, ids: list[int]) -> list[dict]:
+    params = {"filters": build_filters([{"involved": {"operator": "=", "values": [str(i) for i in ids]}}])}
+    return list(paginate(client, "/relations", params, page_size=client.get_max_page_size(), adaptive=True))
+
+
+def load_work_package_graph(
+    project_id: Optional[int] = None,
+    wp_ids: Optional[Iterable[int]] = None,
+    workers: int = 4,
+    chunk_size: int = GRAPH_CHUNK_SIZE
+) -> WorkPackageGraph:
+    """Load a project's (or some work packages') hierarchy and relations.
+
+    Requests: the work package listing (a few pages, trimmed to GRAPH_FIELDS)
+    plus one `/relations` query per chunk of IDs, run concurrently.
+
+    Args:
+        project_id: Load every work package (open and closed) of this project
+        wp_ids: Or only these work packages
+        workers: Concurrent relation queries (default 4)
+        chunk_size: Work package IDs per relation query (default 100)
+
+    Returns:
+        WorkPackageGraph
+
+    Raises:
+        ValueError: If neither project_id nor wp_ids is given
+    """
+    if project_id is None and wp_ids is None:
+        raise ValueError("project_id or wp_ids is required")
+
+    with get_client() as client:
+        if wp_ids is not None:
+            work_packages = list(fetch_many(client, "work_packages", wp_ids, workers=workers, fields=GRAPH_FIELDS)["items"].values())
+        else:
+            params = {"filters": build_filters([ALL_STATUSES])}
+            work_packages = list(paginate(
+                client, f"/projects/{project_id}/work_packages", params,
+                page_size=client.get_max_page_size(), adaptive=True, fields=GRAPH_FIELDS
+            ))
+
+        graph = WorkPackageGraph(work_packages)
+        ids = sorted(graph.nodes)
+        chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        if len(chunks) > 1 and workers > 1:
+            with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+                results = list(executor.map(lambda chunk: _relations_for(client, chunk), chunks))
+        else:
+            results = [_relations_for(client, chunk) for chunk in chunks]
+        for relations in results:
+            for relation in relations:
+                graph.add_relation(relation)
+        return graph
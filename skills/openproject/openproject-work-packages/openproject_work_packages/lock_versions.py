@@ -0,0 +1,88 @@
+"""Remembered work package lockVersions.
+
+Every work package read through this package (get, list, create, update,
+bulk) records its lockVersion here, so a later update can send it directly
+instead of GETting the work package first. A stale entry only costs a 409,
+after which the update re-reads once and retries.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Iterable, Iterator, Optional
+
+from openproject_core.http_cache import CacheStats
+
+# Work packages remembered before the least recently used are dropped
+LOCK_CACHE_SIZE = 10_000
+
+
+class LockVersionCache:
+    """Thread-safe LRU of work package ID -> last seen lockVersion.
+
+    Stats: hits/misses (lookups), stores, refreshed (stale entries found by a
+    409), invalidations, evictions.
+    """
+
+    def __init__(self, max_entries: int = LOCK_CACHE_SIZE):
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._versions: "OrderedDict[int, int]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def get(self, wp_id: int) -> Optional[int]:
+        """Remembered lockVersion, or None."""
+        with self._lock:
+            version = self._versions.get(int(wp_id))
+            if version is not None:
+                self._versions.move_to_end(int(wp_id))
+        self.stats.incr("hits" if version is not None else "misses")
+        return version
+
+    def put(self, wp_id: int, lock_version: int) -> None:
+        """Remember a lockVersion."""
+        evicted = 0
+        with self._lock:
+            self._versions[int(wp_id)] = lock_version
+            self._versions.move_to_end(int(wp_id))
+            while len(self._versions) > self.max_entries:
+                self._versions.popitem(last=False)
+                evicted += 1
+        self.stats.incr("stores")
+        if evicted:
+            self.stats.incr("evictions", evicted)
+
+    def remember(self, wp: dict) -> dict:
+        """Record a work package response's lockVersion (if present); returns wp."""
+        if isinstance(wp, dict) and wp.get("id") is not None and isinstance(wp.get("lockVersion"), int):
+            self.put(wp["id"], wp["lockVersion"])
+        return wp
+
+    def remember_all(self, wps: Iterable[dict]) -> Iterator[dict]:
+        """remember() each work package while passing it through."""
+        for wp in wps:
+            yield self.remember(wp)
+
+    def forget(self, wp_id: int) -> None:
+        """Drop one entry (e.g. after a delete)."""
+        with self._lock:
+            removed = self._versions.pop(int(wp_id), None) is not None
+        if removed:
+            self.stats.incr("invalidations")
+
+    def clear(self) -> None:
+        """Drop all entries (stats are kept)."""
+        with self._lock:
+            removed = len(self._versions)
+            self._versions.clear()
+        self.stats.incr("invalidations", removed)
+
+
+_cache = LockVersionCache()
+
+
+def get_lock_version_cache() -> LockVersionCache:
+    """Process-wide lockVersion cache used by update_work_package() and bulk upserts."""
+    return _cache
@@ -0,0 +1,138 @@
+"""Answer common work package questions from the local sync store.
+
+query_work_packages() runs "open bugs assigned to X in version Y" style
+filters as indexed SQLite queries over the store kept by
+sync_work_packages(), refreshing it incrementally when it is older than
+max_age. server=True sends the same filters to the API instead.
+"""
+
+import time
+from itertools import islice
+from typing import Iterable, Optional, Union
+
+from openproject_core import (
+    OpenProjectClient,
+    cached_collection,
+    get_shared_client,
+    load_config,
+)
+
+from .sync import ALL_STATUSES, WorkPackageStore, get_work_package_store, sync_work_packages
+from .work_packages import list_work_packages
+
+# Seconds a synced project is answered locally before an incremental sync
+MIRROR_MAX_AGE = 60.0
+
+IdFilter = Optional[Union[int, Iterable[int]]]
+
+# query_work_packages() argument -> API filter name
+_API_FILTERS = {
+    "type_id": "type",
+    "assignee_id": "assignee",
+    "version_id": "version",
+    "parent_id": "parent",
+}
+
+
+def get_client() -> OpenProjectClient:
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
+
+
+def _ids(value: IdFilter) -> Optional[list[int]]:
+    if value is None:
+        return None
+    if isinstance(value, (int, str)):
+        return [int(value)]
+    return [int(v) for v in value]
+
+
+def _open_status_ids(client: OpenProjectClient) -> set[int]:
+    """IDs of statuses that are not closed (project config, else /statuses)."""
+    config = load_config()
+    if config and (config.get("instance", {}).get("url") or "").rstrip("/") == client.base_url.rstrip("/"):
+        return {s["id"] for s in config.get("statuses", []) if not s.get("is_closed")}
+    return {s["id"] for s in cached_collection(client, "statuses", "/statuses") if not s.get("isClosed")}
+
+
+def query_work_packages(
+    project_id: int,
+    status_id: IdFilter = None,
+    type_id: IdFilter = None,
+    assignee_id: IdFilter = None,
+    version_id: IdFilter = None,
+    parent_id: IdFilter = None,
+    open_only: bool = False,
+    updated_since: Optional[str] = None,
+    limit: Optional[int] = None,
+    server: bool = False,
+    max_age: Optional[float] = MIRROR_MAX_AGE,
+    store: Optional[WorkPackageStore] = None
+) -> list[dict]:
+    """Find a project's work packages by status/type/assignee/version/parent.
+
+    Answered from the local mirror (see sync_work_packages) in milliseconds;
+    the mirror is synced first when it never was or is older than max_age.
+    Each filter takes one ID or several (any of them matches); all given
+    filters must match.
+
+    Args:
+        project_id: Project (the mirror holds one copy per project)
+        status_id, type_id, assignee_id, version_id, parent_id: ID filters
+        open_only: Only work packages whose status is not closed
+        updated_since: Only items with updatedAt >= this ISO timestamp
+        limit: Maximum items
+        server: Ask the API instead of the mirror (always current, slower)
+        max_age: Seconds before the mirror is refreshed (None: never, once synced)
+        store: WorkPackageStore (default get_work_package_store())
+
+    Returns:
+        Work package dicts ordered by ID
+    """
+    filters = {
+        column: ids for column, ids in (
+            ("status_id", _ids(status_id)),
+            ("type_id", _ids(type_id)),
+            ("assignee_id", _ids(assignee_id)),
+            ("version_id", _ids(version_id)),
+            ("parent_id", _ids(parent_id)),
+        ) if ids is not None
+    }
+
+    with get_client() as client:
+        if open_only:
+            open_ids = _open_status_ids(client)
+            statuses = filters.get("status_id")
+            filters["status_id"] = sorted(open_ids if statuses is None else open_ids & set(statuses))
+
+        if server:
+            return _query_server(project_id, filters, updated_since, limit)
+
+        store = store or get_work_package_store()
+        synced_at = store.state(client.base_url, project_id)["synced_at"]
+        if synced_at is None or (max_age is not None and time.time() - synced_at > max_age):
+            sync_work_packages(project_id, store=store)
+        return store.query(client.base_url, project_id, filters, updated_since, limit)
+
+
+def _query_server(
+    project_id: int,
+    filters: dict[str, list[int]],
+    updated_since: Optional[str],
+    limit: Optional[int]
+) -> list[dict]:
+    """Same query as API filters."""
+    if any(not ids for ids in filters.values()):
+        return []
+    statuses = filters.get("status_id")
+    api_filters = [
+        {"status": {"operator": "=", "values": [str(i) for i in statuses]}} if statuses is not None else ALL_STATUSES
+    ]
+    for column, name in _API_FILTERS.items():
+        if column in filters:
+            api_filters.append({name: {"operator": "=", "values": [str(i) for i in filters[column]]}})
+    if updated_since:
+        api_filters.append({"updatedAt": {"operator": "<>d", "values": [updated_since, ""]}})
+
+    items = list_work_packages(filters=api_filters, sort_by=[("id", "asc")], project_id=project_id)
+    return list(islice(items, limit))
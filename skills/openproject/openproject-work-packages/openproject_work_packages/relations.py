@@ -2,7 +2,7 @@
 
 from typing import Iterator, Optional
 
-from openproject_core import OpenProjectClient, paginate
+from openproject_core import OpenProjectClient, get_shared_client, paginate
 
 # Valid relation types
 RELATION_TYPES = [
@@ -13,8 +13,8 @@ RELATION_TYPES = [
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
 
 
 def list_relations(wp_id: int) -> Iterator[dict]:
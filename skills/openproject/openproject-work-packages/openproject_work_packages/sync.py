@@ -0,0 +1,421 @@
+"""Incremental work package sync with updatedAt watermarks.
+
+sync_work_packages() keeps a local copy of a project's work packages in a
+SQLite file next to the project config. Each run only asks for work
+packages updated at or after the stored high-water mark, oldest first, and
+merges them; when nothing changed that is one small page. Deletions (and
+work packages that appear with an older updatedAt, e.g. moved in from
+another project) are found by a periodic id-only scan.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, TypedDict, Union
+
+from openproject_core import (
+    OpenProjectClient,
+    build_filters,
+    build_select,
+    build_sort,
+    codec,
+    fetch_many,
+    get_shared_client,
+    link_id,
+    paginate,
+)
+
+from .lock_versions import get_lock_version_cache
+
+SYNC_FILENAME = ".openproject-sync.sqlite3"
+
+# Delta page size; a steady-state refresh fits in one page
+SYNC_PAGE_SIZE = 200
+
+# Seconds between id-only scans that detect deletions
+ID_SCAN_INTERVAL = 3600.0
+
+# Bumped when the tables change; an outdated file is emptied and refilled
+SCHEMA_VERSION = 2
+
+# Link columns of the work_packages table, queryable with WorkPackageStore.query()
+LINK_COLUMNS = {
+    "status_id": "status",
+    "type_id": "type",
+    "assignee_id": "assignee",
+    "version_id": "version",
+    "parent_id": "parent",
+}
+
+# Without an explicit status filter the API only returns open work packages
+ALL_STATUSES = {"status": {"operator": "*", "values": []}}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS work_packages (
+    instance TEXT NOT NULL,
+    project_id INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    updated_at TEXT,
+    lock_version INTEGER,
+    status_id INTEGER,
+    type_id INTEGER,
+    assignee_id INTEGER,
+    version_id INTEGER,
+    parent_id INTEGER,
+    body BLOB NOT NULL,
+    PRIMARY KEY (instance, project_id, id)
+);
+CREATE INDEX IF NOT EXISTS wp_status ON work_packages (instance, project_id, status_id);
+CREATE INDEX IF NOT EXISTS wp_type ON work_packages (instance, project_id, type_id);
+CREATE INDEX IF NOT EXISTS wp_assignee ON work_packages (instance, project_id, assignee_id);
+CREATE INDEX IF NOT EXISTS wp_version ON work_packages (instance, project_id, version_id);
+CREATE INDEX IF NOT EXISTS wp_parent ON work_packages (instance, project_id, parent_id);
+CREATE INDEX IF NOT EXISTS wp_updated ON work_packages (instance, project_id, updated_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    instance TEXT NOT NULL,
+    project_id INTEGER NOT NULL,
+    watermark TEXT,
+    synced_at REAL,
+    id_scan_at REAL,
+    PRIMARY KEY (instance, project_id)
+);
+"""
+
+
+class SyncResult(TypedDict):
+    """sync_work_packages() result."""
+    project_id: int
+    changed: list[dict]
+    deleted: list[int]
+    watermark: Optional[str]
+    full: bool
+    id_scan: bool
+    total: int
+    seconds: float
+
+
+def get_sync_path() -> Path:
+    """Default store file (skill directory root, next to the project config)."""
+    skill_dir = Path(__file__).parent.parent.parent
+    return skill_dir / SYNC_FILENAME
+
+
+def get_client() -> OpenProjectClient:
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
+
+
+class WorkPackageStore:
+    """SQLite copy of synced work packages, keyed by instance and project.
+
+    Safe to share between threads; WAL mode lets several processes read
+    while one writes.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """Open (and create or migrate) the store.
+
+        Args:
+            path: SQLite file (default get_sync_path()); ":memory:" for a private store
+        """
+        self.path = str(path or get_sync_path())
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        if self.path != ":memory:":
+            self._db.execute("PRAGMA journal_mode=WAL")
+        self._migrate()
+
+    def _migrate(self) -> None:
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # Only a local copy: drop it and let the next sync refill it
+            self._db.executescript(
+                "DROP TABLE IF EXISTS work_packages; DROP TABLE IF EXISTS sync_state;" + _SCHEMA
+            )
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _row(self, instance: str, project_id: int, wp: dict) -> tuple:
+        links = tuple(link_id(wp, name) for name in LINK_COLUMNS.values())
+        return (instance, project_id, wp["id"], wp.get("updatedAt"), wp.get("lockVersion"), *links, codec.dumps_bytes(wp))
+
+    def state(self, instance: str, project_id: int) -> dict:
+        """Sync state: watermark, synced_at, id_scan_at (None before the first sync)."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT watermark, synced_at, id_scan_at FROM sync_state WHERE instance = ? AND project_id = ?",
+                (instance, project_id)
+            ).fetchone()
+        watermark, synced_at, id_scan_at = row or (None, None, None)
+        return {"watermark": watermark, "synced_at": synced_at, "id_scan_at": id_scan_at}
+
+    def save_state(self, instance: str, project_id: int, state: dict) -> None:
+        """Store the sync state returned by state() after updating it."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?)",
+                (instance, project_id, state.get("watermark"), state.get("synced_at"), state.get("id_scan_at"))
+            )
+
+    def merge(self, instance: str, project_id: int, wps: Iterable[dict]) -> list[dict]:
+        """Insert or replace work packages.
+
+        Returns:
+            The work packages that were new or differ in updatedAt/lockVersion
+        """
+        wps = [wp for wp in wps if wp.get("id") is not None]
+        if not wps:
+            return []
+        with self._lock:
+            stamps = {}
+            ids = [wp["id"] for wp in wps]
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                stamps.update(
+                    (row[0], row[1:]) for row in self._db.execute(
+                        "SELECT id, updated_at, lock_version FROM work_packages WHERE instance = ?"
+                        f" AND project_id = ? AND id IN ({','.join('?' * len(chunk))})",
+                        (instance, project_id, *chunk)
+                    )
+                )
+            changed = [wp for wp in wps if stamps.get(wp["id"]) != (wp.get("updatedAt"), wp.get("lockVersion"))]
+            if changed:
+                self._db.execute("BEGIN")
+                try:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO work_packages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (self._row(instance, project_id, wp) for wp in changed)
+                    )
+                    self._db.execute("COMMIT")
+                except Exception:
+                    self._db.execute("ROLLBACK")
+                    raise
+        return changed
+
+    def delete(self, instance: str, project_id: int, ids: Iterable[int]) -> int:
+        """Remove work packages; returns the number removed."""
+        ids = list(ids)
+        with self._lock:
+            return self._db.executemany(
+                "DELETE FROM work_packages WHERE instance = ? AND project_id = ? AND id = ?",
+                ((instance, project_id, wp_id) for wp_id in ids)
+            ).rowcount
+
+    def ids(self, instance: str, project_id: int) -> set[int]:
+        """IDs of the stored work packages of a project."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id FROM work_packages WHERE instance = ? AND project_id = ?", (instance, project_id)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def get(self, instance: str, project_id: int, wp_id: int) -> Optional[dict]:
+        """One stored work package, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body FROM work_packages WHERE instance = ? AND project_id = ? AND id = ?",
+                (instance, project_id, wp_id)
+            ).fetchone()
+        return codec.loads(row[0]) if row else None
+
+    def items(self, instance: str, project_id: int) -> Iterator[dict]:
+        """All stored work packages of a project, by ID."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT body FROM work_packages WHERE instance = ? AND project_id = ? ORDER BY id",
+                (instance, project_id)
+            ).fetchall()
+        for (body,) in rows:
+            yield codec.loads(body)
+
+    def query(
+        self,
+        instance: str,
+        project_id: int,
+        filters: Optional[dict[str, Iterable[int]]] = None,
+        updated_since: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> list[dict]:
+        """Stored work packages matching all filters, by ID (uses the column indexes).
+
+        Args:
+            instance: Instance URL
+            project_id: Synced project
+            filters: LINK_COLUMNS name -> accepted IDs, e.g. {"status_id": [1, 7]}
+            updated_since: Only items with updatedAt >= this ISO timestamp
+            limit: Maximum items
+
+        Raises:
+            ValueError: Unknown filter column
+        """
+        clauses, args = ["instance = ?", "project_id = ?"], [instance, project_id]
+        for column, values in (filters or {}).items():
+            if column not in LINK_COLUMNS:
+                raise ValueError(f"Unknown filter {column!r}; expected one of {', '.join(LINK_COLUMNS)}")
+            values = [int(v) for v in values]
+            clauses.append(f"{column} IN ({','.join('?' * len(values))})" if values else "0")
+            args.extend(values)
+        if updated_since:
+            clauses.append("updated_at >= ?")
+            args.append(updated_since)
+        sql = f"SELECT body FROM work_packages WHERE {' AND '.join(clauses)} ORDER BY id"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        with self._lock:
+            rows = self._db.execute(sql, args).fetchall()
+        return [codec.loads(body) for (body,) in rows]
+
+    def count(self, instance: str, project_id: int) -> int:
+        """Number of stored work packages of a project."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM work_packages WHERE instance = ? AND project_id = ?", (instance, project_id)
+            ).fetchone()[0]
+
+    def reset(self, instance: str, project_id: int) -> None:
+        """Forget a project's work packages and watermark."""
+        with self._lock:
+            self._db.execute("DELETE FROM work_packages WHERE instance = ? AND project_id = ?", (instance, project_id))
+            self._db.execute("DELETE FROM sync_state WHERE instance = ? AND project_id = ?", (instance, project_id))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._db.close()
+
+
+_store: Optional[WorkPackageStore] = None
+_store_lock = threading.Lock()
+
+
+def get_work_package_store() -> WorkPackageStore:
+    """Process-wide store at get_sync_path() (opened on first use)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = WorkPackageStore()
+        return _store
+
+
+def _delta_pages(
+    client: OpenProjectClient,
+    path: str,
+    watermark: Optional[str],
+    fields: Optional[list[str]],
+    page_size: int
+) -> Iterator[list[dict]]:
+    """Pages of work packages with updatedAt >= watermark, oldest first.
+
+    Pages are chained by updatedAt (keyset) rather than offset, so items
+    updated during the scan move to the end instead of shifting others out
+    of a page. Only a page whose items all share one timestamp advances by
+    offset.
+    """
+    lower, offset = watermark, 1
+    while True:
+        filters = [ALL_STATUSES]
+        if lower:
+            filters.append({"updatedAt": {"operator": "<>d", "values": [lower, ""]}})
+        params = {
+            "filters": build_filters(filters),
+            "sortBy": build_sort([("updatedAt", "asc"), ("id", "asc")]),
+            "pageSize": page_size,
+            "offset": offset,
+        }
+        if fields:
+            params["select"] = build_select(fields)
+        elements = client.get(path, params=params).get("_embedded", {}).get("elements", [])
+        yield elements
+        if len(elements) < page_size:
+            return
+        last = elements[-1].get("updatedAt")
+        if not last or last == lower:
+            offset += 1
+        else:
+            lower, offset = last, 1
+
+
+def sync_work_packages(
+    project_id: int,
+    full: bool = False,
+    id_scan: Optional[bool] = None,
+    store: Optional[WorkPackageStore] = None,
+    fields: Optional[list[str]] = None,
+    page_size: int = SYNC_PAGE_SIZE
+) -> SyncResult:
+    """Bring the local copy of a project's work packages up to date.
+
+    The first sync downloads every work package (open and closed); later
+    ones only those with updatedAt >= the stored watermark. Every
+    ID_SCAN_INTERVAL seconds an id-only listing finds deleted work packages
+    and fetches unknown ones.
+
+    Args:
+        project_id: Project to sync
+        full: Drop the local copy and download everything again
+        id_scan: Force (True) or skip (False) the deletion scan (default: when due)
+        store: WorkPackageStore (default get_work_package_store())
+        fields: Only store these fields (id, updatedAt and lockVersion are always kept)
+        page_size: Items per delta page (default 200)
+
+    Returns:
+        SyncResult with changed work packages (new or updated), deleted IDs,
+        the new watermark and the number of stored work packages
+    """
+    store = store or get_work_package_store()
+    started = time.monotonic()
+    wanted = list(dict.fromkeys([*fields, "updatedAt", "lockVersion"])) if fields else None
+    locks = get_lock_version_cache()
+
+    with get_client() as client:
+        instance = client.base_url
+        if full:
+            store.reset(instance, project_id)
+        state = store.state(instance, project_id)
+        first = state["watermark"] is None
+        path = f"/projects/{project_id}/work_packages"
+
+        changed: list[dict] = []
+        watermark = state["watermark"]
+        for page in _delta_pages(client, path, watermark, wanted, page_size):
+            changed.extend(locks.remember(wp) for wp in store.merge(instance, project_id, page))
+            stamps = [wp["updatedAt"] for wp in page if wp.get("updatedAt")]
+            if stamps:
+                watermark = max(watermark or "", *stamps)
+
+        now = time.time()
+        deleted: list[int] = []
+        if id_scan is None:
+            id_scan = not first and now - (state["id_scan_at"] or 0) >= ID_SCAN_INTERVAL
+        if id_scan:
+            params = {"filters": build_filters([ALL_STATUSES])}
+            server_ids = {
+                wp["id"] for wp in paginate(
+                    client, path, params, page_size=client.get_max_page_size(), fields=["id"]
+                )
+            }
+            known = store.ids(instance, project_id)
+            deleted = sorted(known - server_ids)
+            store.delete(instance, project_id, deleted)
+            for wp_id in deleted:
+                locks.forget(wp_id)
+            unknown = server_ids - known
+            if unknown:
+                found = fetch_many(client, "work_packages", unknown, fields=wanted)
+                changed.extend(locks.remember(wp) for wp in store.merge(instance, project_id, found["items"].values()))
+
+        store.save_state(instance, project_id, {
+            "watermark": watermark,
+            "synced_at": now,
+            "id_scan_at": now if (id_scan or first) else state["id_scan_at"],
+        })
+        return SyncResult(
+            project_id=project_id,
+            changed=changed,
+            deleted=deleted,
+            watermark=watermark,
+            full=first,
+            id_scan=id_scan,
+            total=store.count(instance, project_id),
+            seconds=round(time.monotonic() - started, 3),
+        )
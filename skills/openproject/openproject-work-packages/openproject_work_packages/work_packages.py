@@ -1,8 +1,25 @@
 """OpenProject Work Packages API operations."""
 
-from typing import Optional, Iterator, Union
-
-from openproject_core import OpenProjectClient, build_filters, build_sort, paginate
+from typing import AsyncIterator, Iterable, Optional, Iterator, Union
+
+from openproject_core import (
+    AsyncOpenProjectClient,
+    OpenProjectAPIError,
+    OpenProjectClient,
+    WorkPackageRecord,
+    acached_reference,
+    apaginate,
+    build_filters,
+    build_sort,
+    cached_reference,
+    gather_limited,
+    get_shared_async_client,
+    get_shared_client,
+    paginate,
+    to_records,
+)
+
+from .lock_versions import get_lock_version_cache
 
 API_V3_PREFIX = "/api/v3"
 
@@ -16,16 +33,26 @@ def _to_href(resource: str, value: Union[int, str]) -> str:
 
 
 def get_client() -> OpenProjectClient:
-    """Get configured client instance."""
-    return OpenProjectClient()
+    """Get the shared, connection-pooled client instance."""
+    return get_shared_client()
+
+
+def get_async_client() -> AsyncOpenProjectClient:
+    """Get the shared async client for the running event loop."""
+    return get_shared_async_client()
 
 
 def list_work_packages(
     filters: Optional[list] = None,
     sort_by: Optional[list] = None,
     project_id: Optional[int] = None,
-    page_size: int = 100
-) -> Iterator[dict]:
+    page_size: int = 100,
+    workers: int = 1,
+    adaptive: bool = False,
+    stream: bool = False,
+    as_records: bool = False,
+    fields: Optional[list[str]] = None
+) -> Iterator[Union[dict, WorkPackageRecord]]:
     """List work packages with filters.
 
     Args:
@@ -33,21 +60,40 @@ def list_work_packages(
         sort_by: Sort criteria, e.g. [("updated_at", "desc")]
         project_id: Limit to specific project
         page_size: Items per page
+        workers: Concurrent page requests for large scans (default 1)
+        adaptive: Grow/shrink page size toward the server maximum
+        stream: Yield items while each page downloads (large page sizes)
+        as_records: Yield compact WorkPackageRecord objects instead of dicts
+        fields: Only download these fields, e.g. ["subject", "status", "updatedAt"]
+            (include "lockVersion" to let later updates skip their pre-fetch)
 
     Yields:
-        Work package dicts
+        Work package dicts (or WorkPackageRecord with as_records=True)
     """
     with get_client() as client:
-        # Use project-scoped endpoint if project_id provided
-        path = f"/projects/{project_id}/work_packages" if project_id else "/work_packages"
-
-        params = {}
-        if filters:
-            params["filters"] = build_filters(filters)
-        if sort_by:
-            params["sortBy"] = build_sort(sort_by)
-
-        yield from paginate(client, path, params, page_size)
+        path, params = _list_request(filters, sort_by, project_id)
+        items = get_lock_version_cache().remember_all(paginate(
+            client, path, params, page_size,
+            workers=workers, adaptive=adaptive, stream=stream, fields=fields
+        ))
+        yield from to_records(items, WorkPackageRecord) if as_records else items
+
+
+def _list_request(
+    filters: Optional[list],
+    sort_by: Optional[list],
+    project_id: Optional[int]
+) -> tuple[str, dict]:
+    """Build collection path and query params for work package listings."""
+    # Use project-scoped endpoint if project_id provided
+    path = f"/projects/{project_id}/work_packages" if project_id else "/work_packages"
+
+    params = {}
+    if filters:
+        params["filters"] = build_filters(filters)
+    if sort_by:
+        params["sortBy"] = build_sort(sort_by)
+    return path, params
 
 
 def get_work_package(wp_id: int) -> dict:
@@ -57,7 +103,7 @@ def get_work_package(wp_id: int) -> dict:
         Work package dict with _links, _embedded
     """
     with get_client() as client:
-        return client.get(f"/work_packages/{wp_id}")
+        return get_lock_version_cache().remember(client.get(f"/work_packages/{wp_id}"))
 
 
 def create_work_package(
@@ -93,6 +139,30 @@ def create_work_package(
     Returns:
         Created work package dict
     """
+    data = _build_create_payload(
+        project_id, subject, type_id, description, assignee_id, status_id,
+        priority_id, parent_id, start_date, due_date, estimated_hours, custom_fields
+    )
+
+    with get_client() as client:
+        return get_lock_version_cache().remember(client.post(f"/projects/{project_id}/work_packages", data))
+
+
+def _build_create_payload(
+    project_id: int,
+    subject: str,
+    type_id: Optional[Union[int, str]],
+    description: Optional[Union[str, dict]],
+    assignee_id: Optional[Union[int, str]],
+    status_id: Optional[Union[int, str]],
+    priority_id: Optional[Union[int, str]],
+    parent_id: Optional[Union[int, str]],
+    start_date: Optional[str],
+    due_date: Optional[str],
+    estimated_hours: Optional[float],
+    custom_fields: dict
+) -> dict:
+    """Build POST body for create_work_package / acreate_work_package."""
     data = {"subject": subject}
     links = {}
 
@@ -127,20 +197,22 @@ def create_work_package(
 
     # Add custom fields
     data.update(custom_fields)
-
-    with get_client() as client:
-        return client.post(f"/projects/{project_id}/work_packages", data)
+    return data
 
 
-def update_work_package(wp_id: int, **updates) -> dict:
+def update_work_package(wp_id: int, cached_lock: bool = True, **updates) -> dict:
     """Update existing work package.
 
-    Automatically fetches lockVersion if not provided to prevent 409 Conflict.
+    Without an explicit lockVersion, the one remembered from the last read
+    of this work package is sent (see lock_versions); if none is known it is
+    fetched first. A 409 caused by a remembered (stale) lockVersion re-reads
+    the work package once and retries.
 
     Args:
         wp_id: Work package ID
+        cached_lock: Use remembered lockVersions (False: always fetch first)
         **updates: Fields to update:
-            - lockVersion: Optional, auto-fetched if omitted
+            - lockVersion: Optional; when given, a 409 is raised as is
             - subject, description, start_date, due_date, done_ratio
             - status_id, assignee_id, type_id, priority_id, parent_id, version_id
             - customFieldN: Custom fields (e.g., customField8=3)
@@ -148,11 +220,34 @@ def update_work_package(wp_id: int, **updates) -> dict:
     Returns:
         Updated work package dict
     """
-    # Auto-fetch lockVersion if not provided
-    if "lockVersion" not in updates:
-        current = get_work_package(wp_id)
-        updates["lockVersion"] = current.get("lockVersion")
+    locks = get_lock_version_cache()
+    if "lockVersion" in updates:
+        return locks.remember(_patch_work_package(wp_id, updates))
 
+    lock_version = locks.get(wp_id) if cached_lock else None
+    if lock_version is None:
+        return locks.remember(_patch_work_package(wp_id, dict(updates, lockVersion=_fetch_lock_version(wp_id))))
+    try:
+        return locks.remember(_patch_work_package(wp_id, dict(updates, lockVersion=lock_version)))
+    except OpenProjectAPIError as e:
+        if e.status_code != 409:
+            raise
+    locks.stats.incr("refreshed")
+    return locks.remember(_patch_work_package(wp_id, dict(updates, lockVersion=_fetch_lock_version(wp_id))))
+
+
+def _fetch_lock_version(wp_id: int) -> Optional[int]:
+    return get_work_package(wp_id).get("lockVersion")
+
+
+def _patch_work_package(wp_id: int, updates: dict) -> dict:
+    data = _build_update_payload(updates)
+    with get_client() as client:
+        return client.patch(f"/work_packages/{wp_id}", data)
+
+
+def _build_update_payload(updates: dict) -> dict:
+    """Build PATCH body for update_work_package / aupdate_work_package."""
     data = {}
     links = {}
 
@@ -217,8 +312,7 @@ def update_work_package(wp_id: int, **updates) -> dict:
         if key not in processed:
             data[key] = value
 
-    with get_client() as client:
-        return client.patch(f"/work_packages/{wp_id}", data)
+    return data
 
 
 def delete_work_package(wp_id: int) -> dict:
@@ -228,13 +322,115 @@ def delete_work_package(wp_id: int) -> dict:
         Empty dict on success
     """
     with get_client() as client:
-        return client.delete(f"/work_packages/{wp_id}")
+        result = client.delete(f"/work_packages/{wp_id}")
+    get_lock_version_cache().forget(wp_id)
+    return result
 
 
 def get_schema(project_id: int, type_id: int) -> dict:
     """Get work package schema for project/type combination.
 
     Useful for discovering available custom fields and allowed values.
+    Served from the reference cache when enabled ("schemas", 1 hour TTL).
     """
     with get_client() as client:
-        return client.get(f"/work_packages/schemas/{project_id}-{type_id}")
+        return cached_reference(client, "schemas", f"/work_packages/schemas/{project_id}-{type_id}")
+
+
+# Async twins
+
+
+async def alist_work_packages(
+    filters: Optional[list] = None,
+    sort_by: Optional[list] = None,
+    project_id: Optional[int] = None,
+    page_size: int = 100
+) -> AsyncIterator[dict]:
+    """Async twin of list_work_packages()."""
+    async with get_async_client() as client:
+        path, params = _list_request(filters, sort_by, project_id)
+        async for wp in apaginate(client, path, params, page_size):
+            yield get_lock_version_cache().remember(wp)
+
+
+async def aget_work_package(wp_id: int) -> dict:
+    """Async twin of get_work_package()."""
+    async with get_async_client() as client:
+        return get_lock_version_cache().remember(await client.get(f"/work_packages/{wp_id}"))
+
+
+async def aget_work_packages(wp_ids: Iterable[int], concurrency: int = 10) -> list[dict]:
+    """Fetch several work packages concurrently.
+
+    Args:
+        wp_ids: Work package IDs
+        concurrency: Maximum requests in flight (default 10)
+
+    Returns:
+        Work package dicts in the same order as wp_ids
+    """
+    return await gather_limited((aget_work_package(wp_id) for wp_id in wp_ids), concurrency)
+
+
+async def acreate_work_package(
+    project_id: int,
+    subject: str,
+    type_id: Optional[Union[int, str]] = None,
+    description: Optional[Union[str, dict]] = None,
+    assignee_id: Optional[Union[int, str]] = None,
+    status_id: Optional[Union[int, str]] = None,
+    priority_id: Optional[Union[int, str]] = None,
+    parent_id: Optional[Union[int, str]] = None,
+    start_date: Optional[str] = None,
+    due_date: Optional[str] = None,
+    estimated_hours: Optional[float] = None,
+    **custom_fields
+) -> dict:
+    """Async twin of create_work_package()."""
+    data = _build_create_payload(
+        project_id, subject, type_id, description, assignee_id, status_id,
+        priority_id, parent_id, start_date, due_date, estimated_hours, custom_fields
+    )
+
+    async with get_async_client() as client:
+        return get_lock_version_cache().remember(await client.post(f"/projects/{project_id}/work_packages", data))
+
+
+async def aupdate_work_package(wp_id: int, cached_lock: bool = True, **updates) -> dict:
+    """Async twin of update_work_package()."""
+    locks = get_lock_version_cache()
+    if "lockVersion" in updates:
+        return locks.remember(await _apatch_work_package(wp_id, updates))
+
+    lock_version = locks.get(wp_id) if cached_lock else None
+    if lock_version is None:
+        current = await aget_work_package(wp_id)
+        return locks.remember(await _apatch_work_package(wp_id, dict(updates, lockVersion=current.get("lockVersion"))))
+    try:
+        return locks.remember(await _apatch_work_package(wp_id, dict(updates, lockVersion=lock_version)))
+    except OpenProjectAPIError as e:
+        if e.status_code != 409:
+            raise
+    locks.stats.incr("refreshed")
+    current = await aget_work_package(wp_id)
+    return locks.remember(await _apatch_work_package(wp_id, dict(updates, lockVersion=current.get("lockVersion"))))
+
+
+async def _apatch_work_package(wp_id: int, updates: dict) -> dict:
+    data = _build_update_payload(updates)
+    async with get_async_client() as client:
+        return await client.patch(f"/work_packages/{wp_id}", data)
+
+
+async def adelete_work_package(wp_id: int) -> dict:
+    """Async twin of delete_work_package()."""
+    async with get_async_client() as client:
+        result = await client.delete(f"/work_packages/{wp_id}")
+    get_lock_version_cache().forget(wp_id)
+    return result
+
+
+async def aget_schema(project_id: int, type_id: int) -> dict:
+    """Async twin of get_schema()."""
+    async with get_async_client() as client:
+        return await acached_reference(client, "schemas", f"/work_packages/schemas/{project_id}-{type_id}")
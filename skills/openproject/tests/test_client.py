@@ -1,9 +1,19 @@
 """Tests for OpenProject client."""
 
+import asyncio
+
 import pytest
 from pytest_httpx import HTTPXMock
 
 from openproject_core import OpenProjectClient, check_connection
+from openproject_core import get_shared_client, close_shared_clients, configure_pool
+from openproject_core import AsyncOpenProjectClient, get_shared_async_client, gather_limited
+from openproject_core import RetryPolicy, NO_RETRY
+from openproject_core import TokenBucket, RateLimiter, configure_rate_limit, get_rate_limiter
+from openproject_core import ResponseCache, CachedResponse
+from openproject_core import ReferenceCache, OfflineCacheMiss, cached_collection, get_reference_cache
+from openproject_core import enable_instrumentation, disable_instrumentation, endpoint_template
+from openproject_core.retry import parse_retry_after
 from openproject_core import AuthenticationError, OpenProjectAPIError
 
 
@@ -73,6 +83,24 @@ class TestClientRequests:
         assert result["_type"] == "Collection"
         assert result["total"] == 1
 
+    def test_get_if_changed_etag(self, client, httpx_mock: HTTPXMock):
+        """A 304 to If-None-Match reports the resource as unchanged."""
+        url = "https://test.com/api/v3/statuses"
+        httpx_mock.add_response(url=url, json={"total": 1}, headers={"ETag": 'W/"s1"'})
+        httpx_mock.add_response(url=url, status_code=304, match_headers={"If-None-Match": 'W/"s1"'})
+        assert client.get_if_changed("/statuses") == ({"total": 1}, 'W/"s1"')
+        assert client.get_if_changed("/statuses", etag='W/"s1"') == (None, 'W/"s1"')
+
+    def test_get_if_changed_without_etag(self, client, httpx_mock: HTTPXMock):
+        """Without ETags an identical body hash counts as unchanged."""
+        url = "https://test.com/api/v3/statuses"
+        httpx_mock.add_response(url=url, json={"total": 1}, is_reusable=True)
+        body, validator = client.get_if_changed("/statuses")
+        assert body == {"total": 1}
+        assert validator.startswith("sha256:")
+        assert client.get_if_changed("/statuses", etag=validator) == (None, validator)
+        assert "If-None-Match" not in httpx_mock.get_requests()[-1].headers
+
     def test_post_request(self, client, httpx_mock: HTTPXMock):
         """POST request sends JSON and returns parsed response."""
         httpx_mock.add_response(
@@ -101,6 +129,49 @@ class TestClientRequests:
         result = client.delete("/work_packages/1")
         assert result == {}
 
+    def test_stream_elements(self, client, httpx_mock: HTTPXMock):
+        """stream_elements yields collection items and fills meta."""
+        httpx_mock.add_response(
+            url="https://test.com/api/v3/work_packages?pageSize=2",
+            json={"total": 5, "_embedded": {"elements": [{"id": 1}, {"id": 2}]}}
+        )
+        meta = {}
+        items = list(client.stream_elements("/work_packages", params={"pageSize": 2}, meta=meta))
+        assert items == [{"id": 1}, {"id": 2}]
+        assert meta["total"] == 5
+        assert client.last_response_size > 0
+
+    def test_stream_elements_error(self, client, httpx_mock: HTTPXMock):
+        """Errors are raised before anything is yielded."""
+        httpx_mock.add_response(
+            url="https://test.com/api/v3/work_packages", status_code=400,
+            json={"message": "Bad filter", "errorIdentifier": "x"}
+        )
+        with pytest.raises(OpenProjectAPIError) as exc_info:
+            list(client.stream_elements("/work_packages"))
+        assert exc_info.value.status_code == 400
+
+    def test_get_max_page_size_from_configuration(self, client, httpx_mock: HTTPXMock):
+        """Server page size limit is read once and cached on the client."""
+        httpx_mock.add_response(
+            url="https://test.com/api/v3/configuration",
+            json={"maximumAPIV3PageSize": 500}
+        )
+        assert client.get_max_page_size() == 500
+        assert client.get_max_page_size() == 500
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_get_max_page_size_fallback(self, client, httpx_mock: HTTPXMock):
+        """Missing limit falls back to the OpenProject default."""
+        httpx_mock.add_response(url="https://test.com/api/v3/configuration", json={})
+        assert client.get_max_page_size() == 1000
+
+    def test_last_response_size(self, client, httpx_mock: HTTPXMock):
+        """Response body size is tracked for adaptive pagination."""
+        httpx_mock.add_response(url="https://test.com/api/v3/projects", content=b'{"a": 1}')
+        client.get("/projects")
+        assert client.last_response_size == 8
+
 
 class TestClientErrors:
     """Tests for client error handling."""
@@ -258,3 +329,629 @@ class TestCheckConnectionStandalone:
         result = check_connection(base_url="https://test.com", api_key="")
         assert result["ok"] is False
         assert "OPENPROJECT_API_KEY" in result["error"]
+
+
+class TestSharedClient:
+    """Tests for the process-wide pooled client registry."""
+
+    @pytest.fixture(autouse=True)
+    def reset_registry(self, monkeypatch):
+        """Start and end every test with an empty registry."""
+        monkeypatch.delenv("OPENPROJECT_URL", raising=False)
+        monkeypatch.delenv("OPENPROJECT_API_KEY", raising=False)
+        close_shared_clients()
+        yield
+        close_shared_clients()
+
+    def test_same_key_returns_same_client(self):
+        """Same URL + API key reuses one client."""
+        a = get_shared_client(base_url="https://test.com", api_key="k1")
+        b = get_shared_client(base_url="https://test.com/", api_key="k1")
+        assert a is b
+        assert a.shared is True
+
+    def test_different_key_returns_different_client(self):
+        """Different API keys get separate pools."""
+        a = get_shared_client(base_url="https://test.com", api_key="k1")
+        b = get_shared_client(base_url="https://test.com", api_key="k2")
+        assert a is not b
+
+    def test_context_manager_keeps_shared_client_open(self):
+        """Exiting a with block does not close a shared client."""
+        with get_shared_client(base_url="https://test.com", api_key="k1") as client:
+            pass
+        assert client.is_closed is False
+        assert get_shared_client(base_url="https://test.com", api_key="k1") is client
+
+    def test_close_shared_clients(self):
+        """Shutdown hook closes pooled clients and a new one is created after."""
+        client = get_shared_client(base_url="https://test.com", api_key="k1")
+        close_shared_clients()
+        assert client.is_closed is True
+        assert get_shared_client(base_url="https://test.com", api_key="k1") is not client
+
+    def test_run_async_closes_loop_clients(self):
+        """run_async() closes the loop's pooled async clients before the loop ends."""
+        import warnings
+        from openproject_core import get_shared_async_client, run_async
+
+        async def use():
+            client = get_shared_async_client(base_url="https://test.com", api_key="k1")
+            assert get_shared_async_client(base_url="https://test.com", api_key="k1") is client
+            return client
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", ResourceWarning)
+            client = run_async(use())
+        assert client.is_closed is True
+
+    def test_closed_client_is_replaced(self):
+        """Explicitly closed shared client is transparently replaced."""
+        client = get_shared_client(base_url="https://test.com", api_key="k1")
+        client.close()
+        assert get_shared_client(base_url="https://test.com", api_key="k1") is not client
+
+    def test_configure_pool_limits(self, monkeypatch):
+        """Configured limits are applied to new pooled clients."""
+        import openproject_core.pool as pool
+
+        monkeypatch.setattr(pool, "_settings", {})
+        configure_pool(max_connections=5, max_keepalive_connections=2, http2=False)
+        limits = pool._pool_limits()
+        assert limits.max_connections == 5
+        assert limits.max_keepalive_connections == 2
+        assert pool._use_http2() is False
+
+    def test_requests_reuse_pool(self, httpx_mock: HTTPXMock):
+        """Requests through the shared client use the pooled connection."""
+        httpx_mock.add_response(url="https://test.com/api/v3/projects/1", json={"id": 1})
+        client = get_shared_client(base_url="https://test.com", api_key="k1")
+        with client:
+            assert client.get("/projects/1")["id"] == 1
+        assert client.is_closed is False
+
+
+class TestAsyncClient:
+    """Tests for AsyncOpenProjectClient."""
+
+    @pytest.fixture(autouse=True)
+    def clear_env(self, monkeypatch):
+        """Ignore OPENPROJECT_* from the environment."""
+        monkeypatch.delenv("OPENPROJECT_URL", raising=False)
+        monkeypatch.delenv("OPENPROJECT_API_KEY", raising=False)
+
+    def test_requires_url(self):
+        """Async client validates config like the sync client."""
+        with pytest.raises(ValueError, match="OPENPROJECT_URL required"):
+            AsyncOpenProjectClient(base_url="", api_key="test")
+
+    def test_get_and_post(self, httpx_mock: HTTPXMock):
+        """GET/POST coroutines return parsed JSON."""
+        httpx_mock.add_response(url="https://test.com/api/v3/projects/1", json={"id": 1})
+        httpx_mock.add_response(url="https://test.com/api/v3/work_packages", json={"id": 2})
+
+        async def run():
+            async with AsyncOpenProjectClient(base_url="https://test.com", api_key="k") as client:
+                return await client.get("/projects/1"), await client.post("/work_packages", {"subject": "x"})
+
+        project, wp = asyncio.run(run())
+        assert project["id"] == 1
+        assert wp["id"] == 2
+
+    def test_error_semantics(self, httpx_mock: HTTPXMock):
+        """4xx responses raise OpenProjectAPIError."""
+        httpx_mock.add_response(
+            url="https://test.com/api/v3/projects/999",
+            status_code=404,
+            json={"message": "Not found"}
+        )
+
+        async def run():
+            async with AsyncOpenProjectClient(base_url="https://test.com", api_key="k") as client:
+                await client.get("/projects/999")
+
+        with pytest.raises(OpenProjectAPIError) as exc_info:
+            asyncio.run(run())
+        assert exc_info.value.status_code == 404
+
+    def test_shared_async_client_per_loop(self):
+        """Shared async client is reused within one event loop."""
+        async def run():
+            a = get_shared_async_client(base_url="https://test.com", api_key="k")
+            async with a:
+                pass
+            b = get_shared_async_client(base_url="https://test.com", api_key="k")
+            assert a.is_closed is False
+            await a.close()
+            return a, b
+
+        a, b = asyncio.run(run())
+        assert a is b
+
+    def test_gather_limited_bounds_concurrency(self):
+        """gather_limited keeps order and never exceeds the limit."""
+        running = 0
+        peak = 0
+
+        async def work(i):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return i
+
+        results = asyncio.run(gather_limited((work(i) for i in range(20)), limit=3))
+        assert results == list(range(20))
+        assert peak <= 3
+
+
+class TestRetry:
+    """Tests for retry with backoff."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record sleeps instead of waiting."""
+        recorded = []
+        monkeypatch.setattr("openproject_core.client.time.sleep", recorded.append)
+        return recorded
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Client with deterministic (jitter-free) backoff."""
+        monkeypatch.delenv("OPENPROJECT_URL", raising=False)
+        monkeypatch.delenv("OPENPROJECT_API_KEY", raising=False)
+        c = OpenProjectClient(
+            base_url="https://test.com",
+            api_key="testkey",
+            retry_policy=RetryPolicy(max_retries=3, backoff_factor=1.0, jitter=False)
+        )
+        yield c
+        c.close()
+
+    def test_get_retries_transient_status(self, client, sleeps, httpx_mock: HTTPXMock):
+        """GET is retried on 503 with exponential backoff."""
+        url = "https://test.com/api/v3/projects"
+        httpx_mock.add_response(url=url, status_code=503)
+        httpx_mock.add_response(url=url, status_code=502)
+        httpx_mock.add_response(url=url, json={"total": 1})
+        assert client.get("/projects") == {"total": 1}
+        assert sleeps == [1.0, 2.0]
+        stats = client.retry_stats.snapshot()
+        assert stats["retries"] == 2
+        assert stats["retried_requests"] == 1
+        assert stats["retry_wait_seconds"] == 3.0
+
+    def test_retry_after_header(self, client, sleeps, httpx_mock: HTTPXMock):
+        """Retry-After overrides computed backoff."""
+        url = "https://test.com/api/v3/projects"
+        httpx_mock.add_response(url=url, status_code=429, headers={"Retry-After": "7"})
+        httpx_mock.add_response(url=url, json={})
+        client.get("/projects")
+        assert sleeps == [7.0]
+
+    def test_gives_up_after_max_retries(self, client, sleeps, httpx_mock: HTTPXMock):
+        """Persistent failures raise the API error after max_retries."""
+        httpx_mock.add_response(
+            url="https://test.com/api/v3/projects", status_code=503, is_reusable=True
+        )
+        with pytest.raises(OpenProjectAPIError) as exc_info:
+            client.get("/projects")
+        assert exc_info.value.status_code == 503
+        assert len(sleeps) == 3
+        assert client.retry_stats.snapshot()["exhausted"] == 1
+
+    def test_post_not_retried(self, client, sleeps, httpx_mock: HTTPXMock):
+        """POST is not retried unless marked idempotent."""
+        httpx_mock.add_response(url="https://test.com/api/v3/work_packages", status_code=503)
+        with pytest.raises(OpenProjectAPIError):
+            client.post("/work_packages", {"subject": "x"})
+        assert sleeps == []
+
+    def test_idempotent_post_retried(self, client, sleeps, httpx_mock: HTTPXMock):
+        """POST marked idempotent is retried."""
+        url = "https://test.com/api/v3/notifications/read_ian"
+        httpx_mock.add_response(url=url, status_code=503)
+        httpx_mock.add_response(url=url, content=b"")
+        assert client.post("/notifications/read_ian", {}, idempotent=True) == {}
+        assert sleeps == [1.0]
+
+    def test_connection_error_retried(self, client, sleeps, httpx_mock: HTTPXMock):
+        """Connection errors on safe methods are retried."""
+        import httpx
+        httpx_mock.add_exception(httpx.ConnectError("refused"))
+        httpx_mock.add_response(url="https://test.com/api/v3/projects", json={"ok": True})
+        assert client.get("/projects") == {"ok": True}
+        assert sleeps == [1.0]
+
+    def test_timeout_not_retried_when_disabled(self, client, sleeps, httpx_mock: HTTPXMock):
+        """retry_timeouts=False raises a read timeout at once (adaptive paging shrinks instead)."""
+        import httpx
+        httpx_mock.add_exception(httpx.ReadTimeout("slow page"))
+        with pytest.raises(httpx.ReadTimeout):
+            client.get("/work_packages", retry_timeouts=False)
+        assert sleeps == []
+
+        httpx_mock.add_exception(httpx.ReadTimeout("slow page"))
+        httpx_mock.add_response(url="https://test.com/api/v3/work_packages", json={"total": 0})
+        assert client.get("/work_packages") == {"total": 0}
+        assert sleeps == [1.0]
+
+    def test_total_budget(self, sleeps, httpx_mock: HTTPXMock):
+        """Retries stop when the wait budget would be exceeded."""
+        client = OpenProjectClient(
+            base_url="https://test.com",
+            api_key="testkey",
+            retry_policy=RetryPolicy(max_retries=5, backoff_factor=1.0, jitter=False, total_budget=2.5)
+        )
+        httpx_mock.add_response(
+            url="https://test.com/api/v3/projects", status_code=503, is_reusable=True
+        )
+        with pytest.raises(OpenProjectAPIError):
+            client.get("/projects")
+        assert sleeps == [1.0]
+        client.close()
+
+    def test_no_retry_policy(self, sleeps, httpx_mock: HTTPXMock):
+        """NO_RETRY makes exactly one attempt."""
+        client = OpenProjectClient(base_url="https://test.com", api_key="k", retry_policy=NO_RETRY)
+        httpx_mock.add_response(url="https://test.com/api/v3/projects", status_code=503)
+        with pytest.raises(OpenProjectAPIError):
+            client.get("/projects")
+        assert sleeps == []
+        client.close()
+
+    def test_parse_retry_after(self):
+        """Retry-After accepts seconds and HTTP dates."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("garbage") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class TestRateLimit:
+    """Tests for the client-side token-bucket rate limiter."""
+
+    @pytest.fixture(autouse=True)
+    def clean_limiter(self, monkeypatch):
+        """Start every test without a process-wide limiter."""
+        monkeypatch.setattr("openproject_core.rate_limit._limiter", None)
+        monkeypatch.setattr("openproject_core.rate_limit._env_checked", False)
+        monkeypatch.delenv("OPENPROJECT_RATE_LIMIT", raising=False)
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record limiter and retry sleeps instead of waiting."""
+        recorded = []
+        monkeypatch.setattr("openproject_core.rate_limit.time.sleep", recorded.append)
+        monkeypatch.setattr("openproject_core.client.time.sleep", recorded.append)
+        return recorded
+
+    def test_burst_then_wait(self):
+        """Requests within the burst pass; the next one must wait ~1/rate."""
+        bucket = TokenBucket(rate=10, burst=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+
+    def test_throttle_halves_and_recovers(self):
+        """429 halves the rate; successes recover it up to the configured rate."""
+        bucket = TokenBucket(rate=10, burst=5)
+        bucket.on_throttled()
+        assert bucket.current_rate == 5
+        for _ in range(20):
+            bucket.on_success()
+        assert bucket.current_rate == 10
+
+    def test_endpoint_groups(self):
+        """Reads, writes and path overrides use separate buckets."""
+        limiter = RateLimiter(10, 10, write_rate=2, endpoint_limits={"/work_packages/schemas/": (1, 1)})
+        assert limiter.bucket_for("GET", "/work_packages") is limiter.read
+        assert limiter.bucket_for("PATCH", "/work_packages/1") is limiter.write
+        assert limiter.write.rate == 2
+        schema_bucket = limiter.bucket_for("GET", "/work_packages/schemas/1-2")
+        assert schema_bucket is limiter.endpoints["/work_packages/schemas"]
+        assert limiter.bucket_for("GET", "/work_packages/schemas_x") is limiter.read
+
+    def test_env_enables_limiter(self, monkeypatch):
+        """OPENPROJECT_RATE_LIMIT installs a process-wide limiter."""
+        monkeypatch.setenv("OPENPROJECT_RATE_LIMIT", "5")
+        limiter = get_rate_limiter()
+        assert limiter is not None
+        assert limiter.read.rate == 5
+
+    def test_disabled_by_default(self):
+        """No limiter unless configured."""
+        assert get_rate_limiter() is None
+
+    def test_client_waits_for_token(self, sleeps, httpx_mock: HTTPXMock):
+        """The process-wide limiter paces client requests."""
+        configure_rate_limit(rate=1, burst=1)
+        httpx_mock.add_response(url="https://test.com/api/v3/projects", json={}, is_reusable=True)
+        with OpenProjectClient(base_url="https://test.com", api_key="k") as client:
+            client.get("/projects")
+            client.get("/projects")
+        assert len(sleeps) == 1
+        assert sleeps[0] == pytest.approx(1.0, abs=0.05)
+
+    def test_429_slows_bucket(self, sleeps, httpx_mock: HTTPXMock):
+        """A 429 response halves the rate of the request's bucket."""
+        limiter = RateLimiter(rate=100, burst=100)
+        url = "https://test.com/api/v3/projects"
+        httpx_mock.add_response(url=url, status_code=429, headers={"Retry-After": "0"})
+        httpx_mock.add_response(url=url, json={})
+        with OpenProjectClient(base_url="https://test.com", api_key="k", rate_limiter=limiter) as client:
+            client.get("/projects")
+        # Halved by the 429, then 5% of the configured rate recovered
+        assert limiter.read.current_rate == pytest.approx(55)
+        assert limiter.write.current_rate == 100
+
+    def test_async_acquire(self, monkeypatch):
+        """Async acquire awaits instead of blocking the loop."""
+        awaited = []
+
+        async def fake_sleep(delay):
+            awaited.append(delay)
+
+        monkeypatch.setattr("openproject_core.rate_limit.asyncio.sleep", fake_sleep)
+        limiter = RateLimiter(rate=2, burst=1)
+
+        async def run():
+            await limiter.acquire_async("GET", "/projects")
+            await limiter.acquire_async("GET", "/projects")
+
+        asyncio.run(run())
+        assert len(awaited) == 1
+        assert awaited[0] == pytest.approx(0.5, abs=0.05)
+
+
+class TestResponseCache:
+    """Tests for the conditional GET cache."""
+
+    URL = "https://test.com/api/v3/work_packages/1"
+
+    @pytest.fixture
+    def cache(self):
+        return ResponseCache()
+
+    @pytest.fixture
+    def client(self, cache, monkeypatch):
+        monkeypatch.delenv("OPENPROJECT_URL", raising=False)
+        monkeypatch.delenv("OPENPROJECT_API_KEY", raising=False)
+        c = OpenProjectClient(base_url="https://test.com", api_key="testkey", cache=cache)
+        yield c
+        c.close()
+
+    def test_304_served_from_cache(self, client, cache, httpx_mock: HTTPXMock):
+        """Second GET revalidates with If-None-Match and uses the stored body."""
+        httpx_mock.add_response(url=self.URL, json={"id": 1, "subject": "A"}, headers={"ETag": 'W/"v1"'})
+        httpx_mock.add_response(url=self.URL, status_code=304, match_headers={"If-None-Match": 'W/"v1"'})
+
+        assert client.get("/work_packages/1") == {"id": 1, "subject": "A"}
+        assert client.get("/work_packages/1") == {"id": 1, "subject": "A"}
+        assert client.last_response_size == 0
+        stats = cache.stats.snapshot()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_changed_resource_refreshes_entry(self, client, cache, httpx_mock: HTTPXMock):
+        """A 200 answer to a conditional GET replaces the stored entry."""
+        httpx_mock.add_response(url=self.URL, json={"subject": "A"}, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(url=self.URL, json={"subject": "B"}, headers={"ETag": '"v2"'})
+        client.get("/work_packages/1")
+        assert client.get("/work_packages/1") == {"subject": "B"}
+        key = ResponseCache.make_key("https://test.com", "testkey", "/work_packages/1")
+        assert cache.get(key).etag == '"v2"'
+        assert cache.stats.snapshot()["refreshed"] == 1
+
+    def test_last_modified_validator(self, client, httpx_mock: HTTPXMock):
+        """Last-Modified is sent back as If-Modified-Since."""
+        stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+        httpx_mock.add_response(url=self.URL, json={"id": 1}, headers={"Last-Modified": stamp})
+        httpx_mock.add_response(url=self.URL, status_code=304, match_headers={"If-Modified-Since": stamp})
+        client.get("/work_packages/1")
+        assert client.get("/work_packages/1") == {"id": 1}
+
+    def test_write_invalidates_path(self, client, cache, httpx_mock: HTTPXMock):
+        """PATCH on a path drops its cached entries."""
+        httpx_mock.add_response(url=self.URL, method="GET", json={"id": 1}, headers={"ETag": '"v1"'})
+        httpx_mock.add_response(url=self.URL, method="PATCH", json={"id": 1})
+        client.get("/work_packages/1")
+        assert len(cache) == 1
+        client.patch("/work_packages/1", {"subject": "B"})
+        assert len(cache) == 0
+
+    def test_params_are_part_of_key(self):
+        """Different query params are cached separately."""
+        a = ResponseCache.make_key("https://x", "k", "/projects", {"pageSize": 10})
+        b = ResponseCache.make_key("https://x", "k", "/projects", {"pageSize": 20})
+        assert a != b
+        assert a.split("-")[0] == b.split("-")[0]
+
+    def test_memory_lru_limit(self):
+        """Least recently used entries are evicted beyond max_entries."""
+        cache = ResponseCache(max_entries=2)
+        for key in ("a-1", "b-1", "c-1"):
+            cache.put(key, CachedResponse(body=b"{}", etag="e"))
+        assert cache.get("a-1") is None
+        assert cache.get("c-1") is not None
+        assert cache.stats.snapshot()["evictions"] == 1
+
+    def test_disk_tier(self, tmp_path):
+        """Entries survive in the disk tier and are size-limited."""
+        ResponseCache(directory=tmp_path).put("p-1", CachedResponse(body=b'{"a": 1}', etag='"x"'))
+        reloaded = ResponseCache(directory=tmp_path)
+        entry = reloaded.get("p-1")
+        assert entry.body == b'{"a": 1}'
+        assert entry.etag == '"x"'
+
+        small = ResponseCache(directory=tmp_path / "small", max_disk_bytes=60)
+        small.put("p-1", CachedResponse(body=b"x" * 20, etag="1"))
+        small.put("p-2", CachedResponse(body=b"y" * 20, etag="2"))
+        assert [f.name for f in (tmp_path / "small").glob("*.cache")] == ["p-2.cache"]
+
+
+class TestReferenceCache:
+    """Tests for the persistent reference data cache."""
+
+    @pytest.fixture(autouse=True)
+    def clean_cache(self, monkeypatch):
+        """Start every test without a process-wide reference cache."""
+        monkeypatch.setattr("openproject_core.reference_cache._cache", None)
+        monkeypatch.setattr("openproject_core.reference_cache._env_checked", False)
+        monkeypatch.delenv("OPENPROJECT_REFERENCE_CACHE", raising=False)
+        monkeypatch.delenv("OPENPROJECT_OFFLINE", raising=False)
+
+    def test_shared_across_instances(self, tmp_path):
+        """A second cache on the same file (another process) serves without fetching."""
+        path = tmp_path / "ref.sqlite3"
+        loads = []
+        loader = lambda: loads.append(1) or [{"id": 1, "name": "New"}]
+        assert ReferenceCache(path).fetch("https://x", "statuses", "/statuses", loader) == [{"id": 1, "name": "New"}]
+        other = ReferenceCache(path)
+        assert other.fetch("https://x", "statuses", "/statuses", loader) == [{"id": 1, "name": "New"}]
+        assert other.fetch("https://y", "statuses", "/statuses", loader) == [{"id": 1, "name": "New"}]
+        assert len(loads) == 2
+        assert other.stats.snapshot()["hits"] == 1
+
+    def test_expired_entry_refetched(self, tmp_path):
+        """Entries older than the resource TTL are fetched again."""
+        cache = ReferenceCache(tmp_path / "ref.sqlite3", ttls={"types": -1})
+        cache.fetch("https://x", "types", "/types", lambda: ["old"])
+        assert cache.fetch("https://x", "types", "/types", lambda: ["new"]) == ["new"]
+        assert cache.stats.snapshot()["refreshed"] == 1
+
+    def test_offline_mode(self, tmp_path):
+        """Offline serves stale entries and raises on never-cached ones."""
+        path = tmp_path / "ref.sqlite3"
+        ReferenceCache(path, ttls={"roles": -1}).fetch("https://x", "roles", "/roles", lambda: ["r"])
+        offline = ReferenceCache(path, ttls={"roles": -1}, offline=True)
+        assert offline.fetch("https://x", "roles", "/roles", lambda: pytest.fail("fetched")) == ["r"]
+        with pytest.raises(OfflineCacheMiss):
+            offline.fetch("https://x", "priorities", "/priorities", lambda: [])
+
+    def test_invalidate(self, tmp_path):
+        """Invalidation can target one resource."""
+        cache = ReferenceCache(tmp_path / "ref.sqlite3")
+        cache.put("https://x", "statuses", "/statuses", [])
+        cache.put("https://x", "types", "/types", [])
+        assert cache.invalidate("statuses") == 1
+        assert [e["resource"] for e in cache.entries()] == ["types"]
+        assert cache.invalidate() == 1
+
+    def test_cached_collection(self, tmp_path, monkeypatch):
+        """OPENPROJECT_REFERENCE_CACHE makes collections hit the network once."""
+        class FakeClient:
+            base_url = "https://x"
+            calls = 0
+
+            def get(self, path, params=None):
+                self.calls += 1
+                return {"_embedded": {"elements": [{"id": 1}]}}
+
+        client = FakeClient()
+        assert list(cached_collection(client, "statuses", "/statuses")) == [{"id": 1}]
+        assert get_reference_cache() is None
+
+        monkeypatch.setattr("openproject_core.reference_cache._env_checked", False)
+        monkeypatch.setenv("OPENPROJECT_REFERENCE_CACHE", str(tmp_path / "ref.sqlite3"))
+        list(cached_collection(client, "statuses", "/statuses"))
+        assert list(cached_collection(client, "statuses", "/statuses")) == [{"id": 1}]
+        assert client.calls == 2
+        get_reference_cache().close()
+
+
+    def test_schemas_cached(self, tmp_path, monkeypatch):
+        """Sync and async lookups share one cached "schemas" entry."""
+        import asyncio
+        from openproject_core import acached_reference, cached_reference
+
+        class FakeClient:
+            base_url = "https://x"
+            calls = 0
+
+            def get(self, path, params=None):
+                self.calls += 1
+                return {"customField1": {"name": "Points"}}
+
+        class FakeAsyncClient(FakeClient):
+            async def get(self, path, params=None):
+                return FakeClient.get(self, path, params)
+
+        monkeypatch.setenv("OPENPROJECT_REFERENCE_CACHE", str(tmp_path / "ref.sqlite3"))
+        client, aclient = FakeClient(), FakeAsyncClient()
+        path = "/work_packages/schemas/13-2"
+        assert cached_reference(client, "schemas", path)["customField1"]["name"] == "Points"
+        assert asyncio.run(acached_reference(aclient, "schemas", path)) == cached_reference(client, "schemas", path)
+        assert client.calls == 1 and aclient.calls == 0
+        assert get_reference_cache().entries()[0]["resource"] == "schemas"
+        get_reference_cache().close()
+
+
+class TestInstrumentation:
+    """Tests for request instrumentation."""
+
+    @pytest.fixture
+    def instrumentation(self):
+        inst = enable_instrumentation()
+        yield inst
+        disable_instrumentation()
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        monkeypatch.delenv("OPENPROJECT_URL", raising=False)
+        monkeypatch.delenv("OPENPROJECT_API_KEY", raising=False)
+        c = OpenProjectClient(base_url="https://test.com", api_key="testkey", retry_policy=NO_RETRY)
+        yield c
+        c.close()
+
+    def test_endpoint_template(self):
+        """IDs are collapsed into {id}."""
+        assert endpoint_template("/work_packages/42") == "/work_packages/{id}"
+        assert endpoint_template("/work_packages/schemas/3-7") == "/work_packages/schemas/{id}"
+        assert endpoint_template("/projects/5/work_packages?x=1") == "/projects/{id}/work_packages"
+
+    def test_counts_per_endpoint(self, instrumentation, client, httpx_mock: HTTPXMock):
+        """Requests are grouped by method and endpoint template."""
+        httpx_mock.add_response(url="https://test.com/api/v3/work_packages/1", json={"id": 1})
+        httpx_mock.add_response(url="https://test.com/api/v3/work_packages/2", status_code=404, json={})
+        client.get("/work_packages/1")
+        with pytest.raises(OpenProjectAPIError):
+            client.get("/work_packages/2")
+
+        stats = instrumentation.snapshot()["GET /work_packages/{id}"]
+        assert stats["requests"] == 2
+        assert stats["errors"] == 1
+        assert stats["statuses"] == {"200": 1, "404": 1}
+        assert stats["bytes_in"] == len(b'{"id":1}') + len(b"{}")
+        assert stats["latency"]["count"] == 2
+        assert stats["latency"]["p50"] <= stats["latency"]["p99"]
+
+    def test_hooks(self, instrumentation, client, httpx_mock: HTTPXMock):
+        """Before/after hooks see each request."""
+        seen = []
+        instrumentation.add_before_hook(lambda method, path, params: seen.append(("before", path)))
+        instrumentation.add_after_hook(lambda info: seen.append(("after", info.status_code, info.bytes_out)))
+        httpx_mock.add_response(url="https://test.com/api/v3/projects", method="POST", json={})
+        client.post("/projects", {"name": "X"})
+        assert seen[0] == ("before", "/projects")
+        assert seen[1][:2] == ("after", 200)
+        assert seen[1][2] > 0
+
+    def test_prometheus_export(self, instrumentation, client, httpx_mock: HTTPXMock, tmp_path):
+        """Prometheus text output contains counters and histogram buckets."""
+        httpx_mock.add_response(url="https://test.com/api/v3/projects", json={})
+        client.get("/projects")
+        path = instrumentation.write_prometheus(tmp_path / "op.prom")
+        text = path.read_text()
+        assert 'openproject_requests_total{method="GET",endpoint="/projects"} 1' in text
+        assert 'le="+Inf"} 1' in text
+        assert "openproject_request_duration_seconds_count" in text
+
+    def test_disabled_records_nothing(self, client, httpx_mock: HTTPXMock):
+        """Without enable_instrumentation() no metrics are kept."""
+        inst = enable_instrumentation()
+        disable_instrumentation()
+        httpx_mock.add_response(url="https://test.com/api/v3/projects", json={})
+        client.get("/projects")
+        assert inst.snapshot() == {}
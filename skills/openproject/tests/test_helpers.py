@@ -1,5 +1,6 @@
 """Tests for OpenProject helpers."""
 
+import asyncio
 import json
 import pytest
 
@@ -9,7 +10,17 @@ from openproject_core import (
     parse_hal_response,
     extract_id_from_href,
     paginate,
+    apaginate,
+    iter_collection,
+    available_codecs,
+    WorkPackageRecord,
+    TimeEntryRecord,
+    UserRecord,
+    to_records,
+    build_select,
+    fetch_many,
 )
+from openproject_core import codec
 
 
 class TestBuildFilters:
@@ -63,6 +74,189 @@ class TestBuildSort:
         assert parsed == [["updated_at", "desc"], ["id", "asc"]]
 
 
+class TestCodec:
+    """Tests for the pluggable JSON codec."""
+
+    DOC = {"subject": "Tiếng Việt", "n": [1, 2.5, None, True], "_links": {"self": {"href": "/x"}}}
+
+    @pytest.fixture
+    def restore_codec(self):
+        original = codec.CODEC
+        yield
+        codec.set_codec(original)
+
+    @pytest.mark.parametrize("name", available_codecs())
+    def test_roundtrip(self, name, restore_codec):
+        """Every installed codec round-trips and produces identical compact output."""
+        codec.set_codec(name)
+        encoded = codec.dumps_bytes(self.DOC)
+        assert codec.loads(encoded) == self.DOC
+        assert encoded == json.dumps(self.DOC, separators=(",", ":"), ensure_ascii=False).encode()
+
+    @pytest.mark.parametrize("name", available_codecs())
+    def test_invalid_raises_value_error(self, name, restore_codec):
+        """Invalid input raises ValueError whatever the backend."""
+        codec.set_codec(name)
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")
+
+    def test_stdlib_always_available(self):
+        """The stdlib fallback is always listed last."""
+        assert available_codecs()[-1] == "json"
+
+    def test_unknown_codec(self):
+        """Unknown names raise ValueError."""
+        with pytest.raises(ValueError):
+            codec.set_codec("yaml")
+
+    @pytest.mark.parametrize("forced", ["yaml", "not-installed"])
+    def test_bad_env_codec_falls_back(self, forced, restore_codec, monkeypatch):
+        """An unusable OPENPROJECT_JSON_CODEC warns instead of breaking the import."""
+        if forced == "not-installed":
+            missing = [name for name in codec.CODECS if name not in available_codecs()]
+            if not missing:
+                pytest.skip("all codecs installed")
+            forced = missing[0]
+        monkeypatch.setenv("OPENPROJECT_JSON_CODEC", forced)
+        with pytest.warns(RuntimeWarning, match="OPENPROJECT_JSON_CODEC"):
+            codec._select_default()
+        assert codec.CODEC == available_codecs()[0]
+
+    def test_filters_are_compact(self):
+        """Query params use compact separators."""
+        assert build_filters([{"id": {"operator": "=", "values": ["1"]}}]) == '[{"id":{"operator":"=","values":["1"]}}]'
+
+
+class TestRecords:
+    """Tests for compact typed records."""
+
+    WP = {
+        "_type": "WorkPackage",
+        "id": 42,
+        "lockVersion": 3,
+        "subject": "Fix login",
+        "description": {"raw": "long text"},
+        "startDate": "2026-01-05",
+        "updatedAt": "2026-03-04T10:20:30Z",
+        "customField3": 7,
+        "customField8": {"format": "markdown", "raw": "note"},
+        "_links": {
+            "self": {"href": "/api/v3/work_packages/42"},
+            "project": {"href": "/api/v3/projects/3", "title": "Demo"},
+            "status": {"href": "/api/v3/statuses/2"},
+            "assignee": {"href": None},
+            "parent": {"href": "/api/v3/work_packages/40"},
+            "customField5": [{"href": "/api/v3/custom_options/12"}],
+        },
+        "_embedded": {"project": {"id": 3}},
+    }
+
+    def test_work_package_from_hal(self):
+        """Link IDs are extracted and custom fields flattened."""
+        record = WorkPackageRecord.from_hal(self.WP)
+        assert record.id == 42
+        assert record.lock_version == 3
+        assert record.project_id == 3
+        assert record.status_id == 2
+        assert record.assignee_id is None
+        assert record.parent_id == 40
+        assert record.custom_fields == {"customField3": 7, "customField8": "note", "customField5": [12]}
+        assert not hasattr(record, "__dict__")
+
+    def test_trimmed_shape(self):
+        """Missing fields (select=) stay None."""
+        record = WorkPackageRecord.from_hal({"id": 1, "subject": "A"})
+        assert record.subject == "A"
+        assert record.status_id is None
+        assert record.custom_fields is None
+
+    def test_time_entry_entity_link(self):
+        """Work package ID comes from workPackage or entity link."""
+        entry = TimeEntryRecord.from_hal({
+            "id": 9,
+            "hours": "PT1H30M",
+            "comment": {"raw": "review"},
+            "_links": {"entity": {"href": "/api/v3/work_packages/42"}, "user": {"href": "/api/v3/users/5"}},
+        })
+        assert entry.work_package_id == 42
+        assert entry.user_id == 5
+        assert entry.comment == "review"
+        meeting = TimeEntryRecord.from_hal({"id": 10, "_links": {"entity": {"href": "/api/v3/meetings/3"}}})
+        assert meeting.work_package_id is None
+
+    def test_user_and_to_records(self):
+        """to_records converts lazily in order."""
+        users = list(to_records([{"id": 1, "login": "a", "firstName": "An"}, {"id": 2}], UserRecord))
+        assert [u.id for u in users] == [1, 2]
+        assert users[0].first_name == "An"
+
+
+class TestBuildSelect:
+    """Tests for build_select and paginate(fields=...)."""
+
+    def test_prefixes_element_fields(self):
+        """Plain names become elements/<name>; id and paging metadata always included."""
+        assert build_select(["subject", "status"]) == "total,count,pageSize,offset,elements/id,elements/subject,elements/status"
+
+    def test_passthrough_and_dedupe(self):
+        """Explicit paths are kept, duplicates dropped."""
+        assert build_select(["id", "elements/_links/self", "total", "pageSize"]) == "total,count,pageSize,offset,elements/id,elements/_links/self"
+
+    def test_paginate_sends_select(self):
+        """paginate(fields=...) adds select without mutating caller params."""
+        class MockClient:
+            def get(self, path, params=None):
+                self.params = params
+                return {"_embedded": {"elements": [{"id": 1, "subject": "A"}]}}
+
+        client = MockClient()
+        params = {"filters": "[]"}
+        items = list(paginate(client, "/work_packages", params=params, fields=["subject"]))
+        assert client.params["select"] == "total,count,pageSize,offset,elements/id,elements/subject"
+        assert "select" not in params
+        assert WorkPackageRecord.from_hal(items[0]).subject == "A"
+
+
+class TestFetchMany:
+    """Tests for fetch_many."""
+
+    class FilterClient:
+        """Returns the requested IDs that exist on page 1, thread-safe."""
+
+        def __init__(self, existing):
+            import threading
+            self.existing = set(existing)
+            self.calls = []
+            self.lock = threading.Lock()
+
+        def get(self, path, params=None):
+            ids = [int(v) for v in json.loads(params["filters"])[0]["id"]["values"]]
+            with self.lock:
+                self.calls.append((path, ids, params["pageSize"]))
+            if params["offset"] > 1:
+                return {"total": 0, "_embedded": {"elements": []}}
+            found = [{"id": i} for i in ids if i in self.existing]
+            return {"total": len(found), "_embedded": {"elements": found}}
+
+    def test_chunks_and_missing(self):
+        """IDs are chunked, de-duplicated and missing ones reported in order (one request per chunk)."""
+        client = self.FilterClient(existing=range(1, 240))
+        ids = list(range(1, 251)) + [5, 5]
+        result = fetch_many(client, "work_packages", ids, chunk_size=100, workers=3)
+        assert len(result["items"]) == 239
+        assert result["items"][17] == {"id": 17}
+        assert result["missing"] == list(range(240, 251))
+        assert sorted(len(ids) for _, ids, _ in client.calls) == [50, 100, 100]
+        assert all(path == "/work_packages" for path, _, _ in client.calls)
+        assert all(size == len(ids) for _, ids, size in client.calls)
+
+    def test_empty_ids(self):
+        """No IDs means no requests."""
+        client = self.FilterClient(existing=[])
+        assert fetch_many(client, "users", []) == {"items": {}, "missing": []}
+        assert client.calls == []
+
+
 class TestParseHalResponse:
     """Tests for parse_hal_response function."""
 
@@ -186,3 +380,270 @@ class TestPaginate:
         list(paginate(client, "/projects", params={"filters": "test"}))
         assert client.last_params["filters"] == "test"
         assert client.last_params["pageSize"] == 100
+
+
+class TestIterCollection:
+    """Tests for incremental collection parsing."""
+
+    BODY = json.dumps({
+        "_type": "Collection",
+        "total": 1234,
+        "count": 3,
+        "_embedded": {
+            "elements": [{"id": 1, "subject": "Tiếng Việt"}, {"id": 2, "n": [1, 2]}, {"id": 3}],
+            "schemas": {"_type": "Collection"}
+        },
+        "_links": {"self": {"href": "/api/v3/work_packages"}}
+    }, ensure_ascii=False).encode()
+
+    @staticmethod
+    def chunked(data, size):
+        return (data[i:i + size] for i in range(0, len(data), size))
+
+    @pytest.mark.parametrize("size", [1, 3, 7, 4096])
+    def test_elements_across_chunk_boundaries(self, size):
+        """Elements, numbers and multi-byte characters survive any chunking."""
+        meta = {}
+        items = list(iter_collection(self.chunked(self.BODY, size), meta))
+        assert items == json.loads(self.BODY)["_embedded"]["elements"]
+        assert meta["total"] == 1234
+        assert meta["_embedded"]["schemas"] == {"_type": "Collection"}
+        assert meta["_links"]["self"]["href"] == "/api/v3/work_packages"
+
+    def test_yields_before_body_complete(self):
+        """First element is available before the rest of the body is read."""
+        consumed = []
+
+        def chunks():
+            for chunk in self.chunked(self.BODY, 16):
+                consumed.append(chunk)
+                yield chunk
+
+        meta = {}
+        first = next(iter_collection(chunks(), meta))
+        assert first["id"] == 1
+        assert meta["total"] == 1234
+        assert sum(map(len, consumed)) < len(self.BODY)
+
+    def test_empty_elements(self):
+        """Empty collections yield nothing."""
+        assert list(iter_collection([b'{"total": 0, "_embedded": {"elements": []}}'])) == []
+
+    def test_invalid_body(self):
+        """Non-object bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            list(iter_collection([b"[1, 2]"]))
+
+    def test_paginate_stream(self):
+        """paginate(stream=True) reads pages through client.stream_elements()."""
+        class StreamClient:
+            def __init__(self):
+                self.offsets = []
+
+            def stream_elements(self, path, params=None, meta=None):
+                self.offsets.append(params["offset"])
+                ids = [1, 2] if params["offset"] == 1 else [3]
+                yield from ({"id": i} for i in ids)
+
+        client = StreamClient()
+        items = list(paginate(client, "/work_packages", page_size=2, stream=True))
+        assert [i["id"] for i in items] == [1, 2, 3]
+        assert client.offsets == [1, 2]
+
+
+class TestConcurrentPaginate:
+    """Tests for paginate(workers > 1)."""
+
+    class PagedClient:
+        """Serves `total` items at the requested page size, thread-safe."""
+
+        def __init__(self, total, grow_to=None, server_max=None):
+            import threading
+            self.total = total
+            self.grow_to = grow_to
+            self.server_max = server_max
+            self.offsets = []
+            self.lock = threading.Lock()
+
+        def get(self, path, params=None):
+            with self.lock:
+                self.offsets.append(params["offset"])
+                if self.grow_to and len(self.offsets) > 1:
+                    self.total = self.grow_to
+            size, offset = min(params["pageSize"], self.server_max or params["pageSize"]), params["offset"]
+            start = (offset - 1) * size
+            ids = range(start + 1, min(start + size, self.total) + 1)
+            return {
+                "_embedded": {"elements": [{"id": i} for i in ids]},
+                "total": self.total,
+                "pageSize": size,
+            }
+
+    def test_items_in_order(self):
+        """All items are yielded in collection order."""
+        client = self.PagedClient(total=95)
+        items = list(paginate(client, "/work_packages", page_size=10, workers=4))
+        assert [i["id"] for i in items] == list(range(1, 96))
+        assert sorted(client.offsets) == list(range(1, 11))
+
+    def test_exact_multiple_of_page_size(self):
+        """Total divisible by page size needs no extra request."""
+        client = self.PagedClient(total=30)
+        items = list(paginate(client, "/work_packages", page_size=10, workers=3))
+        assert len(items) == 30
+        assert sorted(client.offsets) == [1, 2, 3, 4]
+
+    def test_single_short_page(self):
+        """Short first page stops without starting workers."""
+        client = self.PagedClient(total=3)
+        items = list(paginate(client, "/work_packages", page_size=10, workers=4))
+        assert len(items) == 3
+        assert client.offsets == [1]
+
+    def test_collection_growth_continues_sequentially(self):
+        """Items added during the scan are still picked up."""
+        client = self.PagedClient(total=20, grow_to=25)
+        items = list(paginate(client, "/work_packages", page_size=10, workers=2))
+        assert [i["id"] for i in items] == list(range(1, 26))
+
+    def test_missing_total_falls_back_to_sequential(self):
+        """Responses without total are walked sequentially."""
+        class NoTotalClient(self.PagedClient):
+            def get(self, path, params=None):
+                response = super().get(path, params)
+                del response["total"]
+                return response
+
+        client = NoTotalClient(total=25)
+        items = list(paginate(client, "/work_packages", page_size=10, workers=4))
+        assert len(items) == 25
+        assert client.offsets == [1, 2, 3]
+
+    def test_clamped_first_page(self):
+        """Offsets are computed from the page size the server actually serves."""
+        client = self.PagedClient(total=120, server_max=50)
+        items = list(paginate(client, "/work_packages", page_size=100, workers=4))
+        assert [i["id"] for i in items] == list(range(1, 121))
+        assert sorted(client.offsets) == [1, 2, 3]
+
+    def test_clamped_without_page_size(self):
+        """Without pageSize in the response, a short page below total is a clamp."""
+        class NoPageSizeClient(self.PagedClient):
+            def get(self, path, params=None):
+                response = super().get(path, params)
+                del response["pageSize"]
+                return response
+
+        client = NoPageSizeClient(total=120, server_max=50)
+        items = list(paginate(client, "/work_packages", page_size=100, workers=4))
+        assert [i["id"] for i in items] == list(range(1, 121))
+
+    def test_early_close_does_not_hang(self):
+        """Stopping iteration early shuts the worker pool down."""
+        client = self.PagedClient(total=1000)
+        gen = paginate(client, "/work_packages", page_size=10, workers=4)
+        first = [next(gen) for _ in range(15)]
+        gen.close()
+        assert first[-1]["id"] == 15
+
+
+class TestAdaptivePaginate:
+    """Tests for paginate(adaptive=True)."""
+
+    class AdaptiveClient:
+        """Serves `total` items, clamping page size to `server_max`."""
+
+        def __init__(self, total, server_max=1000, config_max=None, timeout_above=None):
+            self.total = total
+            self.server_max = server_max
+            self.config_max = config_max
+            self.timeout_above = timeout_above
+            self.max_page_size = None
+            self.last_response_size = 100
+            self.requests = []
+
+        def get_max_page_size(self):
+            if self.max_page_size is None:
+                self.max_page_size = self.config_max or 1000
+            return self.max_page_size
+
+        def get(self, path, params=None, retry_timeouts=True):
+            import httpx
+            assert not retry_timeouts, "adaptive pages must not be retried at the same size"
+            size = params["pageSize"]
+            if self.timeout_above and size > self.timeout_above:
+                self.requests.append(("timeout", size))
+                raise httpx.ReadTimeout("slow page")
+            size = min(size, self.server_max)
+            self.requests.append((params["offset"], size))
+            start = (params["offset"] - 1) * size
+            ids = range(start + 1, min(start + size, self.total) + 1)
+            return {"_embedded": {"elements": [{"id": i} for i in ids]}, "pageSize": size}
+
+    def test_grows_page_size(self):
+        """Fast responses double the page size up to the server max."""
+        client = self.AdaptiveClient(total=1500, config_max=400)
+        items = list(paginate(client, "/work_packages", page_size=100, adaptive=True))
+        assert [i["id"] for i in items] == list(range(1, 1501))
+        sizes = [size for _, size in client.requests]
+        # A size change waits until consumed items fall on a page boundary
+        assert sizes[:4] == [100, 100, 200, 400]
+        assert max(sizes) == 400
+
+    def test_shrinks_on_timeout(self):
+        """Timed-out pages are retried at a smaller aligned size."""
+        client = self.AdaptiveClient(total=250, timeout_above=50)
+        items = list(paginate(client, "/work_packages", page_size=200, adaptive=True))
+        assert [i["id"] for i in items] == list(range(1, 251))
+        assert ("timeout", 200) in client.requests
+
+    def test_learns_clamped_server_max(self):
+        """A server that clamps pageSize teaches the client its real max."""
+        client = self.AdaptiveClient(total=700, server_max=300)
+        items = list(paginate(client, "/work_packages", page_size=100, adaptive=True))
+        assert [i["id"] for i in items] == list(range(1, 701))
+        assert client.max_page_size == 300
+
+    def test_clamp_detected_with_fields(self):
+        """fields= keeps pageSize in the response, so a clamp is still noticed."""
+        class SelectClient(self.AdaptiveClient):
+            def get(self, path, params=None, retry_timeouts=True):
+                response = super().get(path, params, retry_timeouts)
+                selected = params["select"].split(",")
+                return {k: v for k, v in response.items() if k in selected or k == "_embedded"}
+
+        client = SelectClient(total=120, server_max=50)
+        items = list(paginate(client, "/work_packages", page_size=100, adaptive=True, fields=["subject"]))
+        assert [i["id"] for i in items] == list(range(1, 121))
+        assert client.max_page_size == 50
+
+    def test_shrink_keeps_alignment(self):
+        """Shrinking always divides the current size."""
+        from openproject_core.helpers import _shrink_page_size
+        assert _shrink_page_size(800) == 400
+        assert _shrink_page_size(300) == 150
+        assert 90 % _shrink_page_size(90) == 0
+
+
+class TestApaginate:
+    """Tests for apaginate async generator."""
+
+    def test_multiple_pages(self):
+        """Async pagination walks pages until a short page."""
+        class MockAsyncClient:
+            def __init__(self):
+                self.offsets = []
+
+            async def get(self, path, params=None):
+                self.offsets.append(params["offset"])
+                if params["offset"] == 1:
+                    return {"_embedded": {"elements": [{"id": 1}, {"id": 2}]}}
+                return {"_embedded": {"elements": [{"id": 3}]}}
+
+        async def collect(client):
+            return [item async for item in apaginate(client, "/projects", page_size=2)]
+
+        client = MockAsyncClient()
+        items = asyncio.run(collect(client))
+        assert [i["id"] for i in items] == [1, 2, 3]
+        assert client.offsets == [1, 2]
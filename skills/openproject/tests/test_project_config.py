@@ -0,0 +1,504 @@
+"""Tests for OpenProject project config cache."""
+
+import os
+
+import pytest
+
+from openproject_core import project_config
+from openproject_core import (
+    clear_config_cache,
+    get_config_index,
+    get_custom_field_id,
+    get_custom_field_name,
+    get_member_id,
+    get_member_name,
+    get_project_id,
+    get_status_id,
+    get_type_id,
+    is_config_initialized,
+    load_config,
+    resolve_names,
+    search_names,
+)
+from openproject_core.name_index import NameIndex, normalize
+
+
+def make_config(**overrides) -> dict:
+    config = {
+        "generated_at": "2026-01-01T00:00:00",
+        "updated_at": "2026-01-01T00:00:00",
+        "instance": {"url": "https://test.com", "user_name": "Admin"},
+        "project": {"id": 13, "identifier": "demo", "name": "Demo"},
+        "members": [
+            {"user_id": 5, "principal_name": "Tuan HV"},
+            {"user_id": 9, "principal_name": "Hung NB"},
+            {"user_id": 11, "principal_name": "Hung"},
+        ],
+        "types": [{"id": 1, "name": "Task"}, {"id": 2, "name": "Bug"}],
+        "statuses": [{"id": 1, "name": "New"}, {"id": 7, "name": "In progress"}],
+        "priorities": [{"id": 8, "name": "Normal"}],
+        "versions": [],
+        "categories": [],
+        "custom_fields": {
+            "1": {"customField8": {"name": "Excute Point"}},
+            "2": {"customField8": {"name": "Excute Point"}, "customField3": {"name": "Severity"}},
+        },
+    }
+    config.update(overrides)
+    return config
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    """Use a temp skill directory; returns the legacy single-file config path."""
+    monkeypatch.setattr(project_config, "_skill_dir", lambda: tmp_path)
+    monkeypatch.delenv("OPENPROJECT_URL", raising=False)
+    monkeypatch.delenv("OPENPROJECT_PROJECT_ID", raising=False)
+    clear_config_cache()
+    yield tmp_path / ".openproject-config.yml"
+    clear_config_cache()
+
+
+class TestConfigIndex:
+    """Tests for indexed config lookups."""
+
+    def test_not_initialized(self, config_path):
+        """Missing file means no config and no lookups."""
+        assert not is_config_initialized()
+        assert get_type_id("Task") is None
+
+    def test_lookups(self, config_path):
+        """Names resolve case-insensitively."""
+        project_config.save_config(make_config())
+        assert get_type_id("bug") == 2
+        assert get_status_id("IN PROGRESS") == 7
+        assert get_member_name(9) == "Hung NB"
+        assert get_custom_field_id("severity") == "customField3"
+        assert get_custom_field_id("severity", type_id=1) is None
+        assert get_custom_field_name("customField8", 1) == "Excute Point"
+
+    def test_member_exact_then_partial(self, config_path):
+        """An exact member name wins over an earlier partial match."""
+        project_config.save_config(make_config())
+        assert get_member_id("hung") == 11
+        assert get_member_id("hung n") == 9
+        assert get_member_id("nobody") is None
+
+    def test_parsed_once(self, config_path, monkeypatch):
+        """A legacy config is imported into the store; lookups do not re-parse it."""
+        config_path.write_text(project_config.yaml.dump(make_config()), encoding="utf-8")
+        calls = []
+        real_parse = project_config._parse_yaml
+        monkeypatch.setattr(project_config, "_parse_yaml", lambda raw: calls.append(1) or real_parse(raw))
+        for _ in range(100):
+            get_type_id("Task")
+            get_member_id("Tuan")
+        assert load_config()["project"]["id"] == 13
+        assert len(calls) == 1
+
+    def test_reloads_on_change(self, config_path):
+        """Editing the file on disk invalidates the in-memory index."""
+        project_config.save_config(make_config())
+        index = get_config_index()
+        config_path = project_config.get_config_path()
+        config_path.write_text(
+            project_config.yaml.dump(make_config(types=[{"id": 4, "name": "Epic"}])), encoding="utf-8"
+        )
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert get_type_id("Epic") == 4
+        assert get_type_id("Task") is None
+        assert get_config_index() is not index
+
+
+class TestNameIndex:
+    """Tests for normalized, ranked name search."""
+
+    MEMBERS = [
+        (1, "Nguyễn Văn Hùng"),
+        (2, "Trần Thị Hương"),
+        (3, "Đặng Hùng"),
+        (4, "Lê Minh Tuấn"),
+    ]
+
+    def test_normalize(self):
+        """Diacritics, đ, case and punctuation are folded."""
+        assert normalize("Nguyễn Văn Đức") == "nguyen van duc"
+        assert normalize("  Hùng-NB ") == "hung nb"
+
+    def test_exact_without_diacritics(self):
+        """Typing without accents resolves exactly."""
+        index = NameIndex(self.MEMBERS)
+        assert index.resolve("dang hung") == 3
+        assert index.search("Dang Hung")[0].score == 1.0
+
+    def test_prefix_any_order(self):
+        """Word prefixes match in any order, closest name first."""
+        index = NameIndex(self.MEMBERS)
+        assert index.resolve("hung nguyen") == 1
+        matches = index.search("hung")
+        assert [m.id for m in matches[:2]] == [3, 1]
+        assert index.resolve("tr th") == 2
+
+    def test_repeated_words_below_exact(self):
+        """A prefix match never outranks the exact name, even with repeated words."""
+        index = NameIndex([(5, "Lê Hùng"), (6, "Hùng Hùng")])
+        matches = index.search("hung hung")
+        assert [m.id for m in matches] == [6, 5]
+        assert matches[0].score == 1.0
+        assert matches[1].score < 1.0
+
+    def test_substring(self):
+        """Mid-word fragments still match (former partial match)."""
+        assert NameIndex(self.MEMBERS).resolve("uong") == 2
+
+    def test_short_substring(self):
+        """1-2 character mid-word fragments match like the former substring scan."""
+        index = NameIndex(self.MEMBERS)
+        assert index.resolve("uo") == 2
+        assert index.resolve("ua") == 4
+        assert [m.id for m in index.search("un")] == [3, 1]
+        assert index.resolve("zq") is None
+
+    def test_typo_only_in_search(self):
+        """Typos rank in search() but are not resolved."""
+        index = NameIndex(self.MEMBERS)
+        assert index.search("Le Minh Tuan")[0].id == 4
+        matches = index.search("Le Mihn Tuan")
+        assert matches[0].id == 4 and matches[0].score < 0.5
+        assert index.resolve("Le Mihn Tuan") is None
+        assert index.resolve("nobody") is None
+
+    def test_resolve_many(self):
+        """Batch resolution keeps every input name."""
+        index = NameIndex(self.MEMBERS)
+        assert index.resolve_many(["hùng", "Huong", "hung", "x"]) == {
+            "hùng": 3, "Huong": 2, "hung": 3, "x": None,
+        }
+
+    def test_config_helpers(self, config_path):
+        """search_names()/resolve_names() use the active config."""
+        assert resolve_names("members", ["Tuan"]) == {"Tuan": None}
+        project_config.save_config(make_config())
+        assert get_status_id("in-progress") == 7
+        assert resolve_names("members", ["tuan", "hung nb", "zzz"]) == {"tuan": 5, "hung nb": 9, "zzz": None}
+        assert get_member_id("ua") == 5
+        assert [m.id for m in search_names("types", "bu")] == [2]
+        with pytest.raises(ValueError):
+            search_names("projects", "demo")
+
+
+class TestConfigSidecar:
+    """Tests for the JSON sidecar that replaces YAML parsing."""
+
+    def test_save_writes_sidecar(self, config_path, monkeypatch):
+        """A saved config is loaded from the sidecar without parsing YAML."""
+        project_config.save_config(make_config())
+        config_path = project_config.get_config_path()
+        assert project_config.get_config_cache_path(config_path).exists()
+        monkeypatch.setattr(project_config, "_parse_yaml", lambda raw: pytest.fail("parsed YAML"))
+        shared = project_config.GLOBAL_SECTIONS
+        assert project_config.read_config_file(config_path) == {
+            k: v for k, v in make_config().items() if k not in shared
+        }
+
+    def test_stale_sidecar_ignored(self, config_path):
+        """Editing the YAML by hand makes the sidecar stale; it is rebuilt."""
+        project_config.save_config(make_config())
+        config_path = project_config.get_config_path()
+        config_path.write_text(
+            project_config.yaml.dump(make_config(priorities=[{"id": 9, "name": "High"}])), encoding="utf-8"
+        )
+        assert project_config.read_config_file(config_path)["priorities"] == [{"id": 9, "name": "High"}]
+        sidecar = project_config.get_config_cache_path(config_path).read_bytes()
+        assert b'"High"' in sidecar
+
+    def test_corrupt_sidecar_falls_back(self, config_path):
+        """An unreadable sidecar is ignored."""
+        project_config.save_config(make_config())
+        config_path = project_config.get_config_path()
+        project_config.get_config_cache_path(config_path).write_bytes(b"garbage")
+        assert project_config.read_config_file(config_path)["project"]["id"] == 13
+
+
+class FakeClient:
+    """Serves project metadata endpoints, recording peak concurrency."""
+
+    base_url = "https://test.com"
+
+    def __init__(self, delay: float = 0.0, types: int = 3):
+        import threading
+        self.delay = delay
+        self.type_ids = list(range(1, types + 1))
+        self.versions = [{"id": 1, "name": "Sprint 1"}]
+        self.calls = []
+        self.not_modified = []
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def get(self, path, params=None):
+        import time
+        with self.lock:
+            self.calls.append(path)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return self.respond(path)
+
+    def get_if_changed(self, path, params=None, etag=None):
+        import hashlib
+        import json
+        body = self.get(path, params)
+        validator = '"' + hashlib.md5(json.dumps(body, sort_keys=True).encode()).hexdigest() + '"'
+        if validator == etag:
+            self.not_modified.append(path)
+            return None, etag
+        return body, validator
+
+    def respond(self, path):
+        def collection(elements):
+            return {"total": len(elements), "_embedded": {"elements": elements}}
+
+        if path == "/users/me":
+            return {"id": 5, "firstName": "Tuan", "lastName": "HV", "login": "tuan"}
+        if path.count("/") == 2 and path.startswith("/projects/"):
+            project_id = int(path.rsplit("/", 1)[1])
+            return {"id": project_id, "identifier": f"demo-{project_id}", "name": f"Demo {project_id}"}
+        if path == "/memberships":
+            return collection([{"id": 1, "_links": {"principal": {"href": "/api/v3/users/5", "title": "Tuan HV"}}}])
+        if path.startswith("/projects/") and path.endswith("/types"):
+            return collection([{"id": t, "name": f"Type {t}"} for t in self.type_ids])
+        if path.startswith("/work_packages/schemas/"):
+            type_id = path.rsplit("-", 1)[1]
+            return {"customField1": {"name": f"Points {type_id}", "type": "Integer"}}
+        if path == "/projects/13/versions":
+            return collection(self.versions)
+        return collection([{"id": 1, "name": path.rsplit("/", 1)[1]}])
+
+
+class TestInitConfig:
+    """Tests for init_config / refresh_config."""
+
+    def test_fetches_concurrently(self, config_path, monkeypatch):
+        """Sections and type schemas are fetched in parallel."""
+        client = FakeClient(delay=0.02, types=6)
+        monkeypatch.setattr(project_config, "get_shared_client", lambda: client)
+        config = project_config.init_config(13)
+
+        assert client.peak > 1
+        assert config["project"]["name"] == "Demo 13"
+        assert [t["id"] for t in config["types"]] == client.type_ids
+        assert list(config["custom_fields"]) == [str(t) for t in client.type_ids]
+        assert config["custom_fields"]["4"]["customField1"]["name"] == "Points 4"
+        assert config["members"][0]["user_id"] == 5
+        assert config["init_seconds"] >= 0
+        assert get_type_id("type 2") == 2
+
+    def test_sequential(self, config_path, monkeypatch):
+        """workers=1 keeps one request in flight."""
+        client = FakeClient()
+        monkeypatch.setattr(project_config, "get_shared_client", lambda: client)
+        project_config.init_config(13, workers=1)
+        assert client.peak == 1
+        assert len(client.calls) == 8 + len(client.type_ids)
+
+
+class TestRefreshConfig:
+    """Tests for incremental refresh_config."""
+
+    @pytest.fixture
+    def client(self, config_path, monkeypatch):
+        client = FakeClient(types=2)
+        monkeypatch.setattr(project_config, "get_shared_client", lambda: client)
+        project_config.init_config(13)
+        client.calls.clear()
+        return client
+
+    def test_nothing_changed(self, client):
+        """Every section is re-checked and answers 'not modified'."""
+        before = load_config()
+        config = project_config.refresh_config()
+        assert len(client.calls) == 8 + len(client.type_ids)
+        assert sorted(client.not_modified) == sorted(client.calls)
+        assert config["refreshed_sections"] == []
+        assert config["sections"]["versions"]["fetched_at"] == before["sections"]["versions"]["fetched_at"]
+        assert config["sections"]["versions"]["checked_at"] > before["sections"]["versions"]["checked_at"]
+        assert config["members"] == before["members"]
+
+    def test_max_age_skips_recent_sections(self, client):
+        """max_age=REFRESH_MAX_AGE only re-checks sections that are due."""
+        project_config.refresh_config(max_age=project_config.REFRESH_MAX_AGE)
+        assert sorted(client.calls) == ["/memberships", "/projects/13/versions"]
+
+    def test_new_type_seen_by_default(self, client):
+        """A type added after init is picked up without forcing the section."""
+        client.type_ids.append(3)
+        config = project_config.refresh_config()
+        assert config["refreshed_sections"] == ["types", "custom_fields"]
+        assert get_type_id("type 3") == 3
+
+    def test_changed_section_refetched(self, client):
+        """A changed section is replaced; the others keep their data."""
+        client.versions = [{"id": 1, "name": "Sprint 1"}, {"id": 2, "name": "Sprint 2"}]
+        config = project_config.refresh_config()
+        assert config["refreshed_sections"] == ["versions"]
+        assert [v["name"] for v in config["versions"]] == ["Sprint 1", "Sprint 2"]
+        assert get_config_index().versions["sprint 2"] == 2
+
+    def test_new_type_fetches_schemas(self, client):
+        """Forcing a types check picks up a new type and its schema only."""
+        client.type_ids.append(3)
+        config = project_config.refresh_config(sections=["types"])
+        assert config["refreshed_sections"] == ["types", "custom_fields"]
+        assert config["custom_fields"]["3"]["customField1"]["name"] == "Points 3"
+        assert sorted(client.not_modified)[-2:] == ["/work_packages/schemas/13-1", "/work_packages/schemas/13-2"]
+
+    def test_clamped_section_not_validated(self, client, monkeypatch):
+        """A section larger than one served page is re-read, not trusted on page 1."""
+        client.versions = [{"id": i, "name": f"Sprint {i}"} for i in range(1, 4)]
+        real_get = client.get
+
+        def clamped(path, params=None):
+            body = real_get(path, params)
+            if path.endswith("/versions"):
+                offset = (params or {}).get("offset", 1)
+                body = dict(body, _embedded={"elements": body["_embedded"]["elements"][(offset - 1) * 2:offset * 2]})
+            return body
+
+        monkeypatch.setattr(client, "get", clamped)
+        config = project_config.refresh_config()
+        assert [v["id"] for v in config["versions"]] == [1, 2, 3]
+        assert config["sections"]["versions"]["etag"] is None
+
+        client.versions[2]["name"] = "Sprint 3b"
+        config = project_config.refresh_config()
+        assert "/projects/13/versions" not in client.not_modified
+        assert config["refreshed_sections"] == ["versions"]
+        assert config["versions"][2]["name"] == "Sprint 3b"
+
+        config = project_config.refresh_config()
+        assert config["refreshed_sections"] == []
+
+    def test_failed_schema_keeps_fields(self, client, monkeypatch):
+        """A schema that fails to load keeps its cached custom fields."""
+        real_get = client.get_if_changed
+
+        def flaky(path, params=None, etag=None):
+            if path.endswith("-2"):
+                raise RuntimeError("schema unavailable")
+            return real_get(path, params, etag)
+
+        before = load_config()
+        monkeypatch.setattr(client, "get_if_changed", flaky)
+        config = project_config.refresh_config(sections=["custom_fields"])
+        assert config["custom_fields"]["2"]["customField1"]["name"] == "Points 2"
+        assert "custom_fields" not in config["refreshed_sections"]
+        assert config["sections"]["custom_fields"]["checked_at"] == before["sections"]["custom_fields"]["checked_at"]
+
+    def test_full_refresh(self, client):
+        """full=True re-fetches every section."""
+        project_config.refresh_config(full=True)
+        assert len(client.calls) == 8 + len(client.type_ids)
+        assert client.not_modified == []
+
+
+class TestConfigStore:
+    """Tests for the multi-project config store."""
+
+    @pytest.fixture
+    def client(self, config_path, monkeypatch):
+        client = FakeClient(types=1)
+        monkeypatch.setattr(project_config, "get_shared_client", lambda: client)
+        return client
+
+    def test_shared_sections_stored_once(self, client, config_path):
+        """A second project of the instance reuses the stored global sections."""
+        project_config.init_config(13)
+        client.calls.clear()
+        project_config.init_config(14)
+        assert "/statuses" not in client.calls
+        assert "/users/me" in client.calls
+        instance_dir = project_config.get_store_path() / "test.com"
+        assert sorted(p.name for p in instance_dir.glob("*.yml")) == ["global.yml", "project-13.yml", "project-14.yml"]
+        assert "statuses" not in project_config.read_config_file(instance_dir / "project-14.yml")
+        assert "instance" not in project_config.read_config_file(instance_dir / "global.yml")
+        assert load_config()["statuses"][0]["name"] == "statuses"
+        assert load_config()["instance"]["user_id"] == 5
+
+    def test_old_store_instance_not_shared(self, client, config_path):
+        """A global.yml that still holds "instance" is neither reused nor needed."""
+        project_config.init_config(13)
+        instance_dir = project_config.get_store_path() / "test.com"
+        project_file = instance_dir / "project-13.yml"
+        project = project_config.read_config_file(project_file)
+        shared = project_config.read_config_file(instance_dir / "global.yml")
+        shared["instance"] = project.pop("instance")
+        shared["sections"]["instance"] = project["sections"].pop("instance")
+        project_config._write_yaml(project_file, project)
+        project_config._write_yaml(instance_dir / "global.yml", shared)
+        project_config.clear_config_cache()
+
+        assert load_config(13)["instance"]["user_id"] == 5
+        client.calls.clear()
+        project_config.init_config(14)
+        assert "/users/me" in client.calls
+
+    def test_switch_active_project(self, client, config_path, monkeypatch):
+        """Switching projects needs no API calls and no re-parsing."""
+        project_config.init_config(13)
+        project_config.init_config(14)
+        assert project_config.get_active_project() == ("test.com", 14)
+        assert get_project_id() == 14
+
+        client.calls.clear()
+        reads = []
+        real_read = project_config.read_config_file
+        monkeypatch.setattr(project_config, "read_config_file", lambda p: reads.append(p) or real_read(p))
+        project_config.set_active_project(13)
+        assert get_project_id() == 13
+        project_config.set_active_project(14, persist=False)
+        assert get_project_id() == 14
+        assert load_config(13)["project"]["id"] == 13
+        assert client.calls == []
+        assert reads == []
+        assert (project_config.get_store_path() / "active").read_text().strip() == "test.com/13"
+
+    def test_switch_wins_over_env(self, client, config_path, monkeypatch):
+        """An explicit switch is not shadowed by OPENPROJECT_PROJECT_ID."""
+        project_config.init_config(13)
+        project_config.init_config(7)
+        monkeypatch.setenv("OPENPROJECT_URL", "https://test.com")
+        monkeypatch.setenv("OPENPROJECT_PROJECT_ID", "13")
+        clear_config_cache()
+        assert get_project_id() == 13
+
+        project_config.set_active_project(7)
+        assert project_config.get_active_project() == ("test.com", 7)
+        assert get_project_id() == 7
+        project_config.init_config(14)
+        assert get_project_id() == 14
+
+    def test_unknown_project(self, client, config_path):
+        """Switching to a project that was never initialized fails."""
+        project_config.init_config(13)
+        with pytest.raises(RuntimeError):
+            project_config.set_active_project(99)
+
+    def test_legacy_config_imported(self, config_path):
+        """An existing .openproject-config.yml becomes the active stored project."""
+        config_path.write_text(project_config.yaml.dump(make_config()), encoding="utf-8")
+        assert get_type_id("Task") == 1
+        assert project_config.get_active_project() == ("test.com", 13)
+        projects = project_config.list_stored_projects()
+        assert [(p["project_id"], p["name"], p["active"]) for p in projects] == [(13, "Demo", True)]
+        assert not config_path.exists()
+        assert config_path.with_name(".openproject-config.yml.bak").exists()
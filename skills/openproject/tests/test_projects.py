@@ -41,6 +41,16 @@ class TestListProjects:
         assert len(projects) == 1
         assert projects[0]["name"] == "Project 1"
 
+    def test_list_projects_with_fields(self, mock_client):
+        """fields= is sent as the select param."""
+        mock_client.get.return_value = {"_embedded": {"elements": [{"id": 1, "name": "P"}]}}
+
+        with patch("openproject_projects.projects.get_client", return_value=mock_client):
+            list(list_projects(fields=["name", "identifier"]))
+
+        params = mock_client.get.call_args[1]["params"]
+        assert params["select"] == "total,count,pageSize,offset,elements/id,elements/name,elements/identifier"
+
     def test_list_projects_with_filters(self, mock_client):
         """List projects with filters."""
         mock_client.get.return_value = {
@@ -1,7 +1,11 @@
 """Tests for OpenProject Work Packages operations."""
 
+import asyncio
+import json
+import threading
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from openproject_work_packages import (
     list_work_packages,
@@ -14,10 +18,28 @@ from openproject_work_packages import (
     list_relations,
     create_relation,
     delete_relation,
+    aget_work_packages,
+    aupdate_work_package,
+    bulk_upsert_work_packages,
+    get_lock_version_cache,
+    LockVersionCache,
+    WorkPackageStore,
+    sync_work_packages,
+    query_work_packages,
+    WorkPackageGraph,
+    load_work_package_graph,
 )
+from openproject_work_packages import lock_versions
+from openproject_core import OpenProjectAPIError
 from openproject_work_packages.relations import RELATION_TYPES
 
 
+@pytest.fixture(autouse=True)
+def fresh_lock_versions(monkeypatch):
+    """Each test starts without remembered lockVersions."""
+    monkeypatch.setattr(lock_versions, "_cache", LockVersionCache())
+
+
 @pytest.fixture
 def mock_client():
     """Create mock client."""
@@ -65,6 +87,20 @@ class TestListWorkPackages:
         call_args = mock_client.get.call_args
         assert "filters" in call_args[1]["params"]
 
+    def test_list_as_records(self, mock_client):
+        """as_records=True yields WorkPackageRecord objects."""
+        mock_client.get.return_value = {
+            "_embedded": {"elements": [
+                {"id": 1, "subject": "Task 1", "_links": {"status": {"href": "/api/v3/statuses/7"}}}
+            ]}
+        }
+
+        with patch("openproject_work_packages.work_packages.get_client", return_value=mock_client):
+            wps = list(list_work_packages(as_records=True))
+
+        assert wps[0].subject == "Task 1"
+        assert wps[0].status_id == 7
+
 
 class TestGetWorkPackage:
     """Tests for get_work_package function."""
@@ -243,3 +279,446 @@ class TestRelations:
             delete_relation(1)
 
         mock_client.delete.assert_called_with("/relations/1")
+
+
+@pytest.fixture
+def mock_async_client():
+    """Create mock async client."""
+    client = MagicMock()
+    client.__aenter__ = AsyncMock(return_value=client)
+    client.__aexit__ = AsyncMock(return_value=False)
+    client.get = AsyncMock()
+    client.patch = AsyncMock()
+    return client
+
+
+class TestAsyncWorkPackages:
+    """Tests for async work package twins."""
+
+    def test_aget_work_packages(self, mock_async_client):
+        """Fetch several work packages concurrently, in input order."""
+        mock_async_client.get.side_effect = lambda path: {"id": int(path.rsplit("/", 1)[1])}
+
+        with patch("openproject_work_packages.work_packages.get_async_client", return_value=mock_async_client):
+            wps = asyncio.run(aget_work_packages([3, 1, 2], concurrency=2))
+
+        assert [wp["id"] for wp in wps] == [3, 1, 2]
+
+    def test_get_schema_uses_reference_cache(self, mock_client, mock_async_client, tmp_path, monkeypatch):
+        """Schemas are fetched once per TTL when the reference cache is enabled."""
+        from openproject_core import ReferenceCache
+        from openproject_work_packages import aget_schema, get_schema
+
+        monkeypatch.setattr("openproject_core.reference_cache._cache", ReferenceCache(tmp_path / "ref.sqlite3"))
+        monkeypatch.setattr("openproject_core.reference_cache._env_checked", True)
+        mock_client.base_url = mock_async_client.base_url = "https://test.com"
+        mock_client.get.return_value = {"customField1": {"name": "Points"}}
+        with patch("openproject_work_packages.work_packages.get_client", return_value=mock_client), \
+                patch("openproject_work_packages.work_packages.get_async_client", return_value=mock_async_client):
+            assert get_schema(13, 2) == asyncio.run(aget_schema(13, 2)) == get_schema(13, 2)
+        mock_client.get.assert_called_once_with("/work_packages/schemas/13-2", params=None)
+        mock_async_client.get.assert_not_called()
+
+    def test_aupdate_fetches_lock_version(self, mock_async_client):
+        """Async update reads lockVersion and sends the same payload as sync."""
+        mock_async_client.get.return_value = {"id": 1, "lockVersion": 4}
+        mock_async_client.patch.return_value = {"id": 1}
+
+        with patch("openproject_work_packages.work_packages.get_async_client", return_value=mock_async_client):
+            asyncio.run(aupdate_work_package(1, subject="Updated"))
+
+        call_data = mock_async_client.patch.call_args[0][1]
+        assert call_data["lockVersion"] == 4
+        assert call_data["subject"] == "Updated"
+
+
+class FakeServer:
+    """Thread-safe work package store answering client calls."""
+
+    def __init__(self, wps):
+        self.wps = {wp["id"]: dict(wp) for wp in wps}
+        self.calls = []
+        self.conflicts = set()
+        self.lock = threading.Lock()
+        self.next_id = 100
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get(self, path, params=None):
+        with self.lock:
+            self.calls.append(("GET", path))
+            if params:
+                ids = [int(i) for i in json.loads(params["filters"])[0]["id"]["values"]]
+                elements = [dict(self.wps[i]) for i in ids if i in self.wps and params["offset"] == 1]
+                return {"total": len(elements), "_embedded": {"elements": elements}}
+            return dict(self.wps[int(path.rsplit("/", 1)[1])])
+
+    def patch(self, path, data, idempotent=False):
+        wp_id = int(path.rsplit("/", 1)[1])
+        with self.lock:
+            self.calls.append(("PATCH", path))
+            wp = self.wps[wp_id]
+            if wp_id in self.conflicts:
+                self.conflicts.discard(wp_id)
+                wp["lockVersion"] += 1
+            if data["lockVersion"] != wp["lockVersion"]:
+                raise OpenProjectAPIError(409, "Conflict")
+            wp.update({k: v for k, v in data.items() if k != "lockVersion"}, lockVersion=wp["lockVersion"] + 1)
+            return dict(wp)
+
+    def post(self, path, data):
+        with self.lock:
+            self.calls.append(("POST", path))
+            self.next_id += 1
+            self.wps[self.next_id] = dict(data, id=self.next_id, lockVersion=0)
+            return dict(self.wps[self.next_id])
+
+
+class TestBulkUpsert:
+    """Tests for bulk_upsert_work_packages."""
+
+    def run(self, server, items, **kwargs):
+        with patch("openproject_work_packages.bulk.get_client", return_value=server):
+            return sorted(bulk_upsert_work_packages(items, **kwargs), key=lambda r: r["index"])
+
+    def test_lock_versions_prefetched(self):
+        """Updates reuse one batched lockVersion read instead of a GET each."""
+        server = FakeServer([{"id": i, "lockVersion": i % 3} for i in range(1, 51)])
+        results = self.run(server, [{"id": i, "subject": f"S{i}"} for i in range(1, 51)], workers=4)
+
+        assert all(r["ok"] and r["attempts"] == 1 for r in results)
+        assert [c[0] for c in server.calls].count("GET") == 1
+        assert [c[0] for c in server.calls].count("PATCH") == 50
+        assert server.wps[7]["subject"] == "S7"
+
+    def test_creates_and_failures_reported(self):
+        """Creates use the default project; bad items fail alone."""
+        server = FakeServer([{"id": 1, "lockVersion": 0}])
+        results = self.run(server, [
+            {"subject": "New", "type_id": 1},
+            {"id": 999, "subject": "Gone"},
+            {"type_id": 1},
+            {"id": 1, "status_id": 7},
+        ], project_id=5)
+
+        assert [r["ok"] for r in results] == [True, False, False, True]
+        assert results[0]["action"] == "create" and results[0]["id"] == 101
+        assert server.wps[101]["_links"]["project"]["href"] == "/api/v3/projects/5"
+        assert results[1]["status_code"] == 404
+        assert "subject" in results[2]["error"]
+        assert ("PATCH", "/work_packages/999") not in server.calls
+
+    def test_conflict_reread_and_reapplied(self):
+        """A 409 re-reads lockVersion and applies the item again."""
+        server = FakeServer([{"id": 1, "lockVersion": 0}, {"id": 2, "lockVersion": 0}])
+        server.conflicts = {1, 2}
+        results = self.run(server, [{"id": 1, "subject": "A"}, {"id": 2, "subject": "B", "lockVersion": 0}])
+
+        assert results[0]["ok"] and results[0]["attempts"] == 2
+        assert server.wps[1]["subject"] == "A"
+        # Caller-supplied lockVersion: conflict is reported, not overwritten
+        assert not results[1]["ok"] and results[1]["status_code"] == 409
+
+    def test_uses_remembered_lock_versions(self):
+        """IDs already in the lockVersion cache are not prefetched."""
+        server = FakeServer([{"id": i, "lockVersion": 1} for i in range(1, 4)])
+        get_lock_version_cache().put(1, 1)
+        get_lock_version_cache().put(2, 0)
+        results = self.run(server, [{"id": 1, "subject": "A"}, {"id": 2, "subject": "B"}])
+
+        assert all(r["ok"] for r in results)
+        assert [r["attempts"] for r in results] == [1, 2]
+        assert ("GET", "/work_packages/2") in server.calls
+        assert get_lock_version_cache().get(2) == 2
+
+
+class TestLockVersionCache:
+    """Tests for update_work_package with remembered lockVersions."""
+
+    def run(self, server, func, *args, **kwargs):
+        with patch("openproject_work_packages.work_packages.get_client", return_value=server):
+            return func(*args, **kwargs)
+
+    def test_read_then_update_skips_fetch(self):
+        """A work package seen in a listing is updated with one PATCH."""
+        server = FakeServer([{"id": 1, "lockVersion": 3}])
+        server.get = lambda path, params=None: (
+            {"_embedded": {"elements": [dict(server.wps[1])]}} if params else dict(server.wps[1])
+        )
+        self.run(server, lambda: list(list_work_packages(project_id=5)))
+        self.run(server, update_work_package, 1, subject="New")
+        self.run(server, update_work_package, 1, subject="Newer")
+
+        assert server.calls == [("PATCH", "/work_packages/1"), ("PATCH", "/work_packages/1")]
+        assert server.wps[1]["subject"] == "Newer"
+        stats = get_lock_version_cache().stats.snapshot()
+        assert stats["hits"] == 2 and stats["misses"] == 0
+
+    def test_miss_fetches_first(self):
+        """Unknown work packages still get their lockVersion fetched."""
+        server = FakeServer([{"id": 1, "lockVersion": 3}])
+        self.run(server, update_work_package, 1, subject="New")
+
+        assert server.calls == [("GET", "/work_packages/1"), ("PATCH", "/work_packages/1")]
+        assert get_lock_version_cache().stats.snapshot()["misses"] == 1
+
+    def test_stale_entry_rereads_once(self):
+        """A 409 from a remembered lockVersion re-reads and retries once."""
+        server = FakeServer([{"id": 1, "lockVersion": 5}])
+        get_lock_version_cache().put(1, 2)
+        self.run(server, update_work_package, 1, subject="New")
+
+        assert [c[0] for c in server.calls] == ["PATCH", "GET", "PATCH"]
+        assert get_lock_version_cache().stats.snapshot()["refreshed"] == 1
+
+    def test_explicit_lock_version_conflict_raised(self):
+        """A caller-supplied lockVersion is not retried."""
+        server = FakeServer([{"id": 1, "lockVersion": 5}])
+        with pytest.raises(OpenProjectAPIError):
+            self.run(server, update_work_package, 1, subject="New", lockVersion=2)
+
+    def test_cached_lock_disabled(self):
+        """cached_lock=False always fetches first."""
+        server = FakeServer([{"id": 1, "lockVersion": 3}])
+        get_lock_version_cache().put(1, 3)
+        self.run(server, update_work_package, 1, cached_lock=False, subject="New")
+
+        assert [c[0] for c in server.calls] == ["GET", "PATCH"]
+
+
+class CollectionServer:
+    """Work package collection honoring the filters used by sync_work_packages."""
+
+    base_url = "https://op.test"
+
+    def __init__(self, count):
+        self.wps = {i: {"id": i, "lockVersion": 0, "updatedAt": f"2026-01-01T00:00:{i:02d}Z"} for i in range(1, count + 1)}
+        self.clock = count
+        self.calls = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def get_max_page_size(self):
+        return 1000
+
+    def touch(self, wp_id):
+        self.clock += 1
+        wp = self.wps.setdefault(wp_id, {"id": wp_id, "lockVersion": -1})
+        wp.update(lockVersion=wp["lockVersion"] + 1, updatedAt=f"2026-01-01T00:00:{self.clock:02d}Z")
+
+    def get(self, path, params=None, retry_timeouts=True):
+        params = params or {}
+        self.calls.append((path, dict(params)))
+        filters = {name: f for entry in json.loads(params.get("filters", "[]")) for name, f in entry.items()}
+        items = sorted(self.wps.values(), key=lambda wp: (wp["updatedAt"], wp["id"]))
+        if "id" in filters:
+            items = [wp for wp in items if str(wp["id"]) in filters["id"]["values"]]
+        if "updatedAt" in filters:
+            items = [wp for wp in items if wp["updatedAt"] >= filters["updatedAt"]["values"][0]]
+        size, offset = params.get("pageSize", 20), params.get("offset", 1)
+        page = [dict(wp) for wp in items[(offset - 1) * size:offset * size]]
+        if params.get("select") == "total,count,pageSize,offset,elements/id":
+            page = [{"id": wp["id"]} for wp in page]
+        return {"total": len(items), "_embedded": {"elements": page}}
+
+
+class TestSync:
+    """Tests for incremental sync_work_packages."""
+
+    def sync(self, server, store, **kwargs):
+        server.calls.clear()
+        with patch("openproject_work_packages.sync.get_client", return_value=server):
+            return sync_work_packages(5, store=store, page_size=10, **kwargs)
+
+    def test_first_sync_downloads_all(self):
+        """The first sync pages through everything, including closed work packages."""
+        server, store = CollectionServer(25), WorkPackageStore(":memory:")
+        result = self.sync(server, store)
+
+        assert result["full"] and result["total"] == 25 and len(result["changed"]) == 25
+        assert result["watermark"] == "2026-01-01T00:00:25Z"
+        assert '"operator": "*"' in server.calls[0][1]["filters"].replace('":"', '": "')
+
+    def test_steady_state_is_one_page(self):
+        """Without changes a refresh is one small page and reports nothing."""
+        server, store = CollectionServer(25), WorkPackageStore(":memory:")
+        self.sync(server, store)
+        result = self.sync(server, store)
+
+        assert len(server.calls) == 1
+        assert result["changed"] == [] and result["deleted"] == [] and not result["full"]
+
+    def test_delta_merged(self):
+        """Updated and new work packages are returned and stored."""
+        server, store = CollectionServer(25), WorkPackageStore(":memory:")
+        self.sync(server, store)
+        server.touch(3)
+        server.touch(40)
+        result = self.sync(server, store)
+
+        assert sorted(wp["id"] for wp in result["changed"]) == [3, 40]
+        assert store.get("https://op.test", 5, 3)["lockVersion"] == 1
+        assert result["total"] == 26
+
+    def test_keyset_paging_survives_shared_timestamps(self):
+        """A full page with one timestamp advances by offset instead of looping."""
+        server, store = CollectionServer(25), WorkPackageStore(":memory:")
+        for wp in server.wps.values():
+            wp["updatedAt"] = "2026-01-01T00:00:00Z"
+        result = self.sync(server, store)
+
+        # Page 1 again under the new lower bound, then offsets 2 and 3
+        assert result["total"] == 25 and len(server.calls) == 4
+
+    def test_id_scan_detects_deletions(self):
+        """A due id scan removes deleted work packages."""
+        server, store = CollectionServer(25), WorkPackageStore(":memory:")
+        self.sync(server, store)
+        del server.wps[7]
+        assert self.sync(server, store)["deleted"] == []
+
+        result = self.sync(server, store, id_scan=True)
+        assert result["deleted"] == [7] and result["total"] == 24
+        assert server.calls[-1][1]["select"] == "total,count,pageSize,offset,elements/id"
+
+
+class TestMirrorQuery:
+    """Tests for query_work_packages over the local mirror."""
+
+    @pytest.fixture
+    def server(self, monkeypatch):
+        server = CollectionServer(0)
+        for wp_id, status, type_id, assignee in [(1, 1, 1, 5), (2, 7, 2, 5), (3, 12, 2, 5), (4, 1, 2, 9)]:
+            server.touch(wp_id)
+            server.wps[wp_id]["_links"] = {
+                "status": {"href": f"/api/v3/statuses/{status}"},
+                "type": {"href": f"/api/v3/types/{type_id}"},
+                "assignee": {"href": f"/api/v3/users/{assignee}"},
+                "version": {"href": None},
+            }
+        monkeypatch.setattr("openproject_work_packages.mirror.load_config", lambda: {
+            "instance": {"url": "https://op.test/"},
+            "statuses": [{"id": 1}, {"id": 7}, {"id": 12, "is_closed": True}],
+        })
+        for module in ("sync", "mirror", "work_packages"):
+            monkeypatch.setattr(f"openproject_work_packages.{module}.get_client", lambda: server)
+        return server
+
+    def test_local_query(self, server):
+        """Open bugs of one assignee are answered from the mirror."""
+        store = WorkPackageStore(":memory:")
+        found = query_work_packages(5, type_id=2, assignee_id=[5], open_only=True, store=store)
+        assert [wp["id"] for wp in found] == [2]
+
+        server.calls.clear()
+        assert [wp["id"] for wp in query_work_packages(5, status_id=1, store=store)] == [1, 4]
+        assert query_work_packages(5, version_id=3, store=store) == []
+        assert server.calls == []
+
+    def test_stale_mirror_synced(self, server):
+        """An outdated mirror is refreshed incrementally before answering."""
+        store = WorkPackageStore(":memory:")
+        query_work_packages(5, store=store)
+        server.touch(5)
+        assert [wp["id"] for wp in query_work_packages(5, store=store)] == [1, 2, 3, 4]
+        assert [wp["id"] for wp in query_work_packages(5, store=store, max_age=0)] == [1, 2, 3, 4, 5]
+
+    def test_server_flag(self, server):
+        """server=True sends the filters to the API."""
+        query_work_packages(5, type_id=2, open_only=True, server=True)
+        filters = json.loads(server.calls[-1][1]["filters"])
+        assert {"status": {"operator": "=", "values": ["1", "7"]}} in filters
+        assert {"type": {"operator": "=", "values": ["2"]}} in filters
+
+
+def make_relation(rel_id, source, target, kind, lag=0):
+    return {
+        "id": rel_id, "type": kind, "lag": lag,
+        "_links": {"from": {"href": f"/api/v3/work_packages/{source}"}, "to": {"href": f"/api/v3/work_packages/{target}"}},
+    }
+
+
+class GraphServer(CollectionServer):
+    """Project listing plus /relations filtered by involved IDs."""
+
+    max_page_size = None
+    last_response_size = 0
+
+    def __init__(self, parents, relations):
+        super().__init__(0)
+        for wp_id, parent in parents.items():
+            self.touch(wp_id)
+            if parent:
+                self.wps[wp_id]["_links"] = {"parent": {"href": f"/api/v3/work_packages/{parent}"}}
+        self.relations = relations
+
+    def get(self, path, params=None, retry_timeouts=True):
+        if path != "/relations":
+            return super().get(path, params, retry_timeouts)
+        self.calls.append((path, dict(params)))
+        ids = {int(v) for v in json.loads(params["filters"])[0]["involved"]["values"]}
+        found = [r for r in self.relations if {extract(r, "from"), extract(r, "to")} & ids]
+        size, offset = params["pageSize"], params["offset"]
+        return {"total": len(found), "_embedded": {"elements": found[(offset - 1) * size:offset * size]}}
+
+
+def extract(relation, end):
+    return int(relation["_links"][end]["href"].rsplit("/", 1)[1])
+
+
+class TestWorkPackageGraph:
+    """Tests for the batched graph loader and traversals."""
+
+    def test_load_batches_relations(self, monkeypatch):
+        """Relations come from a few involved-ID queries, deduplicated."""
+        server = GraphServer(
+            {1: None, 2: 1, 3: 1, 4: 2, 5: None},
+            [make_relation(10, 1, 5, "blocks"), make_relation(11, 4, 2, "follows"), make_relation(12, 5, 99, "relates")],
+        )
+        monkeypatch.setattr("openproject_work_packages.graph.get_client", lambda: server)
+        graph = load_work_package_graph(5, chunk_size=2, workers=2)
+
+        assert len(graph.relations) == 3
+        assert len([c for c in server.calls if c[0] == "/relations"]) == 3
+        assert graph.descendants(1) == [2, 3, 4]
+        assert graph.ancestors(4) == [2, 1]
+        assert graph.blocks(1) == {5} and graph.blocked_by(5) == {1}
+        assert graph.follows(4) == {2} and graph.precedes(2) == {4}
+        assert graph.edges["relates"][5] == {99}
+
+    def test_critical_path(self):
+        """Longest precedes chain counts durations and lags."""
+        wps = [
+            {"id": 1, "duration": "P2D"},
+            {"id": 2, "startDate": "2026-01-01", "dueDate": "2026-01-05"},
+            {"id": 3, "duration": "P1D"},
+            {"id": 4, "duration": "P1D"},
+        ]
+        graph = WorkPackageGraph(wps, [
+            make_relation(1, 1, 2, "precedes"),
+            make_relation(2, 1, 3, "precedes", lag=1),
+            make_relation(3, 2, 4, "follows"),
+            make_relation(4, 3, 4, "precedes"),
+        ])
+        assert graph.critical_path() == {"path": [1, 3, 4, 2], "days": 10}
+
+    def test_cycles(self):
+        """Cycles are reported per edge kind; critical path refuses them."""
+        graph = WorkPackageGraph([], [
+            make_relation(1, 1, 2, "precedes"),
+            make_relation(2, 3, 2, "follows"),
+            make_relation(3, 3, 1, "precedes"),
+            make_relation(4, 7, 8, "blocks"),
+        ])
+        assert graph.find_cycles("precedes") == [[1, 2, 3]]
+        assert graph.find_cycles("blocks") == []
+        with pytest.raises(ValueError, match="cycles"):
+            graph.critical_path()